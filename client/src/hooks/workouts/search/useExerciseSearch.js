@@ -2,7 +2,7 @@ import { useQuery } from "@tanstack/react-query";
 import { useNavigate } from "react-router-dom";
 import { selectedExercisesAtom } from "@/pages/workouts/create/template-atoms";
 import { useAtom } from "jotai";
-import apiNinjas from "@/apiNinjas";
+import api from "@/api";
 
 export function useExerciseSearch(searchTerm) {
     const navigate = useNavigate();
@@ -11,17 +11,20 @@ export function useExerciseSearch(searchTerm) {
     const fetchExercises = useQuery({
         queryKey: ["search_exercises", searchTerm],
         queryFn: async () => {
-            // Get exercises from API Ninjas
-            if (searchTerm && searchTerm.trim()) {
-                const response = await apiNinjas.get(`exercises?name=${searchTerm.trim()}`);
-                return response.data;
-            } else {
-                const response = await apiNinjas.get(`exercises?difficulty=beginner`);
-                return response.data;
-            }
+            // Served from the backend exercise catalog, which proxies API Ninjas
+            const params = searchTerm && searchTerm.trim()
+                ? { q: searchTerm.trim() }
+                : { difficulty: "beginner" };
+            const response = await api.get("workouts/exercises/search/", { params });
+            return {
+                results: response.data,
+                // New terms may still be loading from API Ninjas on the server
+                pending: response.headers["x-catalog-pending"] === "true",
+            };
         },
-        staleTime: 5 * 60 * 1000, // 5 minutes instead of Infinity for search results
+        staleTime: (query) => (query.state.data?.pending ? 0 : 5 * 60 * 1000), // 5 minutes instead of Infinity for search results
         cacheTime: 10 * 60 * 1000, // 10 minutes
+        refetchInterval: (query) => (query.state.data?.pending ? 3000 : false),
         refetchOnWindowFocus: false,
     });
 
@@ -88,7 +91,8 @@ export function useExerciseSearch(searchTerm) {
     return {
         // Data
         fetchExercises,
-        exercises: fetchExercises.data || [],
+        exercises: fetchExercises.data?.results || [],
+        isPending: fetchExercises.data?.pending || false,
         isLoading: fetchExercises.isLoading,
         isError: fetchExercises.isError,
 
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-19 11:01
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_account_birth_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResourceVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('profile', 'Account and profile'), ('nutrition', 'Nutrition profile and daily entries'), ('diet_plans', 'Diet plans'), ('workouts', 'Workout templates'), ('progress_reports', 'Progress reports')], max_length=20)),
+                ('version', models.UUIDField(default=uuid.uuid4)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resource_versions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Resource Version',
+                'verbose_name_plural': 'Resource Versions',
+                'constraints': [models.UniqueConstraint(fields=('account', 'scope'), name='unique_resource_version_scope')],
+            },
+        ),
+    ]
@@ -3,6 +3,10 @@ from .profile import Profile
 from .weight_history import WeightHistory
 from .progress_photo import ProgressPhoto
 from .email_verification import EmailVerification
+from .resource_version import ResourceVersion
+
+# Import signals to ensure they're registered
+from . import signals
 
 __all__ = [
     "Account",
@@ -11,4 +15,5 @@ __all__ = [
     "WeightHistory",
     "ProgressPhoto",
     "EmailVerification",
+    "ResourceVersion",
 ]
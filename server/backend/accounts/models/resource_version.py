@@ -0,0 +1,96 @@
+import uuid
+from django.db import models
+from django.utils import timezone
+from .account import Account
+
+
+class ResourceVersion(models.Model):
+    """
+    Version of one group ("scope") of a user's API resources.
+
+    Every write to a model in a scope replaces the version: post_save and
+    post_delete receivers cover ordinary saves, and bulk writes (which skip
+    signals) call bump() themselves. Read endpoints build their ETag from
+    the versions of the scopes they render, so an unchanged version means
+    an unchanged response.
+    """
+
+    SCOPE_CHOICES = [
+        ("profile", "Account and profile"),
+        ("nutrition", "Nutrition profile and daily entries"),
+        ("diet_plans", "Diet plans"),
+        ("workouts", "Workout templates"),
+        ("progress_reports", "Progress reports"),
+    ]
+
+    account = models.ForeignKey(
+        Account, on_delete=models.CASCADE, related_name="resource_versions"
+    )
+    scope = models.CharField(max_length=20, choices=SCOPE_CHOICES)
+    version = models.UUIDField(default=uuid.uuid4)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Resource Version"
+        verbose_name_plural = "Resource Versions"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "scope"], name="unique_resource_version_scope"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.account_id} - {self.scope} @ {self.version}"
+
+    @classmethod
+    def bump(cls, account_ids, *scopes):
+        """
+        Give the scopes of the given accounts a new version.
+
+        One upsert for all accounts and scopes. Call it in the same
+        transaction as the write so readers never see new data with the old
+        version.
+
+        Args:
+            account_ids: Iterable of account IDs (None values are ignored)
+            *scopes: Scope names from SCOPE_CHOICES
+        """
+        account_ids = {account_id for account_id in account_ids if account_id}
+        if not account_ids or not scopes:
+            return
+
+        now = timezone.now()
+        cls.objects.bulk_create(
+            [
+                cls(
+                    account_id=account_id,
+                    scope=scope,
+                    version=uuid.uuid4(),
+                    updated_at=now,
+                )
+                for account_id in account_ids
+                for scope in scopes
+            ],
+            update_conflicts=True,
+            unique_fields=["account", "scope"],
+            update_fields=["version", "updated_at"],
+        )
+
+    @classmethod
+    def get_versions(cls, account_id, scopes):
+        """
+        Get the current versions of some scopes in one indexed lookup.
+
+        Args:
+            account_id: Account ID
+            scopes: Scope names
+
+        Returns:
+            dict: scope -> version string ("0" for scopes never written)
+        """
+        versions = dict(
+            cls.objects.filter(account_id=account_id, scope__in=scopes).values_list(
+                "scope", "version"
+            )
+        )
+        return {scope: str(versions.get(scope, 0)) for scope in scopes}
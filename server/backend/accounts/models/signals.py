@@ -0,0 +1,54 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from ..signals import current_weight_changed
+from .account import Account
+from .profile import Profile
+from .weight_history import WeightHistory
+from .resource_version import ResourceVersion
+
+
+def deleted_with_account(origin):
+    """
+    Whether a post_delete was cascaded from deleting an account.
+
+    Nothing is left to version then, so receivers skip the write for every
+    deleted row.
+    """
+    model = getattr(origin, "model", type(origin))
+    return model is Account
+
+
+@receiver(post_delete, sender=Account)
+def delete_leftover_resource_versions(sender, instance, **kwargs):
+    """
+    Remove versions bumped while the account's rows were being deleted.
+
+    Some cascaded deletes save other rows (e.g. a food entry's daily totals),
+    whose receivers bump again after the versions were already cascaded. The
+    foreign key is only checked at commit, so removing them here is enough.
+    """
+    ResourceVersion.objects.filter(account_id=instance.pk).delete()
+
+
+@receiver(post_save, sender=Account)
+def bump_account_version(sender, instance, **kwargs):
+    """Account fields (including last_login) are part of the profile data"""
+    ResourceVersion.bump([instance.pk], "profile")
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=WeightHistory)
+@receiver(post_delete, sender=WeightHistory)
+def bump_profile_version(sender, instance, origin=None, **kwargs):
+    """Profile and weigh-in changes change the profile data"""
+    if deleted_with_account(origin):
+        return
+    ResourceVersion.bump([instance.account_id], "profile")
+
+
+@receiver(current_weight_changed)
+def bump_profile_version_for_weight(sender, account_id, **kwargs):
+    """Weigh-ins update Profile.current_weight without saving the profile"""
+    ResourceVersion.bump([account_id], "profile")
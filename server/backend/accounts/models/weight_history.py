@@ -1,5 +1,8 @@
 from .account import Account
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, Subquery, Window
+from django.db.models.functions import Lag
+from django.utils import timezone
 from django.core.validators import (
     MinValueValidator,
     MaxValueValidator,
@@ -7,6 +10,8 @@ from django.core.validators import (
 from django.core.exceptions import ValidationError
 from datetime import date
 from decimal import Decimal
+from ..signals import current_weight_changed
+from .resource_version import ResourceVersion
 
 
 class WeightHistory(models.Model):
@@ -46,6 +51,29 @@ class WeightHistory(models.Model):
     def __str__(self):
         return f"{self.account.email} - {self.weight}kg on {self.recorded_date}"
 
+    @staticmethod
+    def annotate_previous_weight(queryset):
+        """
+        Annotate each entry with the account's previous weigh-in.
+
+        The window runs before any slicing, so a page of recent entries still
+        sees the entry just before it.
+
+        Args:
+            queryset: WeightHistory queryset
+
+        Returns:
+            QuerySet: Entries with a `previous_weight` attribute (None for the
+            first weigh-in)
+        """
+        return queryset.annotate(
+            previous_weight=Window(
+                expression=Lag("weight"),
+                partition_by=[F("account_id")],
+                order_by=F("recorded_date").asc(),
+            )
+        )
+
     def clean(self):
         """Custom validation for WeightHistory model."""
         if self.recorded_date > date.today():
@@ -54,21 +82,93 @@ class WeightHistory(models.Model):
     def save(self, *args, **kwargs):
         """Override save to update current_weight in profile."""
         super().save(*args, **kwargs)
-        # Update current weight in profile if this is the most recent entry
-        latest_weight = (
-            WeightHistory.objects.filter(account=self.account)
+
+        # Conditional update: only when no later weigh-in exists and the
+        # weight actually differs, so older or unchanged entries cost nothing
+        from .profile import Profile
+
+        later_entries = WeightHistory.objects.filter(
+            account_id=OuterRef("account_id"), recorded_date__gt=self.recorded_date
+        )
+        updated = (
+            Profile.objects.filter(account_id=self.account_id)
+            .exclude(current_weight=self.weight)
+            .exclude(Exists(later_entries))
+            .update(current_weight=self.weight, updated_at=timezone.now())
+        )
+        if updated:
+            current_weight_changed.send(sender=WeightHistory, account_id=self.account_id)
+
+    @classmethod
+    def refresh_current_weight(cls, account_id):
+        """
+        Set Profile.current_weight from the latest weigh-in in one UPDATE.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            bool: True if the current weight changed
+        """
+        from .profile import Profile
+
+        latest_weight = Subquery(
+            cls.objects.filter(account_id=OuterRef("account_id"))
             .order_by("-recorded_date", "-created_at")
-            .first()
+            .values("weight")[:1]
         )
+        updated = (
+            Profile.objects.filter(account_id=account_id)
+            .filter(Exists(cls.objects.filter(account_id=OuterRef("account_id"))))
+            .exclude(current_weight=latest_weight)
+            .update(current_weight=latest_weight, updated_at=timezone.now())
+        )
+        if updated:
+            current_weight_changed.send(sender=cls, account_id=account_id)
+        return bool(updated)
+
+    @classmethod
+    def bulk_import(cls, account, entries):
+        """
+        Insert or overwrite many weigh-ins at once.
+
+        Rows are upserted on (account, recorded_date) and the profile's
+        current weight is refreshed once at the end, instead of once per row.
+
+        Args:
+            account: Account the weigh-ins belong to
+            entries: Iterable of dicts with `weight` and `recorded_date`;
+                a later row for the same date wins
+
+        Returns:
+            dict: created, updated and current_weight_changed
+        """
+        by_date = {entry["recorded_date"]: entry["weight"] for entry in entries}
+        if not by_date:
+            return {"created": 0, "updated": 0, "current_weight_changed": False}
+
+        with transaction.atomic():
+            existing = set(
+                cls.objects.filter(
+                    account=account, recorded_date__in=by_date
+                ).values_list("recorded_date", flat=True)
+            )
+            cls.objects.bulk_create(
+                [
+                    cls(account=account, weight=weight, recorded_date=recorded_date)
+                    for recorded_date, weight in by_date.items()
+                ],
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["account", "recorded_date"],
+                update_fields=["weight"],
+            )
+            changed = cls.refresh_current_weight(account.id)
+            # bulk_create skips the post_save receivers
+            ResourceVersion.bump([account.id], "profile")
 
-        if latest_weight == self:
-            # Use string reference to avoid circular import
-            from .profile import Profile
-
-            try:
-                profile = self.account.profile
-                if profile:
-                    profile.current_weight = self.weight
-                    profile.save(update_fields=["current_weight", "updated_at"])
-            except Profile.DoesNotExist:
-                pass
+        return {
+            "created": len(by_date) - len(existing),
+            "updated": len(existing),
+            "current_weight_changed": changed,
+        }
@@ -11,6 +11,7 @@ from .profile import (
 from .weight_history import (
     WeightHistorySerializer,
     WeightHistoryCreateSerializer,
+    WeightHistoryImportSerializer,
 )
 
 from .progress_photo import (
@@ -37,6 +38,7 @@ __all__ = [
     # Weight History serializers
     "WeightHistorySerializer",
     "WeightHistoryCreateSerializer",
+    "WeightHistoryImportSerializer",
     # Progress Photo serializers
     "ProgressPhotoSerializer",
     "ProgressPhotoUpdateSerializer",
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from ..models import Account, Profile
+from ..models import Account, Profile, WeightHistory
 from .profile import ProfileSerializer
 from datetime import date
 from decimal import Decimal
@@ -54,7 +54,9 @@ class AccountSerializer(serializers.ModelSerializer):
         """Get recent weight history entries."""
         from .weight_history import WeightHistorySerializer
 
-        recent_entries = obj.weight_history.all()[:5]  # Get last 5 entries
+        recent_entries = WeightHistory.annotate_previous_weight(
+            obj.weight_history.all()
+        )[:5]  # Get last 5 entries
         return WeightHistorySerializer(recent_entries, many=True).data
 
     def create(self, validated_data):
@@ -178,7 +180,7 @@ class AccountDetailSerializer(serializers.ModelSerializer):
         """Get all weight history entries."""
         from .weight_history import WeightHistorySerializer
 
-        all_entries = obj.weight_history.all()
+        all_entries = WeightHistory.annotate_previous_weight(obj.weight_history.all())
         return WeightHistorySerializer(all_entries, many=True).data
 
 
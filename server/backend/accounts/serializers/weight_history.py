@@ -1,6 +1,10 @@
 from rest_framework import serializers
+from django.core.validators import MinValueValidator, MaxValueValidator
 from ..models import WeightHistory
 from datetime import date
+from decimal import Decimal
+import csv
+import io
 
 
 class WeightHistorySerializer(serializers.ModelSerializer):
@@ -16,16 +20,22 @@ class WeightHistorySerializer(serializers.ModelSerializer):
 
     def get_weight_change(self, obj):
         """Calculate weight change from previous entry."""
-        previous = (
-            WeightHistory.objects.filter(
-                account=obj.account, recorded_date__lt=obj.recorded_date
+        # Querysets passed through WeightHistory.annotate_previous_weight()
+        # carry the previous weight already; single instances look it up
+        if hasattr(obj, "previous_weight"):
+            previous_weight = obj.previous_weight
+        else:
+            previous_weight = (
+                WeightHistory.objects.filter(
+                    account_id=obj.account_id, recorded_date__lt=obj.recorded_date
+                )
+                .order_by("-recorded_date")
+                .values_list("weight", flat=True)
+                .first()
             )
-            .order_by("-recorded_date")
-            .first()
-        )
 
-        if previous:
-            return float(obj.weight - previous.weight)
+        if previous_weight is not None:
+            return float(obj.weight - previous_weight)
         return None
 
     def validate_recorded_date(self, value):
@@ -66,3 +76,80 @@ class WeightHistoryCreateSerializer(serializers.ModelSerializer):
                 )
 
         return data
+
+
+class WeightEntryImportSerializer(serializers.Serializer):
+    """A single row of a weight import."""
+
+    weight = serializers.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        validators=[
+            MinValueValidator(Decimal("20.00")),
+            MaxValueValidator(Decimal("500.00")),
+        ],
+    )
+    recorded_date = serializers.DateField()
+
+    def validate_recorded_date(self, value):
+        """Ensure recorded date is not in the future."""
+        if value > date.today():
+            raise serializers.ValidationError(
+                "Weight recording date cannot be in the future."
+            )
+        return value
+
+
+class WeightHistoryImportSerializer(serializers.Serializer):
+    """
+    Bulk weight import from JSON rows or a CSV file (e.g. a scale export).
+
+    CSV files need a header with a `weight` (or `weight_kg`) column and a
+    `recorded_date` (or `date`) column in YYYY-MM-DD format.
+    """
+
+    MAX_ROWS = 5000
+
+    entries = WeightEntryImportSerializer(many=True, required=False)
+    file = serializers.FileField(required=False)
+
+    def validate_file(self, value):
+        """Parse the CSV file into rows for the entry serializer."""
+        try:
+            text = value.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise serializers.ValidationError("CSV file must be UTF-8 encoded.")
+
+        reader = csv.DictReader(io.StringIO(text))
+        columns = {name.strip().lower(): name for name in reader.fieldnames or []}
+        weight_column = columns.get("weight") or columns.get("weight_kg")
+        date_column = columns.get("recorded_date") or columns.get("date")
+        if not weight_column or not date_column:
+            raise serializers.ValidationError(
+                "CSV file needs 'weight' and 'recorded_date' columns."
+            )
+
+        rows = [
+            {"weight": row[weight_column], "recorded_date": row[date_column]}
+            for row in reader
+            if any(row.values())
+        ]
+        entries = WeightEntryImportSerializer(data=rows, many=True)
+        entries.is_valid(raise_exception=True)
+        return entries.validated_data
+
+    def validate(self, data):
+        """Require exactly one source and cap the number of rows."""
+        if ("entries" in data) == ("file" in data):
+            raise serializers.ValidationError(
+                "Provide either 'entries' or a CSV 'file'."
+            )
+
+        rows = data.get("entries", data.get("file"))
+        if not rows:
+            raise serializers.ValidationError("No weight entries to import.")
+        if len(rows) > self.MAX_ROWS:
+            raise serializers.ValidationError(
+                f"At most {self.MAX_ROWS} weight entries can be imported at once."
+            )
+        return {"entries": rows}
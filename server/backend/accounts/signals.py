@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent once after Profile.current_weight is written with a queryset update
+# (weigh-ins never call Profile.save()). Receivers get `account_id`.
+current_weight_changed = Signal()
@@ -2,6 +2,7 @@ from ..models import Account
 from rest_framework import generics, viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from backend.conditional import resource_etag
 from ..serializers import (
     AccountSerializer,
     AccountDetailSerializer,
@@ -17,11 +18,13 @@ class AccountProfileViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         return Account.objects.filter(id=self.request.user.id).select_related("profile")
 
+    @resource_etag("profile")
     def list(self, request):
         """Return current user's complete profile - GET /accounts/profile/"""
         serializer = AccountDetailSerializer(request.user)
         return Response({"success": True, "data": serializer.data})
 
+    @resource_etag("profile")
     def retrieve(self, request, pk=None):
         """Return current user's profile by ID - GET /accounts/profile/{id}/"""
         if int(pk) != request.user.id:
@@ -2,6 +2,7 @@ from ..models import Profile
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from backend.conditional import resource_etag
 from ..serializers import (
     ProfileSerializer,
     ProfileCreateUpdateSerializer,
@@ -21,6 +22,16 @@ class ProfileViewSet(viewsets.ModelViewSet):
             return ProfileCreateUpdateSerializer
         return ProfileSerializer
 
+    @resource_etag("profile")
+    def list(self, request, *args, **kwargs):
+        """List the user's profile (304 when unchanged)"""
+        return super().list(request, *args, **kwargs)
+
+    @resource_etag("profile")
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve the user's profile (304 when unchanged)"""
+        return super().retrieve(request, *args, **kwargs)
+
     def create(self, request):
         """Create profile for authenticated user - POST /accounts/profiles/"""
         # Check if profile already exists
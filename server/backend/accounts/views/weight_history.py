@@ -3,9 +3,11 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from ..serializers import (
     WeightHistorySerializer,
     WeightHistoryCreateSerializer,
+    WeightHistoryImportSerializer,
 )
 
 
@@ -48,7 +50,7 @@ class WeightHistoryViewSet(viewsets.ModelViewSet):
 
     def list(self, request):
         """Get all weight history for user - GET /accounts/weight-history/"""
-        queryset = self.get_queryset()
+        queryset = WeightHistory.annotate_previous_weight(self.get_queryset())
         serializer = WeightHistorySerializer(queryset, many=True)
         return Response(
             {"success": True, "count": len(serializer.data), "data": serializer.data}
@@ -57,12 +59,47 @@ class WeightHistoryViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def recent(self, request):
         """Get recent weight entries - GET /accounts/weight-history/recent/"""
-        recent_entries = self.get_queryset()[:10]  # Last 10 entries
+        recent_entries = WeightHistory.annotate_previous_weight(
+            self.get_queryset()
+        )[:10]  # Last 10 entries
         serializer = WeightHistorySerializer(recent_entries, many=True)
         return Response(
             {"success": True, "count": len(serializer.data), "data": serializer.data}
         )
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[JSONParser, MultiPartParser, FormParser],
+    )
+    def import_entries(self, request):
+        """
+        Bulk import weight entries - POST /accounts/weight-history/import/
+
+        Accepts {"entries": [{"weight": ..., "recorded_date": ...}]} as JSON
+        or a multipart CSV upload in `file`. Existing entries for the same
+        dates are overwritten.
+        """
+        serializer = WeightHistoryImportSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"success": False, "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = WeightHistory.bulk_import(
+            request.user, serializer.validated_data["entries"]
+        )
+        return Response(
+            {
+                "success": True,
+                "message": "Weight entries imported successfully",
+                "data": result,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(detail=False, methods=["get"])
     def stats(self, request):
         """Get weight statistics - GET /accounts/weight-history/stats/"""
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AssistantConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'assistant'
+
+    def ready(self):
+        # Register Celery task telemetry signal handlers
+        from . import telemetry  # noqa: F401
@@ -1,14 +1,15 @@
-import os
-from dotenv import load_dotenv
-from openai import OpenAI
+try:
+    from .services.llm_provider import get_llm_provider
+except ImportError:
+    # Running as a standalone script from the assistant directory
+    from services.llm_provider import get_llm_provider
 
 
 def create_chat_session():
     """Create an interactive chat session with the fitness coach"""
 
-    # Load environment variables
-    load_dotenv()
-    client = OpenAI(api_key=os.getenv("ASSISTANT_API_KEY"))
+    # Provider loads environment variables and picks the backend
+    provider = get_llm_provider()
 
     # Load system prompt
     with open("instructions.txt", "r") as f:
@@ -47,21 +48,11 @@ def create_chat_session():
 
             print("\nAssistant: ", end="", flush=True)
 
-            # Get response
-            response = client.chat.completions.create(
-                model=os.getenv("ASSISTANT_MODEL"),
-                max_tokens=500,
-                messages=messages,
-                stream=True,
-            )
-
-            # Collect the full response for conversation history
+            # Stream response, collecting it for conversation history
             full_response = ""
-            for chunk in response:
-                if chunk.choices[0].delta.content is not None:
-                    content = chunk.choices[0].delta.content
-                    print(content, end="", flush=True)
-                    full_response += content
+            for content in provider.stream(messages, max_tokens=500):
+                print(content, end="", flush=True)
+                full_response += content
 
             print("\n")
 
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from backend.celery import WORKER_PROFILES, app
+
+
+class Command(BaseCommand):
+    help = (
+        "Start a Celery worker for a queue profile "
+        "(interactive, reports, maintenance or all)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "profile",
+            choices=sorted(WORKER_PROFILES),
+            help="Worker profile defined in backend/celery.py",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Override the profile's number of worker processes",
+        )
+        parser.add_argument(
+            "--loglevel",
+            default="INFO",
+            help="Worker log level (default: INFO)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the equivalent celery command instead of starting the worker",
+        )
+
+    def handle(self, *args, **options):
+        profile = WORKER_PROFILES[options["profile"]]
+        concurrency = options["concurrency"] or profile["concurrency"]
+
+        argv = [
+            "worker",
+            f"--queues={','.join(profile['queues'])}",
+            f"--concurrency={concurrency}",
+            f"--hostname={options['profile']}@%h",
+            f"--loglevel={options['loglevel']}",
+        ]
+
+        if options["dry_run"]:
+            self.stdout.write("celery -A backend " + " ".join(argv))
+            return
+
+        app.worker_main(argv)
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count, F, Max, Q, Sum
+from django.utils import timezone
+from ...models import TaskRun
+
+
+class Command(BaseCommand):
+    help = "Summarize recorded Celery task telemetry (duration, memory, queries, tokens)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=24,
+            help="Only include task runs from the last N hours (default: 24)",
+        )
+        parser.add_argument(
+            "--task",
+            type=str,
+            help="Only include runs of this task name",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of allocation sites to list (default: 10)",
+        )
+        parser.add_argument(
+            "--prune-days",
+            type=int,
+            help="Delete task runs older than N days and exit",
+        )
+
+    def handle(self, *args, **options):
+        if options["prune_days"] is not None:
+            cutoff = timezone.now() - timedelta(days=options["prune_days"])
+            deleted, _ = TaskRun.objects.filter(created_at__lt=cutoff).delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} task runs"))
+            return
+
+        since = timezone.now() - timedelta(hours=options["hours"])
+        runs = TaskRun.objects.filter(created_at__gte=since)
+        if options["task"]:
+            runs = runs.filter(task_name=options["task"])
+
+        if not runs.exists():
+            self.stdout.write(self.style.WARNING("No task runs recorded in this window"))
+            return
+
+        self._print_per_task(runs)
+        self._print_per_process(runs)
+        self._print_allocations(runs, options["top"])
+
+    def _print_per_task(self, runs):
+        self.stdout.write(self.style.SUCCESS("\nPer task"))
+        rows = (
+            runs.values("task_name")
+            .annotate(
+                runs=Count("id"),
+                failures=Count("id", filter=Q(state="FAILURE")),
+                avg_ms=Avg("duration_ms"),
+                max_ms=Max("duration_ms"),
+                avg_rss_delta=Avg(F("rss_after_mb") - F("rss_before_mb")),
+                total_rss_delta=Sum(F("rss_after_mb") - F("rss_before_mb")),
+                avg_queries=Avg("db_queries"),
+                prompt_tokens=Sum("prompt_tokens"),
+                completion_tokens=Sum("completion_tokens"),
+            )
+            .order_by("-total_rss_delta")
+        )
+        for row in rows:
+            self.stdout.write(
+                f"  {row['task_name']}\n"
+                f"    runs={row['runs']} failures={row['failures']} "
+                f"avg={row['avg_ms']:.0f}ms max={row['max_ms']:.0f}ms\n"
+                f"    rss delta avg={row['avg_rss_delta']:+.2f}MB "
+                f"total={row['total_rss_delta']:+.2f}MB "
+                f"queries avg={row['avg_queries']:.1f}\n"
+                f"    tokens prompt={row['prompt_tokens']} "
+                f"completion={row['completion_tokens']}"
+            )
+
+    def _print_per_process(self, runs):
+        # A worker whose RSS keeps climbing across tasks is leaking; one
+        # that plateaus does not need to be recycled
+        self.stdout.write(self.style.SUCCESS("\nRSS growth per worker process"))
+        by_pid = {}
+        for run in runs.order_by("created_at").values(
+            "hostname", "pid", "rss_before_mb", "rss_after_mb"
+        ):
+            key = (run["hostname"], run["pid"])
+            entry = by_pid.setdefault(
+                key, {"first": run["rss_before_mb"], "tasks": 0}
+            )
+            entry["last"] = run["rss_after_mb"]
+            entry["tasks"] += 1
+
+        for (hostname, pid), entry in sorted(
+            by_pid.items(), key=lambda item: item[1]["first"] - item[1]["last"]
+        ):
+            growth = entry["last"] - entry["first"]
+            self.stdout.write(
+                f"  {hostname} pid={pid}: {entry['first']:.1f} -> {entry['last']:.1f}MB "
+                f"over {entry['tasks']} tasks ({growth / entry['tasks']:+.2f}MB/task)"
+            )
+
+    def _print_allocations(self, runs, top):
+        sites = {}
+        for allocations in runs.exclude(top_allocations=[]).values_list(
+            "top_allocations", flat=True
+        ):
+            for allocation in allocations:
+                site = sites.setdefault(allocation["site"], {"kb": 0.0, "runs": 0})
+                site["kb"] += allocation["size_diff_kb"]
+                site["runs"] += 1
+
+        if not sites:
+            return
+
+        self.stdout.write(self.style.SUCCESS("\nTop allocation sites (tracemalloc)"))
+        for site, entry in sorted(sites.items(), key=lambda item: -item[1]["kb"])[:top]:
+            self.stdout.write(
+                f"  {entry['kb']:>10.1f}KB in {entry['runs']:>4} runs  {site}"
+            )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assistant', '0004_remove_progressreportsettings_report_time_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progressreport',
+            name='parse_mode',
+            field=models.CharField(blank=True, choices=[('structured', 'Structured'), ('repaired', 'Repaired'), ('fallback', 'Fallback')], help_text='How the LLM output was parsed into sections', max_length=10),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assistant', '0005_progressreport_parse_mode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_name', models.CharField(max_length=255)),
+                ('task_id', models.CharField(max_length=255)),
+                ('state', models.CharField(max_length=20)),
+                ('hostname', models.CharField(blank=True, max_length=255)),
+                ('pid', models.PositiveIntegerField()),
+                ('duration_ms', models.FloatField()),
+                ('rss_before_mb', models.FloatField()),
+                ('rss_after_mb', models.FloatField()),
+                ('db_queries', models.PositiveIntegerField(default=0)),
+                ('llm_calls', models.PositiveIntegerField(default=0)),
+                ('prompt_tokens', models.PositiveIntegerField(default=0)),
+                ('completion_tokens', models.PositiveIntegerField(default=0)),
+                ('top_allocations', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'assistant_task_runs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['task_name', '-created_at'], name='assistant_t_task_na_2357e9_idx'), models.Index(fields=['pid', 'created_at'], name='assistant_t_pid_d4d6f5_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:50
+
+import assistant.models.history_export
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assistant', '0006_task_run'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HistoryExport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('format', models.CharField(choices=[('parquet', 'Parquet'), ('arrow', 'Arrow IPC'), ('csv', 'CSV')], default='parquet', help_text='Format of the files in the archive (CSV when pyarrow is missing)', max_length=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('file', models.FileField(blank=True, storage=assistant.models.history_export.history_export_storage, upload_to=assistant.models.history_export.history_export_upload_path)),
+                ('size_bytes', models.PositiveBigIntegerField(default=0)),
+                ('row_counts', models.JSONField(blank=True, default=dict, help_text='Rows written per dataset')),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='history_exports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'assistant_history_exports',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at'], name='assistant_h_user_id_91169e_idx'), models.Index(fields=['status', 'created_at'], name='assistant_h_status_a5e705_idx')],
+            },
+        ),
+    ]
@@ -1,9 +1,16 @@
 from .chat import Chat, Message
 from .progress_report import ProgressReport, ProgressReportSettings
+from .task_run import TaskRun
+from .history_export import HistoryExport
+
+# Import signals to ensure they're registered
+from . import signals
 
 __all__ = [
     "Chat",
     "Message",
     "ProgressReport",
     "ProgressReportSettings",
+    "TaskRun",
+    "HistoryExport",
 ]
@@ -0,0 +1,77 @@
+from django.core.files.storage import storages
+from django.db import models
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+def history_export_storage():
+    """Storage for export archives (STORAGES["exports"])"""
+    return storages["exports"]
+
+
+def history_export_upload_path(instance, filename):
+    """Generate upload path: history_exports/<user_id>/<filename>"""
+    return f"history_exports/{instance.user_id}/{filename}"
+
+
+class HistoryExport(models.Model):
+    """
+    A user's full nutrition and training history exported to a file.
+
+    Created by the API and filled in by export_user_history_task; see
+    HistoryExportService for the archive layout.
+    """
+
+    FORMAT_CHOICES = [
+        ("parquet", "Parquet"),
+        ("arrow", "Arrow IPC"),
+        ("csv", "CSV"),
+    ]
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="history_exports"
+    )
+    format = models.CharField(
+        max_length=10,
+        choices=FORMAT_CHOICES,
+        default="parquet",
+        help_text="Format of the files in the archive (CSV when pyarrow is missing)",
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+
+    file = models.FileField(
+        upload_to=history_export_upload_path,
+        storage=history_export_storage,
+        blank=True,
+    )
+    size_bytes = models.PositiveBigIntegerField(default=0)
+    row_counts = models.JSONField(
+        default=dict, blank=True, help_text="Rows written per dataset"
+    )
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "assistant_history_exports"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"History export for {self.user.email} [{self.status}]"
+
+    @property
+    def is_finished(self):
+        return self.status in ("completed", "failed")
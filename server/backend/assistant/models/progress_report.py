@@ -63,6 +63,13 @@ class ProgressReport(models.Model):
         ("failed", "Failed"),
     ]
 
+    PARSE_MODE_CHOICES = [
+        ("structured", "Structured"),
+        ("repaired", "Repaired"),
+        # Kept for reports saved by the removed section-marker parser
+        ("fallback", "Fallback"),
+    ]
+
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="progress_reports"
     )
@@ -111,6 +118,12 @@ class ProgressReport(models.Model):
     report_type = models.CharField(max_length=10, default="short")
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
     generation_error = models.TextField(blank=True, null=True)
+    parse_mode = models.CharField(
+        max_length=10,
+        choices=PARSE_MODE_CHOICES,
+        blank=True,
+        help_text="How the LLM output was parsed into sections",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     is_read = models.BooleanField(default=False)
     auto_generated = models.BooleanField(
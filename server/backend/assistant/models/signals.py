@@ -0,0 +1,15 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from accounts.models import ResourceVersion
+from accounts.models.signals import deleted_with_account
+from .progress_report import ProgressReport
+
+
+@receiver(post_save, sender=ProgressReport)
+@receiver(post_delete, sender=ProgressReport)
+def bump_progress_report_version(sender, instance, origin=None, **kwargs):
+    """Bump the progress reports version when a report changes"""
+    if deleted_with_account(origin):
+        return
+    ResourceVersion.bump([instance.user_id], "progress_reports")
@@ -0,0 +1,44 @@
+from django.db import models
+
+
+class TaskRun(models.Model):
+    """
+    Resource usage of one Celery task execution, recorded by
+    assistant.telemetry from task_prerun/task_postrun signals.
+    """
+
+    task_name = models.CharField(max_length=255)
+    task_id = models.CharField(max_length=255)
+    state = models.CharField(max_length=20)
+
+    # Worker process that ran the task; RSS trends are per process
+    hostname = models.CharField(max_length=255, blank=True)
+    pid = models.PositiveIntegerField()
+
+    duration_ms = models.FloatField()
+    rss_before_mb = models.FloatField()
+    rss_after_mb = models.FloatField()
+    db_queries = models.PositiveIntegerField(default=0)
+    llm_calls = models.PositiveIntegerField(default=0)
+    prompt_tokens = models.PositiveIntegerField(default=0)
+    completion_tokens = models.PositiveIntegerField(default=0)
+
+    # Top allocation sites by growth, when tracemalloc is enabled
+    top_allocations = models.JSONField(default=list, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "assistant_task_runs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["task_name", "-created_at"]),
+            models.Index(fields=["pid", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.task_name} [{self.state}] {self.duration_ms:.0f}ms"
+
+    @property
+    def rss_delta_mb(self):
+        return self.rss_after_mb - self.rss_before_mb
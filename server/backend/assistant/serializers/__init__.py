@@ -4,6 +4,7 @@ from .progress_report import (
     ProgressReportSerializer,
     ProgressReportListSerializer,
 )
+from .history_export import HistoryExportSerializer
 
 __all__ = [
     "MessageSerializer",
@@ -11,4 +12,5 @@ __all__ = [
     "ProgressReportSettingsSerializer",
     "ProgressReportSerializer",
     "ProgressReportListSerializer",
+    "HistoryExportSerializer",
 ]
@@ -0,0 +1,41 @@
+from django.urls import reverse
+from rest_framework import serializers
+from ..models import HistoryExport
+
+
+class HistoryExportSerializer(serializers.ModelSerializer):
+    """Serializer for history exports; only the format is writable"""
+
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = HistoryExport
+        fields = [
+            "id",
+            "format",
+            "status",
+            "size_bytes",
+            "row_counts",
+            "error",
+            "download_url",
+            "created_at",
+            "completed_at",
+        ]
+        read_only_fields = [
+            "id",
+            "status",
+            "size_bytes",
+            "row_counts",
+            "error",
+            "download_url",
+            "created_at",
+            "completed_at",
+        ]
+
+    def get_download_url(self, obj):
+        if obj.status != "completed":
+            return None
+
+        url = reverse("history-export-download", kwargs={"pk": obj.pk})
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
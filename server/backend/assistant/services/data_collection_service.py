@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta
 from django.utils import timezone
+from django.db.models import Count, Sum
 from nutrition.models import DailyEntry
-from workouts.models import TemplateHistory
+from workouts.models import TemplateHistory, TemplateHistoryExercise
 
 
 class DataCollectionService:
@@ -263,25 +264,23 @@ class DataCollectionService:
                     }
                 )
 
-            # Calculate volume trends by exercise
-            volume_by_exercise = {}
-            for workout in workout_history:
-                for performed_exercise in workout.performed_exercises.all():
-                    exercise_name = performed_exercise.exercise_name
-                    if exercise_name not in volume_by_exercise:
-                        volume_by_exercise[exercise_name] = {
-                            "total_volume": 0,
-                            "total_sets": 0,
-                            "occurrences": 0,
-                        }
-
-                    volume_by_exercise[exercise_name][
-                        "total_volume"
-                    ] += performed_exercise.total_volume
-                    volume_by_exercise[exercise_name][
-                        "total_sets"
-                    ] += performed_exercise.total_sets_performed
-                    volume_by_exercise[exercise_name]["occurrences"] += 1
+            # Calculate volume trends by exercise from the stored set stats
+            volume_by_exercise = {
+                row["exercise_name"]: {
+                    "total_volume": round(row["total_volume"] or 0, 2),
+                    "total_sets": row["total_sets"] or 0,
+                    "occurrences": row["occurrences"],
+                }
+                for row in TemplateHistoryExercise.objects.filter(
+                    workout_history__in=query
+                )
+                .values("exercise_name")
+                .annotate(
+                    total_volume=Sum("total_volume"),
+                    total_sets=Sum("total_sets_performed"),
+                    occurrences=Count("id"),
+                )
+            }
 
             return {
                 "has_data": True,
@@ -0,0 +1,418 @@
+"""
+Columnar export of a user's full nutrition and training history.
+
+The archive is a zip holding one file per dataset (daily_entries,
+food_entries, weight_history, workouts, performed_sets) in Parquet, Arrow IPC
+or CSV. Rows are read with .iterator(chunk_size=...), which uses server-side
+cursors on PostgreSQL, and written one chunk at a time to temporary files, so
+memory stays bounded however long the history is.
+"""
+
+import csv
+import io
+import logging
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Callable
+from django.conf import settings
+from django.core.files import File
+from django.utils import timezone
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: without pyarrow exports fall back to CSV
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+def _number(value):
+    """Coerce a JSON set value to float (None when missing or invalid)"""
+    try:
+        return float(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _integer(value):
+    number = _number(value)
+    return int(number) if number is not None else None
+
+
+def _plain_value(value):
+    """Decimals to floats and durations to seconds, for Arrow and CSV alike"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def _single_row(row):
+    return [tuple(_plain_value(value) for value in row)]
+
+
+def _performed_set_rows(row):
+    """Flatten one performed exercise into one row per set"""
+    *exercise, sets = row
+    for set_number, set_data in enumerate(sets or [], start=1):
+        if not isinstance(set_data, dict):
+            continue
+        yield (
+            *exercise,
+            set_number,
+            _integer(set_data.get("reps")),
+            _number(set_data.get("weight")),
+        )
+
+
+@dataclass
+class ExportDataset:
+    """
+    One exported table.
+
+    `fields` are the values_list() lookups read from `queryset(user)`;
+    `rows` turns one fetched tuple into zero or more output rows matching
+    `columns`, a list of (name, type) with type one of int, float, string,
+    date, datetime.
+    """
+
+    name: str
+    queryset: Callable
+    fields: list
+    columns: list
+    rows: Callable = _single_row
+
+
+def _datasets():
+    # Imported here: the export reads every app's models
+    from accounts.models import WeightHistory
+    from nutrition.models import DailyEntry, FoodEntry
+    from workouts.models import TemplateHistory, TemplateHistoryExercise
+
+    return [
+        ExportDataset(
+            name="daily_entries",
+            queryset=lambda user: DailyEntry.objects.filter(
+                nutrition_profile__account=user
+            ).order_by("date", "id"),
+            fields=[
+                "id",
+                "date",
+                "total_calories",
+                "total_protein",
+                "total_carbs",
+                "total_fat",
+                "created_at",
+                "updated_at",
+            ],
+            columns=[
+                ("id", "int"),
+                ("date", "date"),
+                ("total_calories", "float"),
+                ("total_protein", "float"),
+                ("total_carbs", "float"),
+                ("total_fat", "float"),
+                ("created_at", "datetime"),
+                ("updated_at", "datetime"),
+            ],
+        ),
+        ExportDataset(
+            name="food_entries",
+            queryset=lambda user: FoodEntry.objects.filter(
+                daily_entry__nutrition_profile__account=user
+            ).order_by("daily_entry__date", "meal_type", "created_at", "id"),
+            fields=[
+                "id",
+                "daily_entry_id",
+                "daily_entry__date",
+                "meal_type",
+                "food_id",
+                "food__food_id",
+                "food__food_name",
+                "food__brand_name",
+                "serving_type",
+                "fatsecret_serving_id",
+                "custom_serving_unit",
+                "custom_serving_amount",
+                "quantity",
+                "calories",
+                "protein",
+                "carbs",
+                "fat",
+                "diet_plan_food_id",
+                "created_at",
+            ],
+            columns=[
+                ("id", "int"),
+                ("daily_entry_id", "int"),
+                ("date", "date"),
+                ("meal_type", "string"),
+                ("food_id", "int"),
+                ("fatsecret_food_id", "string"),
+                ("food_name", "string"),
+                ("brand_name", "string"),
+                ("serving_type", "string"),
+                ("fatsecret_serving_id", "string"),
+                ("custom_serving_unit", "string"),
+                ("custom_serving_amount", "float"),
+                ("quantity", "float"),
+                ("calories", "float"),
+                ("protein", "float"),
+                ("carbs", "float"),
+                ("fat", "float"),
+                ("diet_plan_food_id", "int"),
+                ("created_at", "datetime"),
+            ],
+        ),
+        ExportDataset(
+            name="weight_history",
+            queryset=lambda user: WeightHistory.objects.filter(account=user).order_by(
+                "recorded_date", "id"
+            ),
+            fields=["id", "recorded_date", "weight", "created_at"],
+            columns=[
+                ("id", "int"),
+                ("recorded_date", "date"),
+                ("weight_kg", "float"),
+                ("created_at", "datetime"),
+            ],
+        ),
+        ExportDataset(
+            name="workouts",
+            queryset=lambda user: TemplateHistory.objects.filter(
+                user_id=user
+            ).order_by("completed_at", "id"),
+            fields=[
+                "id",
+                "original_template_id",
+                "template_title",
+                "started_at",
+                "completed_at",
+                "total_duration",
+                "total_exercises",
+                "total_sets",
+                "workout_notes",
+            ],
+            columns=[
+                ("id", "int"),
+                ("template_id", "int"),
+                ("template_title", "string"),
+                ("started_at", "datetime"),
+                ("completed_at", "datetime"),
+                ("duration_seconds", "float"),
+                ("total_exercises", "int"),
+                ("total_sets", "int"),
+                ("workout_notes", "string"),
+            ],
+        ),
+        ExportDataset(
+            name="performed_sets",
+            queryset=lambda user: TemplateHistoryExercise.objects.filter(
+                workout_history__user_id=user
+            ).order_by("workout_history__completed_at", "workout_history_id", "order", "id"),
+            fields=[
+                "workout_history_id",
+                "workout_history__completed_at",
+                "id",
+                "exercise_id",
+                "exercise_name",
+                "order",
+                "weight_unit",
+                "performed_sets_data",
+            ],
+            columns=[
+                ("workout_id", "int"),
+                ("completed_at", "datetime"),
+                ("performed_exercise_id", "int"),
+                ("exercise_id", "int"),
+                ("exercise_name", "string"),
+                ("exercise_order", "int"),
+                ("weight_unit", "string"),
+                ("set_number", "int"),
+                ("reps", "int"),
+                ("weight", "float"),
+            ],
+            rows=_performed_set_rows,
+        ),
+    ]
+
+
+class HistoryExportService:
+    """Writes HistoryExport archives"""
+
+    EXTENSIONS = {"parquet": "parquet", "arrow": "arrow", "csv": "csv"}
+
+    @staticmethod
+    def resolve_format(requested):
+        """
+        Get the format an export will actually be written in.
+
+        Args:
+            requested: parquet, arrow or csv
+
+        Returns:
+            str: The requested format, or csv when pyarrow is not installed
+        """
+        if requested in ("parquet", "arrow") and pa is None:
+            return "csv"
+        return requested
+
+    @staticmethod
+    def run(history_export):
+        """
+        Build the archive for a HistoryExport and attach it.
+
+        Args:
+            history_export: HistoryExport instance (pending)
+
+        Returns:
+            HistoryExport: The export, completed or failed
+        """
+        history_export.format = HistoryExportService.resolve_format(
+            history_export.format
+        )
+        history_export.status = "running"
+        history_export.save(update_fields=["format", "status"])
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="history_export_") as workdir:
+                archive_path = os.path.join(workdir, "export.zip")
+                row_counts = HistoryExportService.write_archive(
+                    history_export.user, history_export.format, archive_path, workdir
+                )
+
+                filename = (
+                    f"history_export_{history_export.user_id}_"
+                    f"{timezone.now().strftime('%Y%m%d_%H%M%S')}.zip"
+                )
+                with open(archive_path, "rb") as archive:
+                    history_export.file.save(filename, File(archive), save=False)
+
+            history_export.size_bytes = history_export.file.size
+            history_export.row_counts = row_counts
+            history_export.status = "completed"
+            history_export.error = ""
+        except Exception as e:
+            logger.error(
+                f"History export {history_export.id} failed: {e}", exc_info=True
+            )
+            history_export.status = "failed"
+            history_export.error = str(e)
+
+        history_export.completed_at = timezone.now()
+        history_export.save()
+        return history_export
+
+    @staticmethod
+    def write_archive(user, export_format, archive_path, workdir):
+        """
+        Write every dataset of a user's history into a zip archive.
+
+        Args:
+            user: Account whose history is exported
+            export_format: parquet, arrow or csv
+            archive_path: Path of the zip file to create
+            workdir: Directory for intermediate files
+
+        Returns:
+            dict: Rows written per dataset
+        """
+        chunk_size = settings.HISTORY_EXPORT_CHUNK_SIZE
+        extension = HistoryExportService.EXTENSIONS[export_format]
+        row_counts = {}
+
+        # Parquet and Arrow files are compressed already
+        compression = zipfile.ZIP_DEFLATED if export_format == "csv" else zipfile.ZIP_STORED
+
+        with zipfile.ZipFile(archive_path, "w", compression=compression) as archive:
+            for dataset in _datasets():
+                batches = HistoryExportService._batches(dataset, user, chunk_size)
+                arcname = f"{dataset.name}.{extension}"
+
+                if export_format == "csv":
+                    count = HistoryExportService._write_csv(
+                        archive, arcname, dataset, batches
+                    )
+                else:
+                    path = os.path.join(workdir, arcname)
+                    count = HistoryExportService._write_arrow(
+                        path, export_format, dataset, batches
+                    )
+                    archive.write(path, arcname=arcname)
+                    os.remove(path)
+
+                row_counts[dataset.name] = count
+
+        logger.info(f"Exported history of user {user.id}: {row_counts}")
+        return row_counts
+
+    @staticmethod
+    def _batches(dataset, user, chunk_size):
+        """Yield lists of at most chunk_size output rows"""
+        fetched = (
+            dataset.queryset(user)
+            .values_list(*dataset.fields)
+            .iterator(chunk_size=chunk_size)
+        )
+        rows = (row for fetched_row in fetched for row in dataset.rows(fetched_row))
+        while batch := list(islice(rows, chunk_size)):
+            yield batch
+
+    @staticmethod
+    def _write_csv(archive, arcname, dataset, batches):
+        count = 0
+        with archive.open(arcname, "w", force_zip64=True) as member:
+            with io.TextIOWrapper(member, encoding="utf-8", newline="") as text:
+                writer = csv.writer(text)
+                writer.writerow([name for name, _ in dataset.columns])
+                for batch in batches:
+                    writer.writerows(batch)
+                    count += len(batch)
+        return count
+
+    @staticmethod
+    def _arrow_schema(dataset):
+        types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "string": pa.string(),
+            "date": pa.date32(),
+            "datetime": pa.timestamp("us", tz="UTC"),
+        }
+        return pa.schema(
+            [pa.field(name, types[column_type]) for name, column_type in dataset.columns]
+        )
+
+    @staticmethod
+    def _write_arrow(path, export_format, dataset, batches):
+        schema = HistoryExportService._arrow_schema(dataset)
+        if export_format == "parquet":
+            writer = pq.ParquetWriter(path, schema, compression="zstd")
+        else:
+            writer = pa.ipc.new_file(path, schema)
+
+        count = 0
+        try:
+            for batch in batches:
+                columns = list(zip(*batch))
+                writer.write_batch(
+                    pa.record_batch(
+                        [
+                            pa.array(column, type=field.type)
+                            for column, field in zip(columns, schema)
+                        ],
+                        schema=schema,
+                    )
+                )
+                count += len(batch)
+        finally:
+            writer.close()
+        return count
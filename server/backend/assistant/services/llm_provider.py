@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from dotenv import load_dotenv
+
+
+@dataclass
+class LLMResponse:
+    """Normalized completion result returned by every provider"""
+
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    raw: object = field(default=None, repr=False)
+
+
+class LLMUsage(threading.local):
+    """
+    Per-thread running token totals across all providers.
+
+    Task telemetry resets it before a task and reads it afterwards, so token
+    usage is attributed to the task that caused it.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def add(self, prompt_tokens, completion_tokens):
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens or 0
+        self.completion_tokens += completion_tokens or 0
+
+
+llm_usage = LLMUsage()
+
+
+class BaseLLMProvider(ABC):
+    """
+    Interface shared by all LLM backends.
+
+    Services talk to a provider instead of instantiating an SDK client, so the
+    backend can be swapped (e.g. for the local stub) without touching them.
+    A provider missing a method fails when it is instantiated.
+    """
+
+    name = "base"
+
+    def __init__(self, model):
+        self.model = model
+
+    @abstractmethod
+    def complete(self, messages, max_tokens=500, temperature=0.7, response_format=None):
+        """
+        Run a chat completion and return the full response.
+
+        Args:
+            messages: List of {"role", "content"} dicts
+            max_tokens: Completion token cap
+            temperature: Sampling temperature
+            response_format: Optional OpenAI-style response_format dict
+
+        Returns:
+            LLMResponse
+        """
+
+    @abstractmethod
+    def stream(self, messages, max_tokens=500, temperature=0.7):
+        """Run a chat completion and yield content chunks as they arrive"""
+
+
+class OpenAIProvider(BaseLLMProvider):
+    """Provider backed by the OpenAI SDK, sharing one pooled client per process"""
+
+    name = "openai"
+
+    _client = None
+    _client_lock = threading.Lock()
+
+    def __init__(self, model, api_key):
+        super().__init__(model)
+        self.client = self._get_client(api_key)
+
+    @classmethod
+    def _get_client(cls, api_key):
+        # The SDK client keeps an httpx connection pool, so reuse it across
+        # requests and tasks instead of paying the TLS handshake every time
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    from openai import OpenAI
+
+                    cls._client = OpenAI(api_key=api_key)
+        return cls._client
+
+    def complete(self, messages, max_tokens=500, temperature=0.7, response_format=None):
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if response_format:
+            kwargs["response_format"] = response_format
+
+        response = self.client.chat.completions.create(**kwargs)
+        usage = getattr(response, "usage", None)
+
+        result = LLMResponse(
+            content=response.choices[0].message.content,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            raw=response,
+        )
+        llm_usage.add(result.prompt_tokens, result.completion_tokens)
+        return result
+
+    def stream(self, messages, max_tokens=500, temperature=0.7):
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            # The final chunk then carries token usage for the whole stream
+            stream_options={"include_usage": True},
+        )
+        for chunk in response:
+            if chunk.usage is not None:
+                llm_usage.add(chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
+            if chunk.choices and chunk.choices[0].delta.content is not None:
+                yield chunk.choices[0].delta.content
+
+
+class StubLLMProvider(BaseLLMProvider):
+    """
+    Deterministic local provider for load testing and offline development.
+
+    Responses depend only on the input messages. Latency is simulated as a
+    fixed time-to-first-token plus a constant token rate, so benchmarks can
+    separate our own overhead from model latency.
+    """
+
+    name = "stub"
+
+    def __init__(self, model="stub", latency_ms=0, tokens_per_second=0, response_tokens=60):
+        super().__init__(model)
+        self.latency_ms = latency_ms
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+
+    def _digest(self, messages):
+        payload = json.dumps(messages, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+    def _words(self, messages, max_tokens):
+        digest = self._digest(messages)
+        count = max(1, min(self.response_tokens, max_tokens))
+        return [f"stub-{digest}"] + ["lorem"] * (count - 1)
+
+    def _sleep_first_token(self):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def _sleep_tokens(self, n_tokens):
+        if self.tokens_per_second:
+            time.sleep(n_tokens / self.tokens_per_second)
+
+    def _prompt_tokens(self, messages):
+        # Rough whitespace token estimate, good enough for accounting
+        return sum(len(str(m.get("content", "")).split()) for m in messages)
+
+    def _structured_content(self, response_format, text):
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        properties = schema.get("properties", {})
+        return json.dumps({name: text for name in properties})
+
+    def complete(self, messages, max_tokens=500, temperature=0.7, response_format=None):
+        words = self._words(messages, max_tokens)
+        self._sleep_first_token()
+        self._sleep_tokens(len(words))
+
+        text = " ".join(words)
+        if response_format and response_format.get("type") == "json_schema":
+            content = self._structured_content(response_format, text)
+        elif response_format and response_format.get("type") == "json_object":
+            content = json.dumps({"content": text})
+        else:
+            content = text
+
+        result = LLMResponse(
+            content=content,
+            prompt_tokens=self._prompt_tokens(messages),
+            completion_tokens=len(words),
+        )
+        llm_usage.add(result.prompt_tokens, result.completion_tokens)
+        return result
+
+    def stream(self, messages, max_tokens=500, temperature=0.7):
+        words = self._words(messages, max_tokens)
+        self._sleep_first_token()
+        for i, word in enumerate(words):
+            self._sleep_tokens(1)
+            yield word if i == 0 else f" {word}"
+        llm_usage.add(self._prompt_tokens(messages), len(words))
+
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def _build_provider():
+    # Only load .env in development
+    if os.getenv("RENDER") is None:
+        load_dotenv()
+
+    backend = os.getenv("ASSISTANT_LLM_PROVIDER", "openai").lower()
+
+    if backend == "stub":
+        return StubLLMProvider(
+            model=os.getenv("ASSISTANT_MODEL", "stub"),
+            latency_ms=int(os.getenv("ASSISTANT_STUB_LATENCY_MS", 0)),
+            tokens_per_second=float(os.getenv("ASSISTANT_STUB_TOKENS_PER_SECOND", 0)),
+            response_tokens=int(os.getenv("ASSISTANT_STUB_RESPONSE_TOKENS", 60)),
+        )
+
+    if backend != "openai":
+        raise ValueError(f"Unknown ASSISTANT_LLM_PROVIDER: {backend}")
+
+    api_key = os.getenv("ASSISTANT_API_KEY")
+    if not api_key:
+        raise ValueError("ASSISTANT_API_KEY environment variable is not set")
+
+    model = os.getenv("ASSISTANT_MODEL")
+    if not model:
+        raise ValueError("ASSISTANT_MODEL not found in environment variables")
+
+    return OpenAIProvider(model=model, api_key=api_key)
+
+
+def get_llm_provider():
+    """
+    Return the process-wide LLM provider selected by ASSISTANT_LLM_PROVIDER.
+
+    "openai" (default) uses the OpenAI API with ASSISTANT_API_KEY and
+    ASSISTANT_MODEL. "stub" uses StubLLMProvider, tuned by
+    ASSISTANT_STUB_LATENCY_MS, ASSISTANT_STUB_TOKENS_PER_SECOND and
+    ASSISTANT_STUB_RESPONSE_TOKENS.
+    """
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = _build_provider()
+    return _provider
+
+
+def set_llm_provider(provider):
+    """Override the process-wide provider (benchmarks, management commands)"""
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -1,25 +1,12 @@
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
 from ..models import Chat
 from .data_collection_service import DataCollectionService
+from .llm_provider import get_llm_provider
+from .prompt_registry import get_assistant_prompt
 
 
 class LLMService:
-    def __init__(self):
-        # Only load .env in development
-        if os.getenv("RENDER") is None:
-            load_dotenv()
-
-        api_key = os.getenv("ASSISTANT_API_KEY") or os.environ.get("ASSISTANT_API_KEY")
-        if not api_key:
-            raise ValueError("ASSISTANT_API_KEY environment variable is not set")
-
-        self.client = OpenAI(api_key=api_key)
-
-        self.model = os.getenv("ASSISTANT_MODEL") or os.environ.get("ASSISTANT_MODEL")
-        if not self.model:
-            raise ValueError("ASSISTANT_MODEL not found in environment variables")
+    def __init__(self, provider=None):
+        self.provider = provider or get_llm_provider()
 
     def get_system_prompt(self, user_data_summary):
         """
@@ -31,18 +18,7 @@ class LLMService:
         Returns:
             str: System prompt with user context
         """
-        try:
-            # Use absolute path relative to the app directory
-            prompt_file = os.path.join(
-                os.path.dirname(__file__),
-                os.pardir,
-                "prompts",
-                "assistant_prompt.txt",
-            )
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                base_prompt = f.read().strip()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"System prompt file not found at {prompt_file}")
+        base_prompt = get_assistant_prompt()
 
         # Add user data summary if available
         if user_data_summary:
@@ -83,14 +59,13 @@ class LLMService:
             # Add current user message
             messages.append({"role": "user", "content": user_message})
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+            response = self.provider.complete(
+                messages,
                 max_tokens=500,
                 temperature=0.7,
             )
 
-            assistant_message = response.choices[0].message.content
+            assistant_message = response.content
 
             # Return just the message content - views.py handles saving messages
             return assistant_message
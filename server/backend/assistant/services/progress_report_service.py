@@ -1,10 +1,16 @@
-import os
-from openai import OpenAI  # type: ignore
 from datetime import datetime
 from django.utils import timezone
 from ..models.progress_report import ProgressReport, ProgressReportSettings
 from .data_collection_service import DataCollectionService
 from .rule_based_analyzer import RuleBasedAnalyzer
+from .llm_provider import get_llm_provider
+from .prompt_registry import get_report_system_prompt
+from .report_sections import (
+    REPORT_RESPONSE_FORMAT,
+    REPORT_SECTION_FIELDS,
+    ReportParseError,
+    parse_report_sections,
+)
 
 
 class ReportGenerationService:
@@ -12,40 +18,9 @@ class ReportGenerationService:
     Service to generate AI-powered progress reports for users.
     """
 
-    def __init__(self):
-        """Initialize the OpenAI client"""
-        # Load API key from environment
-        if os.getenv("RENDER") is None:
-            from dotenv import load_dotenv
-
-            load_dotenv()
-
-        api_key = os.getenv("ASSISTANT_API_KEY") or os.environ.get("ASSISTANT_API_KEY")
-        if not api_key:
-            raise ValueError("ASSISTANT_API_KEY not found in environment variables")
-
-        self.client = OpenAI(api_key=api_key)
-
-        self.model = os.getenv("ASSISTANT_MODEL") or os.environ.get("ASSISTANT_MODEL")
-        if not self.model:
-            raise ValueError("ASSISTANT_MODEL not found in environment variables")
-
-        # Get system prompt file
-        self.base_prompt = self._get_system_prompt()
-
-    def _get_system_prompt(self):
-        prompt_file = os.path.join(
-            os.path.dirname(__file__),
-            os.pardir,
-            "prompts",
-            "progress_report_prompt.txt",
-        )
-
-        try:
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                return f.read().strip()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"System prompt file not found at {prompt_file}")
+    def __init__(self, provider=None):
+        """Attach the shared LLM provider"""
+        self.provider = provider or get_llm_provider()
 
     def generate_report(self, user, period_start, period_end, report_type="short"):
         """
@@ -105,25 +80,19 @@ class ReportGenerationService:
             print(f"[ReportService] Generating AI report content for user {user.email}")
 
             # Generate report sections using AI
-            report_content = self._generate_report_content(collected_data, report_type)
+            report_content, parse_mode = self._generate_report_content(
+                collected_data, report_type
+            )
 
-            print(f"[ReportService] AI content generated for user {user.email}")
+            print(
+                f"[ReportService] AI content generated for user {user.email} "
+                f"(parse mode: {parse_mode})"
+            )
 
             # Update report with generated content
-            report.progress_summary = report_content.get("progress_summary", "")
-            report.workout_feedback = report_content.get("workout_feedback", "")
-            report.workout_frequency = report_content.get("workout_frequency", "")
-            report.workout_duration = report_content.get("workout_duration", "")
-            report.workout_recommendations = report_content.get(
-                "workout_recommendations", ""
-            )
-            report.nutrition_feedback = report_content.get("nutrition_feedback", "")
-            report.nutrition_adherence = report_content.get("nutrition_adherence", "")
-            report.nutrition_intake = report_content.get("nutrition_intake", "")
-            report.nutrition_recommendations = report_content.get(
-                "nutrition_recommendations", ""
-            )
-            report.key_takeaways = report_content.get("key_takeaways", "")
+            for field in REPORT_SECTION_FIELDS:
+                setattr(report, field, report_content.get(field, ""))
+            report.parse_mode = parse_mode
             report.status = "generated"
             report.save()
 
@@ -168,37 +137,75 @@ class ReportGenerationService:
 
     def _generate_report_content(self, collected_data, report_type):
         """
-        Generate report content using OpenAI API.
+        Generate report content using OpenAI structured output.
+
+        The completion is requested as JSON matching ReportSections. If it
+        fails validation, the model gets one repair attempt with the
+        validation error.
 
         Args:
             collected_data: Dictionary containing user data
             report_type: Type of report ("short" or "detailed")
 
         Returns:
-            dict: Report sections (progress_summary, workout_feedback, etc.)
+            tuple: (dict of report sections, parse mode)
+
+        Raises:
+            ReportParseError: If the repaired reply still does not validate;
+                generate_report then marks the report failed
         """
         # Build the prompt based on collected data
         system_prompt = self._build_system_prompt(report_type)
         user_prompt = self._build_user_prompt(collected_data)
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        max_tokens = 2000 if report_type == "detailed" else 1000
 
         print(f"[ReportService] Calling LLM API...")
 
-        # Call OpenAI API
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.7,
-            max_tokens=2000 if report_type == "detailed" else 1000,
-        )
+        ai_response = self._request_completion(messages, max_tokens)
 
         print(f"[ReportService] LLM API response received")
 
-        # Parse the AI response
-        ai_response = response.choices[0].message.content
-        return self._parse_ai_response(ai_response)
+        try:
+            return parse_report_sections(ai_response), "structured"
+        except ReportParseError as e:
+            parse_error = str(e)
+            print(f"[ReportService] Structured parse failed, retrying once: {e}")
+
+        # Single repair attempt: show the model its output and the error
+        repair_messages = messages + [
+            {"role": "assistant", "content": ai_response or ""},
+            {
+                "role": "user",
+                "content": (
+                    "Your previous reply did not match the required JSON schema "
+                    f"({parse_error}). Return only the corrected JSON object with every section "
+                    f"({', '.join(REPORT_SECTION_FIELDS)}) as a string."
+                ),
+            },
+        ]
+        repaired_response = self._request_completion(repair_messages, max_tokens)
+
+        try:
+            return parse_report_sections(repaired_response), "repaired"
+        except ReportParseError as e:
+            print(f"[ReportService] Repair attempt failed: {e}")
+            raise ReportParseError(
+                f"AI response did not match the report schema after one repair attempt: {e}"
+            ) from e
+
+    def _request_completion(self, messages, max_tokens):
+        """Call the LLM in structured-output mode and return the raw text"""
+        response = self.provider.complete(
+            messages,
+            max_tokens=max_tokens,
+            temperature=0.7,
+            response_format=REPORT_RESPONSE_FORMAT,
+        )
+        return response.content
 
     def _build_system_prompt(self, report_type):
         """
@@ -210,13 +217,7 @@ class ReportGenerationService:
         Returns:
             str: System prompt
         """
-        length_instruction = (
-            "Keep your response concise and to the point (around 500 words total)."
-            if report_type == "short"
-            else "Provide detailed analysis and comprehensive feedback (around 1000-1500 words total)."
-        )
-
-        return self.base_prompt.replace("{LENGTH_INSTRUCTION}", length_instruction)
+        return get_report_system_prompt(report_type)
 
     def _build_user_prompt(self, collected_data):
         """
@@ -402,75 +403,6 @@ class ReportGenerationService:
 
         return "\n".join(prompt_parts)
 
-    def _parse_ai_response(self, ai_response):
-        """
-        Parse the AI response into structured sections.
-
-        Args:
-            ai_response: Raw AI response text
-
-        Returns:
-            dict: Parsed sections
-        """
-        sections = {
-            "progress_summary": "",
-            "workout_feedback": "",
-            "workout_frequency": "",
-            "workout_duration": "",
-            "workout_recommendations": "",
-            "nutrition_feedback": "",
-            "nutrition_adherence": "",
-            "nutrition_intake": "",
-            "nutrition_recommendations": "",
-            "key_takeaways": "",
-        }
-
-        try:
-            # Split response by section markers
-            parts = ai_response.split("===")
-
-            for i in range(1, len(parts), 2):
-                section_name = parts[i].strip().lower().replace(" ", "_")
-                section_content = parts[i + 1].strip() if i + 1 < len(parts) else ""
-
-                # Match sections
-                if "progress_summary" in section_name or "progress" in section_name:
-                    sections["progress_summary"] = section_content
-                elif "workout_feedback" in section_name:
-                    sections["workout_feedback"] = section_content
-                elif "workout_frequency" in section_name:
-                    sections["workout_frequency"] = section_content
-                elif (
-                    "average_duration" in section_name
-                    or "workout_duration" in section_name
-                ):
-                    sections["workout_duration"] = section_content
-                elif "workout_recommendations" in section_name:
-                    sections["workout_recommendations"] = section_content
-                elif "nutrition_feedback" in section_name:
-                    sections["nutrition_feedback"] = section_content
-                elif (
-                    "adherence_rate" in section_name
-                    or "nutrition_adherence" in section_name
-                ):
-                    sections["nutrition_adherence"] = section_content
-                elif (
-                    "average_daily_intake" in section_name
-                    or "nutrition_intake" in section_name
-                ):
-                    sections["nutrition_intake"] = section_content
-                elif "nutrition_recommendations" in section_name:
-                    sections["nutrition_recommendations"] = section_content
-                elif "key_takeaway" in section_name or "takeaway" in section_name:
-                    sections["key_takeaways"] = section_content
-
-        except Exception as e:
-            print(f"Error parsing AI response: {e}")
-            # Fallback: put entire response in progress_summary
-            sections["progress_summary"] = ai_response
-
-        return sections
-
     def regenerate_report(self, report_id):
         """
         Regenerate a failed or existing report.
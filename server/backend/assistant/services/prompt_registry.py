@@ -0,0 +1,101 @@
+import os
+import threading
+from django.conf import settings
+
+PROMPTS_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "prompts")
+
+REPORT_LENGTH_INSTRUCTIONS = {
+    "short": "Keep your response concise and to the point (around 500 words total).",
+    "detailed": "Provide detailed analysis and comprehensive feedback (around 1000-1500 words total).",
+}
+
+
+class PromptRegistry:
+    """
+    Process-wide cache of prompt templates from the prompts directory.
+
+    Each template is read from disk once. Derived variants (e.g. the short and
+    detailed report prompts) are built once per template load and reused. When
+    DEBUG is on, the file mtime is checked on access so edits are picked up
+    without restarting the server.
+    """
+
+    def __init__(self, prompts_dir=PROMPTS_DIR):
+        self.prompts_dir = prompts_dir
+        self._templates = {}  # name -> (mtime, text)
+        self._variants = {}  # (name, key) -> (mtime, text)
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return os.path.join(self.prompts_dir, name)
+
+    def _load(self, name):
+        prompt_file = self._path(name)
+        try:
+            mtime = os.path.getmtime(prompt_file)
+            with open(prompt_file, "r", encoding="utf-8") as f:
+                text = f.read().strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"System prompt file not found at {prompt_file}")
+        return mtime, text
+
+    def _is_stale(self, name, mtime):
+        if not settings.DEBUG:
+            return False
+        try:
+            return os.path.getmtime(self._path(name)) != mtime
+        except FileNotFoundError:
+            return True
+
+    def _get_entry(self, name):
+        entry = self._templates.get(name)
+        if entry is None or self._is_stale(name, entry[0]):
+            with self._lock:
+                entry = self._load(name)
+                self._templates[name] = entry
+        return entry
+
+    def get(self, name):
+        """Return the stripped text of a prompt template"""
+        return self._get_entry(name)[1]
+
+    def get_variant(self, name, key, build):
+        """
+        Return a variant of a template, building it once per template load.
+
+        Args:
+            name: Template file name
+            key: Variant key (e.g. the report type)
+            build: Callable taking the template text and returning the variant
+        """
+        mtime, text = self._get_entry(name)
+        cached = self._variants.get((name, key))
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, build(text))
+            self._variants[(name, key)] = cached
+        return cached[1]
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+            self._variants.clear()
+
+
+prompt_registry = PromptRegistry()
+
+
+def get_assistant_prompt():
+    """Base system prompt for the chat assistant"""
+    return prompt_registry.get("assistant_prompt.txt")
+
+
+def get_report_system_prompt(report_type):
+    """Prebuilt progress report system prompt for the given report type"""
+    key = "short" if report_type == "short" else "detailed"
+    return prompt_registry.get_variant(
+        "progress_report_prompt.txt",
+        key,
+        lambda text: text.replace(
+            "{LENGTH_INSTRUCTION}", REPORT_LENGTH_INSTRUCTIONS[key]
+        ),
+    )
@@ -0,0 +1,68 @@
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+class ReportSections(BaseModel):
+    """
+    Validated shape of the progress report returned by the LLM.
+    Field names map one-to-one onto the ProgressReport text columns.
+    """
+
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+    progress_summary: str
+    workout_feedback: str
+    workout_frequency: str
+    workout_duration: str
+    workout_recommendations: str
+    nutrition_feedback: str
+    nutrition_adherence: str
+    nutrition_intake: str
+    nutrition_recommendations: str
+    key_takeaways: str
+
+
+REPORT_SECTION_FIELDS = list(ReportSections.model_fields.keys())
+
+# OpenAI structured-output format (strict JSON schema) for the report call
+REPORT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "progress_report",
+        "strict": True,
+        "schema": ReportSections.model_json_schema(),
+    },
+}
+
+
+class ReportParseError(ValueError):
+    """Raised when an LLM completion does not match the ReportSections schema"""
+
+
+def parse_report_sections(raw_response):
+    """
+    Validate a JSON completion against the ReportSections schema.
+
+    Args:
+        raw_response: Raw completion text returned by the LLM
+
+    Returns:
+        dict: Section name -> section content
+
+    Raises:
+        ReportParseError: If the text is not valid JSON or misses sections
+    """
+    if not raw_response:
+        raise ReportParseError("Empty response")
+
+    text = raw_response.strip()
+
+    # Some models wrap JSON in a markdown code fence even in JSON mode
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.lower().startswith("json"):
+            text = text[4:]
+
+    try:
+        return ReportSections.model_validate_json(text).model_dump()
+    except ValidationError as e:
+        raise ReportParseError(str(e)) from e
@@ -1,35 +1,20 @@
 from celery import shared_task
+from backend.celery import PRIORITY_BATCH
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from datetime import timedelta
 import logging
-import psutil  # Add this to requirements.txt
-import os
 
 logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
 
-def log_memory_usage(task_name, stage="start"):
-    """Helper function to log memory usage"""
-    try:
-        process = psutil.Process(os.getpid())
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024  # Convert to MB
-        logger.info(f"[MEMORY] {task_name} - {stage}: {memory_mb:.2f} MB")
-        return memory_mb
-    except Exception as e:
-        logger.warning(f"[MEMORY] Could not get memory info: {e}")
-        return 0
-
-
 @shared_task(name="assistant.tasks.test_celery_task")
 def test_celery_task():
     """Test task to verify Celery is working"""
-    log_memory_usage("test_celery_task", "start")
     logger.info("[TASK-TEST] Test Celery task executed successfully!")
-    log_memory_usage("test_celery_task", "end")
     return {
         "status": "success",
         "message": "Celery is working!",
@@ -40,6 +25,7 @@ def test_celery_task():
 @shared_task(
     name="assistant.tasks.generate_progress_report_task",
     bind=True,
+    ignore_result=True,
     max_retries=3,
     soft_time_limit=300,
 )
@@ -57,9 +43,6 @@ def generate_progress_report_task(
     """
     from .models import ProgressReport
     from .services.progress_report_service import ReportGenerationService
-    import gc
-
-    log_memory_usage("generate_progress_report_task", "start")
 
     try:
         # Get user
@@ -68,8 +51,6 @@ def generate_progress_report_task(
             f"[TASK] Generating progress report for user {user.email} ({period_start} to {period_end})"
         )
 
-        log_memory_usage("generate_progress_report_task", "after_user_fetch")
-
         # Parse dates
         from django.utils.dateparse import parse_datetime
 
@@ -85,16 +66,10 @@ def generate_progress_report_task(
             report_type=report_type,
         )
 
-        log_memory_usage("generate_progress_report_task", "after_generation")
-
         logger.info(
             f"[TASK] Successfully generated report {report.id} for user {user.email}"
         )
 
-        # Force garbage collection to free memory
-        gc.collect()
-        log_memory_usage("generate_progress_report_task", "after_gc")
-
         return {
             "status": "success",
             "report_id": report.id,
@@ -111,8 +86,6 @@ def generate_progress_report_task(
         logger.error(f"[TASK] Error generating report for user {user_id}: {str(e)}")
         # Retry the task
         raise self.retry(exc=e, countdown=60)
-    finally:
-        log_memory_usage("generate_progress_report_task", "end")
 
 
 @shared_task(name="assistant.tasks.test_generate_all_user_reports")
@@ -123,9 +96,7 @@ def test_generate_all_user_reports():
     """
     from .models import ProgressReportSettings
     from .services.progress_report_service import ReportGenerationService
-    import gc
 
-    log_memory_usage("test_generate_all_user_reports", "start")
     logger.info("[TASK] Starting report generation for ALL users")
 
     # Get all users with enabled report settings
@@ -148,9 +119,6 @@ def test_generate_all_user_reports():
     for setting in all_settings:
         try:
             logger.info(f"[TASK] Processing user {setting.user.email}")
-            log_memory_usage(
-                "test_generate_all_user_reports", f"before_{setting.user.email}"
-            )
 
             # Create new service instance for each user
             service = ReportGenerationService()
@@ -172,21 +140,11 @@ def test_generate_all_user_reports():
             else:
                 reports_failed += 1
 
-            # Clean up after each user
-            del service
-            gc.collect()
-            log_memory_usage(
-                "test_generate_all_user_reports", f"after_{setting.user.email}"
-            )
-
         except Exception as e:
             logger.error(f"[TASK] Error for user {setting.user.email}: {str(e)}")
             reports_failed += 1
-            gc.collect()
             continue
 
-    log_memory_usage("test_generate_all_user_reports", "end")
-
     return {
         "status": "success",
         "reports_generated": reports_generated,
@@ -196,16 +154,14 @@ def test_generate_all_user_reports():
     }
 
 
-@shared_task(name="assistant.tasks.generate_scheduled_progress_reports")
+@shared_task(name="assistant.tasks.generate_scheduled_progress_reports", ignore_result=True)
 def generate_scheduled_progress_reports():
     """
     Scheduled task that runs daily to check which users are due for progress reports
     and schedules report generation tasks for them.
     """
     from .models import ProgressReportSettings
-    import gc
 
-    log_memory_usage("generate_scheduled_progress_reports", "start")
     logger.info("[TASK] Starting scheduled progress report generation check")
 
     # Get all users with enabled report settings who are due for a report
@@ -216,6 +172,9 @@ def generate_scheduled_progress_reports():
     reports_scheduled = 0
     errors = 0
 
+    # Admission control: release reports in batches instead of one burst
+    batch_size = max(settings.REPORT_DISPATCH_BATCH_SIZE, 1)
+
     for setting in due_settings:
         try:
             if setting.is_due_for_generation():
@@ -224,11 +183,19 @@ def generate_scheduled_progress_reports():
                 period_start = period_end - timedelta(days=setting.day_interval)
 
                 # Schedule the report generation task (async)
-                generate_progress_report_task.delay(
-                    user_id=setting.user.id,
-                    period_start=period_start.isoformat(),
-                    period_end=period_end.isoformat(),
-                    report_type=setting.report_type,
+                generate_progress_report_task.apply_async(
+                    kwargs={
+                        "user_id": setting.user.id,
+                        "period_start": period_start.isoformat(),
+                        "period_end": period_end.isoformat(),
+                        "report_type": setting.report_type,
+                    },
+                    priority=PRIORITY_BATCH,
+                    countdown=min(
+                        (reports_scheduled // batch_size)
+                        * settings.REPORT_DISPATCH_INTERVAL,
+                        settings.REPORT_DISPATCH_MAX_DELAY,
+                    ),
                 )
 
                 # Update next generation date
@@ -247,9 +214,6 @@ def generate_scheduled_progress_reports():
             errors += 1
             continue
 
-    gc.collect()
-    log_memory_usage("generate_scheduled_progress_reports", "end")
-
     logger.info(
         f"[TASK] Scheduled progress report check complete. "
         f"[TASK] Reports scheduled: {reports_scheduled}, Errors: {errors}"
@@ -263,7 +227,7 @@ def generate_scheduled_progress_reports():
     }
 
 
-@shared_task(name="assistant.tasks.cleanup_old_reports")
+@shared_task(name="assistant.tasks.cleanup_old_reports", ignore_result=True)
 def cleanup_old_reports(keep_last_n=5):
     """
     Cleanup task that removes old progress reports, keeping only the most recent N reports per user.
@@ -272,9 +236,7 @@ def cleanup_old_reports(keep_last_n=5):
         keep_last_n: Number of most recent reports to keep per user (default: 5)
     """
     from .models import ProgressReport
-    import gc
 
-    log_memory_usage("cleanup_old_reports", "start")
     logger.info(
         f"[TASK] Starting cleanup of old progress reports (keeping last {keep_last_n})"
     )
@@ -320,9 +282,6 @@ def cleanup_old_reports(keep_last_n=5):
             )
             continue
 
-    gc.collect()
-    log_memory_usage("cleanup_old_reports", "end")
-
     logger.info(
         f"[TASK] Cleanup complete. Deleted {deleted_count} reports across {users_cleaned} users"
     )
@@ -333,3 +292,99 @@ def cleanup_old_reports(keep_last_n=5):
         "users_cleaned": users_cleaned,
         "timestamp": timezone.now().isoformat(),
     }
+
+
+@shared_task(name="assistant.tasks.cleanup_task_runs", ignore_result=True)
+def cleanup_task_runs(keep_days=30):
+    """
+    Delete task telemetry rows older than keep_days.
+
+    Args:
+        keep_days: Number of days of TaskRun history to keep (default: 30)
+    """
+    from .models import TaskRun
+
+    cutoff = timezone.now() - timedelta(days=keep_days)
+    deleted_count, _ = TaskRun.objects.filter(created_at__lt=cutoff).delete()
+
+    logger.info(f"[TASK] Deleted {deleted_count} task runs older than {keep_days} days")
+
+    return {
+        "status": "success",
+        "deleted_count": deleted_count,
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+@shared_task(
+    name="assistant.tasks.export_user_history_task",
+    ignore_result=True,
+    soft_time_limit=25 * 60,
+)
+def export_user_history_task(export_id):
+    """
+    Build the archive of a HistoryExport (see HistoryExportService).
+
+    Args:
+        export_id: ID of the pending HistoryExport
+    """
+    from .models import HistoryExport
+    from .services.history_export_service import HistoryExportService
+
+    try:
+        history_export = HistoryExport.objects.select_related("user").get(
+            id=export_id
+        )
+    except HistoryExport.DoesNotExist:
+        logger.warning(f"[TASK] History export {export_id} no longer exists")
+        return {"status": "missing", "export_id": export_id}
+
+    if history_export.status != "pending":
+        logger.info(
+            f"[TASK] History export {export_id} is already {history_export.status}"
+        )
+        return {"status": history_export.status, "export_id": export_id}
+
+    history_export = HistoryExportService.run(history_export)
+    logger.info(
+        f"[TASK] History export {export_id} for user {history_export.user.email}: "
+        f"{history_export.status}"
+    )
+
+    return {
+        "status": history_export.status,
+        "export_id": export_id,
+        "row_counts": history_export.row_counts,
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+@shared_task(name="assistant.tasks.cleanup_history_exports", ignore_result=True)
+def cleanup_history_exports(keep_days=None):
+    """
+    Delete history exports (and their archives) older than keep_days.
+
+    Args:
+        keep_days: Days to keep exports (default: HISTORY_EXPORT_KEEP_DAYS)
+    """
+    from .models import HistoryExport
+
+    keep_days = keep_days or settings.HISTORY_EXPORT_KEEP_DAYS
+    cutoff = timezone.now() - timedelta(days=keep_days)
+
+    deleted_count = 0
+    for history_export in HistoryExport.objects.filter(created_at__lt=cutoff).iterator():
+        if history_export.file:
+            history_export.file.delete(save=False)
+        history_export.delete()
+        deleted_count += 1
+
+    logger.info(
+        f"[TASK] Deleted {deleted_count} history exports older than {keep_days} days"
+    )
+
+    return {
+        "status": "success",
+        "deleted_count": deleted_count,
+        "timestamp": timezone.now().isoformat(),
+    }
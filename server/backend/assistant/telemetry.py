@@ -0,0 +1,149 @@
+"""
+Celery task telemetry.
+
+Hooks task_prerun/task_postrun to record, for every task execution, its
+duration, worker RSS before and after, database query count and LLM token
+usage. Each execution is stored as a TaskRun row so growth can be traced per
+worker process across many tasks (see the task_telemetry_report command).
+
+Settings:
+    TASK_TELEMETRY_ENABLED: Record TaskRun rows (default True)
+    TASK_TELEMETRY_TRACEMALLOC: Also diff tracemalloc snapshots around each
+        task and store the top allocation sites (default False; slow)
+    TASK_TELEMETRY_TOP_ALLOCATIONS: Number of allocation sites kept (default 10)
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import tracemalloc
+import psutil
+from celery.signals import task_prerun, task_postrun
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_process = psutil.Process(os.getpid())
+_local = threading.local()
+
+
+def _rss_mb():
+    return _process.memory_info().rss / 1024 / 1024
+
+
+class _QueryCounter:
+    """Execute wrapper counting queries run while a task executes"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _enabled():
+    return getattr(settings, "TASK_TELEMETRY_ENABLED", True)
+
+
+def _tracemalloc_enabled():
+    return getattr(settings, "TASK_TELEMETRY_TRACEMALLOC", False)
+
+
+def _top_allocations(before, after):
+    limit = getattr(settings, "TASK_TELEMETRY_TOP_ALLOCATIONS", 10)
+    stats = after.compare_to(before, "lineno")
+    return [
+        {
+            "site": str(stat.traceback[0]),
+            "size_diff_kb": round(stat.size_diff / 1024, 1),
+            "count_diff": stat.count_diff,
+        }
+        for stat in stats[:limit]
+        if stat.size_diff > 0
+    ]
+
+
+@task_prerun.connect
+def start_task_telemetry(task_id=None, task=None, **kwargs):
+    if not _enabled():
+        return
+
+    from .services.llm_provider import llm_usage
+
+    # The worker process is forked after import, so refresh the pid
+    global _process
+    if _process.pid != os.getpid():
+        _process = psutil.Process(os.getpid())
+
+    counter = _QueryCounter()
+    connection.execute_wrappers.append(counter)
+    llm_usage.reset()
+
+    snapshot = None
+    if _tracemalloc_enabled():
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        snapshot = tracemalloc.take_snapshot()
+
+    runs = getattr(_local, "runs", None)
+    if runs is None:
+        runs = _local.runs = {}
+    runs[task_id] = {
+        "start": time.perf_counter(),
+        "rss_before": _rss_mb(),
+        "counter": counter,
+        "snapshot": snapshot,
+    }
+
+
+@task_postrun.connect
+def finish_task_telemetry(task_id=None, task=None, state=None, **kwargs):
+    run = getattr(_local, "runs", {}).pop(task_id, None)
+    if run is None:
+        return
+
+    from .models import TaskRun
+    from .services.llm_provider import llm_usage
+
+    duration_ms = (time.perf_counter() - run["start"]) * 1000
+    counter = run["counter"]
+    if counter in connection.execute_wrappers:
+        connection.execute_wrappers.remove(counter)
+
+    top_allocations = []
+    if run["snapshot"] is not None:
+        top_allocations = _top_allocations(run["snapshot"], tracemalloc.take_snapshot())
+
+    record = {
+        "task_name": task.name if task else "unknown",
+        "task_id": task_id or "",
+        "state": state or "UNKNOWN",
+        "hostname": getattr(getattr(task, "request", None), "hostname", None)
+        or socket.gethostname(),
+        "pid": os.getpid(),
+        "duration_ms": round(duration_ms, 2),
+        "rss_before_mb": round(run["rss_before"], 2),
+        "rss_after_mb": round(_rss_mb(), 2),
+        "db_queries": counter.count,
+        "llm_calls": llm_usage.calls,
+        "prompt_tokens": llm_usage.prompt_tokens,
+        "completion_tokens": llm_usage.completion_tokens,
+    }
+
+    logger.info(
+        f"[TELEMETRY] {record['task_name']} {record['state']} "
+        f"{record['duration_ms']:.0f}ms "
+        f"rss {record['rss_before_mb']:.1f}->{record['rss_after_mb']:.1f}MB "
+        f"queries={record['db_queries']} "
+        f"tokens={record['prompt_tokens']}+{record['completion_tokens']}"
+    )
+
+    try:
+        TaskRun.objects.create(top_allocations=top_allocations, **record)
+    except Exception as e:
+        # Telemetry must never fail the task itself
+        logger.warning(f"[TELEMETRY] Could not store task run {task_id}: {e}")
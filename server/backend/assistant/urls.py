@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import chat, progress_report
+from .views import chat, progress_report, history_export
 
 router = DefaultRouter()
 router.register(r"chats", chat.ChatViewSet, basename="chat")
@@ -14,6 +14,11 @@ router.register(
     progress_report.ProgressReportSettingsViewSet,
     basename="progress-report-settings",
 )
+router.register(
+    r"history-exports",
+    history_export.HistoryExportViewSet,
+    basename="history-export",
+)
 
 urlpatterns = [
     path("", include(router.urls)),
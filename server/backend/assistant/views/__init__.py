@@ -1,8 +1,10 @@
 from .chat import ChatViewSet
 from .progress_report import ProgressReportViewSet, ProgressReportSettingsViewSet
+from .history_export import HistoryExportViewSet
 
 __all__ = [
     "ChatViewSet",
     "ProgressReportViewSet",
     "ProgressReportSettingsViewSet",
+    "HistoryExportViewSet",
 ]
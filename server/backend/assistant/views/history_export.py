@@ -0,0 +1,87 @@
+import os
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse
+from django.utils import timezone
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from ..models import HistoryExport
+from ..serializers.history_export import HistoryExportSerializer
+from ..services.history_export_service import HistoryExportService
+from ..tasks import export_user_history_task
+
+
+class HistoryExportViewSet(viewsets.ModelViewSet):
+    """
+    Exports of the user's full nutrition and training history.
+
+    POST queues an export (format: parquet, arrow or csv) that a background
+    task writes; poll the export until it is completed, then fetch the zip
+    archive from its download URL.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = HistoryExportSerializer
+    http_method_names = ["get", "post"]
+
+    def get_queryset(self):
+        """Return exports for the authenticated user only"""
+        return HistoryExport.objects.filter(user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        """
+        Queue an export of the user's history.
+
+        An export that is still pending or running is returned instead of
+        starting another one (unless it outlived the task time limit).
+        """
+        stale_before = timezone.now() - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+        in_progress = (
+            self.get_queryset()
+            .filter(status__in=["pending", "running"], created_at__gte=stale_before)
+            .first()
+        )
+        if in_progress:
+            serializer = self.get_serializer(in_progress)
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        history_export = serializer.save(
+            user=request.user,
+            format=HistoryExportService.resolve_format(
+                serializer.validated_data.get("format", "parquet")
+            ),
+        )
+
+        transaction.on_commit(
+            lambda: export_user_history_task.delay(history_export.id)
+        )
+
+        return Response(
+            self.get_serializer(history_export).data, status=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, pk=None):
+        """
+        Download a completed export as a zip archive.
+        URL: /assistant/history-exports/{id}/download/
+        """
+        history_export = self.get_object()
+
+        if history_export.status != "completed" or not history_export.file:
+            return Response(
+                {"detail": "Export must be completed before downloading."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return FileResponse(
+            history_export.file.open("rb"),
+            as_attachment=True,
+            filename=os.path.basename(history_export.file.name),
+            content_type="application/zip",
+        )
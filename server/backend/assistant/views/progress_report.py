@@ -4,6 +4,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.http import FileResponse
+from accounts.models import ResourceVersion
+from backend.conditional import resource_etag
 from ..models.progress_report import ProgressReport, ProgressReportSettings
 from ..serializers.progress_report import (
     ProgressReportSerializer,
@@ -74,6 +76,7 @@ class ProgressReportViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
+    @resource_etag("progress_reports")
     def latest(self, request):
         """Get the most recent progress report (summary only)"""
         latest_report = self.get_queryset().first()
@@ -131,6 +134,9 @@ class ProgressReportViewSet(viewsets.ReadOnlyModelViewSet):
     def mark_all_read(self, request):
         """Mark all reports as read"""
         updated_count = self.get_queryset().filter(is_read=False).update(is_read=True)
+        if updated_count:
+            # update() skips the post_save receivers
+            ResourceVersion.bump([request.user.id], "progress_reports")
         return Response(
             {
                 "detail": f"Marked {updated_count} reports as read.",
@@ -149,6 +155,14 @@ class ProgressReportViewSet(viewsets.ReadOnlyModelViewSet):
         pending_reports = queryset.filter(status="pending").count()
         unread_reports = queryset.filter(is_read=False, status="generated").count()
         auto_generated = queryset.filter(auto_generated=True).count()
+        structured_parses = queryset.filter(parse_mode="structured").count()
+
+        # Share of generated reports whose LLM output validated on first try
+        parse_success_rate = (
+            round(structured_parses / generated_reports * 100, 1)
+            if generated_reports
+            else None
+        )
 
         return Response(
             {
@@ -159,6 +173,7 @@ class ProgressReportViewSet(viewsets.ReadOnlyModelViewSet):
                 "unread": unread_reports,
                 "auto_generated": auto_generated,
                 "manually_generated": total_reports - auto_generated,
+                "parse_success_rate": parse_success_rate,
             }
         )
 
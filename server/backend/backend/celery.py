@@ -1,6 +1,7 @@
 import os
 from celery import Celery
 from celery.schedules import crontab
+from kombu import Queue
 
 # Detect if we're in production
 settings_module = (
@@ -14,6 +15,51 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
 
 app = Celery("backend")
 
+# Message priority on the Redis broker (0 is served first). Tasks default to
+# CELERY_TASK_DEFAULT_PRIORITY (5); the nightly fan-out goes behind them.
+PRIORITY_BATCH = 9
+
+# Named queues. Interactive work is user-triggered and must stay responsive;
+# reports holds the long LLM-backed generations; maintenance the nightly
+# housekeeping. A worker started without -Q consumes all of them.
+QUEUE_INTERACTIVE = "interactive"
+QUEUE_REPORTS = "reports"
+QUEUE_MAINTENANCE = "maintenance"
+
+app.conf.task_queues = (
+    Queue(QUEUE_INTERACTIVE),
+    Queue(QUEUE_REPORTS),
+    Queue(QUEUE_MAINTENANCE),
+)
+app.conf.task_default_queue = QUEUE_INTERACTIVE
+
+# Exact task names win over the patterns below them
+app.conf.task_routes = {
+    "assistant.tasks.generate_progress_report_task": {"queue": QUEUE_REPORTS},
+    "assistant.tasks.test_generate_all_user_reports": {"queue": QUEUE_REPORTS},
+    "assistant.tasks.export_user_history_task": {"queue": QUEUE_REPORTS},
+    "assistant.tasks.generate_scheduled_progress_reports": {"queue": QUEUE_MAINTENANCE},
+    "assistant.tasks.cleanup_*": {"queue": QUEUE_MAINTENANCE},
+    "nutrition.tasks.daily_entry_tasks.create_daily_entry_for_single_user_task": {
+        "queue": QUEUE_INTERACTIVE
+    },
+    "nutrition.tasks.daily_entry_tasks.*": {"queue": QUEUE_MAINTENANCE},
+    "nutrition.tasks.macro_tasks.*": {"queue": QUEUE_MAINTENANCE},
+}
+
+# Worker profiles for `python manage.py run_worker <profile>`. Run one worker
+# per queue where possible so a nightly burst never occupies interactive slots;
+# "all" is for single-instance deployments.
+WORKER_PROFILES = {
+    "interactive": {"queues": [QUEUE_INTERACTIVE], "concurrency": 4},
+    "reports": {"queues": [QUEUE_REPORTS], "concurrency": 2},
+    "maintenance": {"queues": [QUEUE_MAINTENANCE], "concurrency": 1},
+    "all": {
+        "queues": [QUEUE_INTERACTIVE, QUEUE_REPORTS, QUEUE_MAINTENANCE],
+        "concurrency": 2,
+    },
+}
+
 # Load config from Django settings with CELERY namespace
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
@@ -29,6 +75,7 @@ app.conf.beat_schedule = {
         # "schedule": crontab(minute="*"),  # Every minute
         "options": {
             "expires": 3600,  # Task expires after 1 hour if not picked up
+            "priority": PRIORITY_BATCH,
         },
     },
     "cleanup-old-reports": {
@@ -38,6 +85,33 @@ app.conf.beat_schedule = {
         ),  # Sunday 12:00 AM (midnight)
         "options": {
             "expires": 7200,
+            "priority": PRIORITY_BATCH,
+        },
+    },
+    "recompute-dirty-macros": {
+        "task": "nutrition.tasks.macro_tasks.recompute_dirty_macros_task",
+        "schedule": crontab(minute=15),  # Hourly sweep
+        "options": {
+            "expires": 3000,
+            "priority": PRIORITY_BATCH,
+        },
+    },
+    "cleanup-history-exports": {
+        "task": "assistant.tasks.cleanup_history_exports",
+        "schedule": crontab(hour=1, minute=0),  # Daily 1:00 AM
+        "options": {
+            "expires": 7200,
+            "priority": PRIORITY_BATCH,
+        },
+    },
+    "cleanup-task-runs": {
+        "task": "assistant.tasks.cleanup_task_runs",
+        "schedule": crontab(
+            hour=0, minute=30, day_of_week=0
+        ),  # Sunday 12:30 AM
+        "options": {
+            "expires": 7200,
+            "priority": PRIORITY_BATCH,
         },
     },
 }
@@ -0,0 +1,57 @@
+"""
+Conditional GET for per-user read endpoints.
+
+resource_etag() builds an ETag from the user's ResourceVersion rows for the
+scopes an endpoint renders (one indexed lookup) and answers a matching
+If-None-Match with 304 Not Modified before the view queries or serializes
+anything. Versions are replaced by signal receivers and by the bulk write
+paths, see accounts.models.ResourceVersion.
+"""
+
+import hashlib
+from datetime import date
+from functools import wraps
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+from accounts.models import ResourceVersion
+
+
+def resource_etag(*scopes):
+    """
+    Add ETag / If-None-Match support to a viewset GET handler.
+
+    Besides the scope versions, the ETag covers the user, the full path
+    (query string included), the Accept header and today's date, since
+    endpoints like daily-entries/today or the account's age depend on it.
+    Responses are marked private and must be revalidated.
+
+    Args:
+        *scopes: ResourceVersion scopes the response is built from
+    """
+
+    def etag_func(request, *args, **kwargs):
+        versions = ResourceVersion.get_versions(request.user.pk, scopes)
+        key = [
+            str(request.user.pk),
+            *(f"{scope}:{version}" for scope, version in versions.items()),
+            date.today().isoformat(),
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+        ]
+        return hashlib.sha1("|".join(key).encode()).hexdigest()
+
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            @condition(etag_func=etag_func)
+            def view(request, *args, **kwargs):
+                return handler(self, request, *args, **kwargs)
+
+            response = view(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ["Authorization"])
+            return response
+
+        return wrapper
+
+    return decorator
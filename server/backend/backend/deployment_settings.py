@@ -12,6 +12,9 @@ CSRF_TRUSTED_ORIGINS = [f"https://{os.environ.get('RENDER_EXTERNAL_HOSTNAME')}"]
 DEBUG = False
 SECRET_KEY = os.environ.get("SECRET_KEY")
 
+# Benchmark factories and seeding commands are development-only
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "benchmarks"]
+
 # Cloudinary configuration
 cloudinary.config(
     cloud_name=os.environ.get("CLOUDINARY_CLOUD_NAME"),
@@ -22,6 +25,7 @@ cloudinary.config(
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "backend.instrumentation.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -40,6 +44,11 @@ STORAGES = {
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedStaticFilesStorage",
     },
+    # Cloudinary only accepts zip archives as raw files. History exports hold
+    # a user's full history, so they are private and served via signed URLs
+    "exports": {
+        "BACKEND": "backend.storage.PrivateRawCloudinaryStorage",
+    },
 }
 
 CLOUDINARY_STORAGE = {
@@ -55,6 +64,9 @@ CORS_ALLOWED_ORIGINS = [
     "https://prime-dfit.com",
 ]
 
+# Read by the exercise search hook while a catalog lookup is still running
+CORS_EXPOSE_HEADERS = ["X-Catalog-Pending"]
+
 DATABASES = {
     "default": dj_database_url.config(
         default=os.environ.get("DATABASE_URL"),
@@ -84,15 +96,29 @@ OTP_MAX_ATTEMPTS = int(os.getenv("OTP_MAX_ATTEMPTS", 5))
 
 
 # ==========================================
-# CELERY CONFIGURATION (Production - PostgreSQL)
+# CELERY CONFIGURATION (Production - Redis, or PostgreSQL fallback)
 # ==========================================
-# Convert postgresql:// to sqla+postgresql:// for Celery broker
 DATABASE_URL = os.environ.get("DATABASE_URL")
-CELERY_BROKER_URL = DATABASE_URL.replace("postgresql://", "sqla+postgresql://", 1)
-
-# Celery Result Backend
-CELERY_RESULT_BACKEND = "django-db"
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    CELERY_BROKER_URL = REDIS_URL
+    CELERY_RESULT_BACKEND = REDIS_URL
+    # Redis priority queues, 0 (highest) to 9; see PRIORITY_BATCH in
+    # backend/celery.py. Redis-only: the SQLAlchemy transport would pass
+    # these options on to create_engine(), which rejects them.
+    CELERY_BROKER_TRANSPORT_OPTIONS = {
+        "visibility_timeout": 60 * 60,  # Longer than CELERY_TASK_TIME_LIMIT
+        "queue_order_strategy": "priority",
+        "priority_steps": list(range(10)),
+        "sep": ":",
+    }
+else:
+    # Convert postgresql:// to sqla+postgresql:// for Celery broker
+    CELERY_BROKER_URL = DATABASE_URL.replace("postgresql://", "sqla+postgresql://", 1)
+    CELERY_RESULT_BACKEND = "django-db"
 CELERY_CACHE_BACKEND = "django-cache"
+CELERY_TASK_DEFAULT_PRIORITY = 5
 
 # Celery Serialization
 CELERY_ACCEPT_CONTENT = ["json"]
@@ -115,7 +141,7 @@ CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_RESULT_EXTENDED = True
 CELERY_RESULT_BACKEND_ALWAYS_RETRY = True
 CELERY_RESULT_BACKEND_MAX_RETRIES = 10
-CELERY_RESULT_EXPIRES = 60 * 60 * 24 * 7  # 7 days
+CELERY_RESULT_EXPIRES = 60 * 60 * 24  # 1 day; fire-and-forget tasks store none
 
 # Worker Settings
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
@@ -157,5 +183,6 @@ LOGGING = {
 
 # Memory optimization settings
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # Only fetch 1 task at a time
-CELERY_WORKER_MAX_TASKS_PER_CHILD = 10  # Restart worker after 10 tasks (frees memory)
+# Per-task RSS is tracked by assistant.telemetry (see task_telemetry_report);
+# the memory cap stays as a safety net instead of recycling every few tasks
 CELERY_WORKER_MAX_MEMORY_PER_CHILD = 400000  # 400MB - restart if exceeds
@@ -0,0 +1,253 @@
+"""
+Opt-in per-request SQL and timing instrumentation.
+
+RequestMetricsMiddleware samples a fraction of requests. For each sampled
+request it wraps every database connection to count queries, time them and
+fingerprint them so repeated (N+1) queries stand out. The results are
+emitted as one structured log line and folded into an in-process registry
+that metrics_view renders in the Prometheus text format.
+
+Settings:
+    REQUEST_METRICS_ENABLED: Turn the middleware on (default False)
+    REQUEST_METRICS_SAMPLE_RATE: Fraction of requests measured (default 0.1)
+    REQUEST_METRICS_TOKEN: Bearer token accepted by the metrics endpoint;
+        staff users can always read it
+"""
+
+import json
+import logging
+import random
+import re
+import threading
+import time
+from contextlib import ExitStack
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+logger = logging.getLogger("backend.request_metrics")
+
+# Upper bounds (seconds) of the request duration histogram
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_IN_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def fingerprint(sql):
+    """
+    Normalize a SQL statement so queries differing only in parameters match.
+
+    Parameters are already placeholders; inline literals and IN lists of any
+    length are collapsed as well.
+    """
+    sql = _LITERALS.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return " ".join(sql.split())
+
+
+class QueryRecorder:
+    """Database execute wrapper collecting per-request query statistics"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            key = fingerprint(sql)
+            self.fingerprints[key] = self.fingerprints.get(key, 0) + 1
+
+    def duplicates(self):
+        """Fingerprints executed more than once, most repeated first"""
+        return sorted(
+            ((sql, n) for sql, n in self.fingerprints.items() if n > 1),
+            key=lambda item: -item[1],
+        )
+
+
+class MetricsRegistry:
+    """Thread-safe per-view aggregates of sampled requests"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def record(self, view, status_code, duration, recorder):
+        duplicate_queries = sum(n - 1 for _, n in recorder.duplicates())
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = {
+                    "requests": 0,
+                    "errors": 0,
+                    "duration": 0.0,
+                    "queries": 0,
+                    "sql_duration": 0.0,
+                    "duplicate_queries": 0,
+                    "buckets": [0] * len(DURATION_BUCKETS),
+                }
+            stats["requests"] += 1
+            stats["errors"] += 1 if status_code >= 500 else 0
+            stats["duration"] += duration
+            stats["queries"] += recorder.count
+            stats["sql_duration"] += recorder.duration
+            stats["duplicate_queries"] += duplicate_queries
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    stats["buckets"][i] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                view: {**stats, "buckets": list(stats["buckets"])}
+                for view, stats in self._views.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._views.clear()
+
+    def render_prometheus(self):
+        """Render the aggregates in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family(
+            "http_request_duration_seconds",
+            "histogram",
+            "Response time of sampled requests",
+        )
+        for view, stats in sorted(snapshot.items()):
+            label = _label(view)
+            for bound, count in zip(DURATION_BUCKETS, stats["buckets"]):
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{view="{label}",le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'http_request_duration_seconds_bucket{{view="{label}",le="+Inf"}} {stats["requests"]}'
+            )
+            lines.append(
+                f'http_request_duration_seconds_sum{{view="{label}"}} {stats["duration"]:.6f}'
+            )
+            lines.append(
+                f'http_request_duration_seconds_count{{view="{label}"}} {stats["requests"]}'
+            )
+
+        counters = [
+            ("http_request_errors_total", "errors", "Sampled requests answered with a 5xx"),
+            ("http_request_db_queries_total", "queries", "SQL queries run by sampled requests"),
+            (
+                "http_request_db_duplicate_queries_total",
+                "duplicate_queries",
+                "Repeated SQL fingerprints within a sampled request (N+1 candidates)",
+            ),
+        ]
+        for name, key, help_text in counters:
+            family(name, "counter", help_text)
+            for view, stats in sorted(snapshot.items()):
+                lines.append(f'{name}{{view="{_label(view)}"}} {stats[key]}')
+
+        family(
+            "http_request_db_duration_seconds_total",
+            "counter",
+            "Time spent in SQL by sampled requests",
+        )
+        for view, stats in sorted(snapshot.items()):
+            lines.append(
+                f'http_request_db_duration_seconds_total{{view="{_label(view)}"}} '
+                f'{stats["sql_duration"]:.6f}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+registry = MetricsRegistry()
+
+
+def _view_name(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    return match.view_name or match._func_path
+
+
+class RequestMetricsMiddleware:
+    """Samples requests and records their SQL usage and response time"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_METRICS_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "REQUEST_METRICS_SAMPLE_RATE", 0.1)
+
+    def __call__(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        view = _view_name(request)
+        registry.record(view, response.status_code, duration, recorder)
+
+        duplicates = recorder.duplicates()
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request_metrics",
+                    "view": view,
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "duration_ms": round(duration * 1000, 2),
+                    "queries": recorder.count,
+                    "sql_ms": round(recorder.duration * 1000, 2),
+                    "duplicate_queries": sum(n - 1 for _, n in duplicates),
+                    "top_duplicates": [
+                        {"sql": sql[:200], "count": n} for sql, n in duplicates[:3]
+                    ],
+                }
+            )
+        )
+        return response
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint for the sampled request metrics.
+    URL: /metrics/
+
+    Figures are per process; each worker reports its own.
+    """
+    token = getattr(settings, "REQUEST_METRICS_TOKEN", "")
+    authorized = request.user.is_authenticated and request.user.is_staff
+    if token and request.headers.get("Authorization") == f"Bearer {token}":
+        authorized = True
+    if not authorized:
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        registry.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
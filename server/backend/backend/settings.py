@@ -75,10 +75,12 @@ INSTALLED_APPS = [
     "workouts",
     "assistant",
     "nutrition",
+    "benchmarks",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "backend.instrumentation.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -161,6 +163,20 @@ USE_TZ = True
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Generated history exports get their own storage alias so deployments can
+# send archives to a raw-file backend (see deployment_settings.py)
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+    "exports": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+}
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
@@ -180,12 +196,36 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_ALL_ORIGINS = True  # Allow all origins for development
 CORS_ALLOWS_CREDENTIALS = False  # set to 'False' in development otherwise it will not work with allow all origins
 
+# Read by the exercise search hook while a catalog lookup is still running
+CORS_EXPOSE_HEADERS = ["X-Catalog-Pending"]
+
 # ==========================================
-# CELERY CONFIGURATION (Development - SQLite)
+# CELERY CONFIGURATION (Development - Redis, or SQLite fallback)
 # ==========================================
-# Use SQLAlchemy broker with SQLite
-CELERY_BROKER_URL = f'sqla+sqlite:///{BASE_DIR / "db.sqlite3"}'
-CELERY_RESULT_BACKEND = "django-db"
+# Redis is the preferred broker and result backend: workers get tasks pushed
+# instead of polling broker tables in the application database. Without
+# REDIS_URL the SQLAlchemy broker on SQLite keeps plain local setups working.
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CELERY_BROKER_URL = REDIS_URL
+    CELERY_RESULT_BACKEND = REDIS_URL
+    # Priorities 0 (highest) to 9; see PRIORITY_BATCH in backend/celery.py.
+    # These options are Redis-only: the SQLAlchemy transport passes them on
+    # to create_engine(), which rejects them.
+    CELERY_BROKER_TRANSPORT_OPTIONS = {
+        "visibility_timeout": 60 * 60,  # Longer than CELERY_TASK_TIME_LIMIT
+        "queue_order_strategy": "priority",
+        "priority_steps": list(range(10)),
+        "sep": ":",
+    }
+else:
+    CELERY_BROKER_URL = f'sqla+sqlite:///{BASE_DIR / "db.sqlite3"}'
+    CELERY_RESULT_BACKEND = "django-db"
+CELERY_TASK_DEFAULT_PRIORITY = 5
+
+# Run tasks inline (no broker or worker) for tests and quick local runs
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "False") == "True"
+CELERY_TASK_EAGER_PROPAGATES = CELERY_TASK_ALWAYS_EAGER
 CELERY_CACHE_BACKEND = "django-cache"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
@@ -199,15 +239,40 @@ CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_RESULT_EXTENDED = True
 CELERY_RESULT_BACKEND_ALWAYS_RETRY = True
 CELERY_RESULT_BACKEND_MAX_RETRIES = 10
-CELERY_RESULT_EXPIRES = 60 * 60 * 24 * 7
+CELERY_RESULT_EXPIRES = 60 * 60 * 24  # Fire-and-forget tasks store no result
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 1000
 
 # Memory optimization settings
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # Only fetch 1 task at a time
-CELERY_WORKER_MAX_TASKS_PER_CHILD = 10  # Restart worker after 10 tasks (frees memory)
+# Per-task RSS is tracked by assistant.telemetry (see task_telemetry_report);
+# the memory cap stays as a safety net instead of recycling every few tasks
 CELERY_WORKER_MAX_MEMORY_PER_CHILD = 400000  # 400MB - restart if exceeds
 
+# Queue admission control (queues and routes live in backend/celery.py).
+# Each reports worker runs at most REPORT_TASK_RATE_LIMIT generations, and the
+# nightly fan-out releases reports in batches so the reports queue never holds
+# the whole user base at once. Delays stay below the broker visibility timeout.
+REPORT_TASK_RATE_LIMIT = os.getenv("REPORT_TASK_RATE_LIMIT", "20/m")
+REPORT_DISPATCH_BATCH_SIZE = int(os.getenv("REPORT_DISPATCH_BATCH_SIZE", 20))
+REPORT_DISPATCH_INTERVAL = int(os.getenv("REPORT_DISPATCH_INTERVAL", 60))
+REPORT_DISPATCH_MAX_DELAY = int(os.getenv("REPORT_DISPATCH_MAX_DELAY", 45 * 60))
+CELERY_TASK_ANNOTATIONS = {
+    "assistant.tasks.generate_progress_report_task": {
+        "rate_limit": REPORT_TASK_RATE_LIMIT
+    },
+}
+
+# History exports (assistant/services/history_export_service.py). Rows are
+# read and written CHUNK_SIZE at a time; archives are deleted after KEEP_DAYS.
+HISTORY_EXPORT_CHUNK_SIZE = int(os.getenv("HISTORY_EXPORT_CHUNK_SIZE", 2000))
+HISTORY_EXPORT_KEEP_DAYS = int(os.getenv("HISTORY_EXPORT_KEEP_DAYS", 7))
+
+# Task telemetry (assistant/telemetry.py)
+TASK_TELEMETRY_ENABLED = os.getenv("TASK_TELEMETRY_ENABLED", "True") == "True"
+TASK_TELEMETRY_TRACEMALLOC = os.getenv("TASK_TELEMETRY_TRACEMALLOC", "False") == "True"
+TASK_TELEMETRY_TOP_ALLOCATIONS = int(os.getenv("TASK_TELEMETRY_TOP_ALLOCATIONS", 10))
+
 # ==========================================
 # EMAIL CONFIGURATION (Gmail SMTP)
 # ==========================================
@@ -221,6 +286,13 @@ EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 
+# ==========================================
+# REQUEST METRICS (backend/instrumentation.py)
+# ==========================================
+REQUEST_METRICS_ENABLED = os.getenv("REQUEST_METRICS_ENABLED", "False") == "True"
+REQUEST_METRICS_SAMPLE_RATE = float(os.getenv("REQUEST_METRICS_SAMPLE_RATE", 0.1))
+REQUEST_METRICS_TOKEN = os.getenv("REQUEST_METRICS_TOKEN", "")
+
 # ==========================================
 # OTP SETTINGS
 # ==========================================
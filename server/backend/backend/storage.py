@@ -0,0 +1,58 @@
+"""
+Private file storage for production.
+
+Cloudinary serves uploads of the default "upload" delivery type to anyone
+with the URL. PrivateRawCloudinaryStorage uploads with the "authenticated"
+type instead, so an asset can only be fetched through a signed download link
+that expires, see STORAGES["exports"] in deployment_settings.
+"""
+
+import os
+import time
+import cloudinary
+import cloudinary.uploader
+import cloudinary.utils
+from cloudinary_storage.storage import RawMediaCloudinaryStorage
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class PrivateRawCloudinaryStorage(RawMediaCloudinaryStorage):
+    """Raw Cloudinary storage whose files are only reachable via signed URLs"""
+
+    DELIVERY_TYPE = "authenticated"
+
+    # Signed URLs are generated per download and only need to live that long
+    URL_EXPIRY = 60 * 5
+
+    def _upload(self, name, content):
+        options = {
+            "use_filename": True,
+            "resource_type": self._get_resource_type(name),
+            "type": self.DELIVERY_TYPE,
+            "tags": self.TAG,
+        }
+        folder = os.path.dirname(name)
+        if folder:
+            options["folder"] = folder
+        return cloudinary.uploader.upload(content, **options)
+
+    def delete(self, name):
+        response = cloudinary.uploader.destroy(
+            name,
+            invalidate=True,
+            resource_type=self._get_resource_type(name),
+            type=self.DELIVERY_TYPE,
+        )
+        return response["result"] == "ok"
+
+    def _get_url(self, name):
+        name = self._prepend_prefix(name)
+        # Raw public IDs keep their extension, so no separate format
+        return cloudinary.utils.private_download_url(
+            name,
+            "",
+            resource_type=self._get_resource_type(name),
+            type=self.DELIVERY_TYPE,
+            expires_at=int(time.time()) + self.URL_EXPIRY,
+        )
@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from .instrumentation import metrics_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -11,6 +12,8 @@ urlpatterns = [
     path("nutrition/", include("nutrition.urls")),
     # includes login & logout view
     path("api-auth/", include("rest_framework.urls")),
+    # Sampled request metrics for Prometheus
+    path("metrics/", metrics_view, name="metrics"),
 ]
 
 
@@ -0,0 +1,304 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+from accounts.models import Account, WeightHistory
+from assistant.models import Chat, Message, ProgressReport
+from nutrition.models import (
+    NutritionProfile,
+    Food,
+    DailyEntry,
+    FoodEntry,
+    DietPlan,
+    DietPlanFood,
+)
+from workouts.models import Exercise, TemplateHistory, TemplateHistoryExercise
+from workouts.services import WorkoutStatsService
+
+BATCH_SIZE = 1000
+
+# Dataset sizes; "small" is what the checked-in baseline was recorded with
+PROFILES = {
+    "small": {"users": 50, "days": 180},
+    "large": {"users": 2000, "days": 730},
+}
+
+MEAL_TYPES = [choice for choice, _ in FoodEntry.MEAL_TYPE_CHOICES]
+EXERCISE_NAMES = [
+    "Barbell Bench Press",
+    "Barbell Back Squat",
+    "Barbell Deadlift",
+    "Overhead Press",
+    "Pull-Up",
+    "Seated Cable Row",
+    "Dumbbell Bicep Curl",
+    "Triceps Pushdown",
+]
+
+
+def make_foods(count=40):
+    """Create foods with a single FatSecret-style serving each"""
+    foods = [
+        Food(
+            food_id=f"bench-{i}",
+            food_name=f"Benchmark Food {i}",
+            fatsecret_servings=[
+                {
+                    "serving_id": "1",
+                    "serving_description": "1 serving",
+                    "calories": str(100 + i * 5),
+                    "protein": str(5 + i % 20),
+                    "carbohydrate": str(10 + i % 30),
+                    "fat": str(2 + i % 10),
+                }
+            ],
+        )
+        for i in range(count)
+    ]
+    return Food.objects.bulk_create(foods)
+
+
+def make_exercises():
+    return Exercise.objects.bulk_create(
+        [Exercise(name=name, difficulty="beginner") for name in EXERCISE_NAMES]
+    )
+
+
+def make_users(count, prefix="bench"):
+    """
+    Bulk-create accounts with nutrition profiles.
+
+    Signals are skipped, so only the rows the benchmarked endpoints read
+    are created. The password hash is computed once for every user.
+    """
+    password = make_password("benchmark-password")
+    accounts = Account.objects.bulk_create(
+        [
+            Account(
+                email=f"{prefix}{i}@example.com",
+                password=password,
+                birth_date=date(1990, 1, 1),
+                gender="male" if i % 2 else "female",
+                height_ft=5,
+                height_in=i % 12,
+            )
+            for i in range(count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    NutritionProfile.objects.bulk_create(
+        [NutritionProfile(account=account) for account in accounts],
+        batch_size=BATCH_SIZE,
+    )
+    return list(Account.objects.filter(email__startswith=prefix).order_by("id"))
+
+
+def make_nutrition_history(users, foods, days, rng, entries_per_day=5):
+    """Create one DailyEntry per user per day, each with a few FoodEntries"""
+    # DailyEntryViewSet.today keys on the server date
+    today = date.today()
+    profiles = NutritionProfile.objects.filter(account__in=users)
+
+    daily_entries = []
+    for profile in profiles:
+        for offset in range(days):
+            daily_entries.append(
+                DailyEntry(nutrition_profile=profile, date=today - timedelta(days=offset))
+            )
+        if len(daily_entries) >= BATCH_SIZE:
+            DailyEntry.objects.bulk_create(daily_entries, batch_size=BATCH_SIZE)
+            daily_entries = []
+    DailyEntry.objects.bulk_create(daily_entries, batch_size=BATCH_SIZE)
+
+    food_entries = []
+    for daily_entry in DailyEntry.objects.filter(nutrition_profile__in=profiles).iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        for _ in range(entries_per_day):
+            food = rng.choice(foods)
+            serving = food.fatsecret_servings[0]
+            quantity = rng.choice([0.5, 1.0, 1.5, 2.0])
+            food_entries.append(
+                FoodEntry(
+                    daily_entry=daily_entry,
+                    food=food,
+                    meal_type=rng.choice(MEAL_TYPES),
+                    fatsecret_serving_id="1",
+                    quantity=quantity,
+                    # bulk_create skips save(), so store nutrition directly
+                    calories=round(float(serving["calories"]) * quantity, 2),
+                    protein=round(float(serving["protein"]) * quantity, 2),
+                    carbs=round(float(serving["carbohydrate"]) * quantity, 2),
+                    fat=round(float(serving["fat"]) * quantity, 2),
+                )
+            )
+        if len(food_entries) >= BATCH_SIZE:
+            FoodEntry.objects.bulk_create(food_entries, batch_size=BATCH_SIZE)
+            food_entries = []
+    FoodEntry.objects.bulk_create(food_entries, batch_size=BATCH_SIZE)
+
+    for daily_entry in DailyEntry.objects.filter(
+        nutrition_profile__account=users[0]
+    ):
+        daily_entry.calculate_totals()
+
+
+def make_weight_history(users, days, rng):
+    """Create a daily weigh-in per user drifting around a starting weight"""
+    today = date.today()
+    weigh_ins = []
+    for user in users:
+        weight = Decimal(rng.randint(6000, 9000)) / 100
+        for offset in range(days, 0, -1):
+            weight += Decimal(rng.randint(-30, 30)) / 100
+            weigh_ins.append(
+                WeightHistory(
+                    account=user,
+                    weight=weight,
+                    recorded_date=today - timedelta(days=offset - 1),
+                )
+            )
+        if len(weigh_ins) >= BATCH_SIZE:
+            WeightHistory.objects.bulk_create(weigh_ins, batch_size=BATCH_SIZE)
+            weigh_ins = []
+    WeightHistory.objects.bulk_create(weigh_ins, batch_size=BATCH_SIZE)
+
+
+def make_diet_plan(user, foods):
+    """Create a diet plan holding every food once, spread over the meals"""
+    diet_plan = DietPlan.objects.create(user_id=user)
+    DietPlanFood.bulk_add(
+        diet_plan,
+        [
+            DietPlanFood(
+                food=food,
+                meal_type=MEAL_TYPES[i % len(MEAL_TYPES)],
+                fatsecret_serving_id="1",
+                quantity=1.5,
+                order=i,
+            )
+            for i, food in enumerate(foods)
+        ],
+    )
+    return diet_plan
+
+
+def make_workout_history(users, exercises, days, rng, per_week=3):
+    """Create completed workouts every few days with performed exercises"""
+    now = timezone.now()
+    interval = max(1, 7 // per_week)
+
+    workouts = []
+    for user in users:
+        for offset in range(0, days, interval):
+            completed_at = now - timedelta(days=offset, minutes=rng.randint(0, 600))
+            started_at = completed_at - timedelta(minutes=rng.randint(30, 90))
+            workouts.append(
+                TemplateHistory(
+                    user_id=user,
+                    template_title=f"Workout {offset}",
+                    started_at=started_at,
+                    completed_at=completed_at,
+                    # bulk_create skips save(), so set the duration here
+                    total_duration=completed_at - started_at,
+                    total_exercises=4,
+                    total_sets=12,
+                )
+            )
+        if len(workouts) >= BATCH_SIZE:
+            TemplateHistory.objects.bulk_create(workouts, batch_size=BATCH_SIZE)
+            workouts = []
+    TemplateHistory.objects.bulk_create(workouts, batch_size=BATCH_SIZE)
+
+    performed = []
+    for workout in TemplateHistory.objects.filter(user_id__in=users).iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        for order, exercise in enumerate(rng.sample(exercises, 4)):
+            row = TemplateHistoryExercise(
+                workout_history=workout,
+                exercise=exercise,
+                exercise_name=exercise.name,
+                performed_sets_data=[
+                    {"reps": rng.randint(5, 12), "weight": rng.randint(20, 120)}
+                    for _ in range(3)
+                ],
+                order=order,
+                total_sets_performed=3,
+            )
+            row.refresh_set_stats()
+            performed.append(row)
+        if len(performed) >= BATCH_SIZE:
+            TemplateHistoryExercise.objects.bulk_create(performed, batch_size=BATCH_SIZE)
+            performed = []
+    TemplateHistoryExercise.objects.bulk_create(performed, batch_size=BATCH_SIZE)
+
+    for user in users:
+        WorkoutStatsService.rebuild_for_user(user.id)
+
+
+def make_assistant_history(user, messages=20, reports=12):
+    chat = Chat.objects.create(user=user, title="Benchmark chat")
+    Message.objects.bulk_create(
+        [
+            Message(
+                chat=chat,
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"Benchmark message {i}",
+            )
+            for i in range(messages)
+        ]
+    )
+
+    now = timezone.now()
+    ProgressReport.objects.bulk_create(
+        [
+            ProgressReport(
+                user=user,
+                period_start=now - timedelta(days=7 * (i + 1)),
+                period_end=now - timedelta(days=7 * i),
+                status="generated" if i % 4 else "failed",
+                parse_mode="structured" if i % 3 else "repaired",
+                is_read=i % 2 == 0,
+                auto_generated=i % 2 == 1,
+            )
+            for i in range(reports)
+        ]
+    )
+    return chat
+
+
+def seed_dataset(users=50, days=180, seed=0):
+    """
+    Seed a synthetic dataset for benchmarking.
+
+    The first user is the one every scenario runs as; the others only make
+    the tables realistically large.
+
+    Returns:
+        dict: Objects the scenarios need (user, chat, daily_entry, diet_plan)
+    """
+    rng = random.Random(seed)
+
+    foods = make_foods()
+    exercises = make_exercises()
+    accounts = make_users(users)
+
+    make_nutrition_history(accounts, foods, days, rng)
+    make_weight_history(accounts, days, rng)
+    make_workout_history(accounts, exercises, days, rng)
+
+    user = accounts[0]
+    chat = make_assistant_history(user)
+    diet_plan = make_diet_plan(user, foods)
+    daily_entry = DailyEntry.objects.get(
+        nutrition_profile__account=user, date=date.today()
+    )
+
+    return {
+        "user": user,
+        "chat": chat,
+        "daily_entry": daily_entry,
+        "diet_plan": diet_plan,
+    }
@@ -0,0 +1,113 @@
+import os
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from assistant.services.llm_provider import StubLLMProvider, set_llm_provider
+from benchmarks.factories import PROFILES, seed_dataset
+from benchmarks.runner import compare, load_baseline, measure, save_baseline
+from benchmarks.scenarios import SCENARIOS
+
+DEFAULT_BASELINE = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "baseline.json")
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic dataset in a throwaway test database, benchmark the "
+        "hot API endpoints and fail on regressions against the baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            choices=sorted(PROFILES),
+            default="small",
+            help="Dataset size (default: small, which the baseline uses)",
+        )
+        parser.add_argument("--users", type=int, help="Override the number of users")
+        parser.add_argument("--days", type=int, help="Override days of history per user")
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10,
+            help="Timed runs per scenario",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            help="Only run the named scenario (repeatable)",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=DEFAULT_BASELINE,
+            help="Baseline JSON file",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Write the results as the new baseline instead of comparing",
+        )
+        parser.add_argument(
+            "--no-time",
+            action="store_true",
+            help="Only check query counts and allocations (for noisy machines)",
+        )
+
+    def handle(self, *args, **options):
+        sizes = dict(PROFILES[options["profile"]])
+        if options["users"]:
+            sizes["users"] = options["users"]
+        if options["days"]:
+            sizes["days"] = options["days"]
+
+        scenarios = SCENARIOS
+        if options["scenario"]:
+            scenarios = [s for s in SCENARIOS if s.name in options["scenario"]]
+            unknown = set(options["scenario"]) - {s.name for s in scenarios}
+            if unknown:
+                raise CommandError(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+
+        # Chat replies come from the deterministic local provider
+        set_llm_provider(StubLLMProvider())
+
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self.stdout.write(
+                f"Seeding {sizes['users']} users x {sizes['days']} days..."
+            )
+            context = seed_dataset(**sizes)
+
+            results = {}
+            for scenario in scenarios:
+                results[scenario.name] = measure(
+                    scenario, context, iterations=options["iterations"]
+                )
+                r = results[scenario.name]
+                self.stdout.write(
+                    f"  {scenario.name:<32} {r['queries']:>4} queries  "
+                    f"median {r['median_ms']:>8.2f}ms  p95 {r['p95_ms']:>8.2f}ms  "
+                    f"peak {r['peak_kb']:>9.1f}KB"
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options["update_baseline"]:
+            baseline = load_baseline(options["baseline"])
+            baseline.update(results)
+            save_baseline(options["baseline"], baseline)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+            return
+
+        regressions = compare(
+            results, load_baseline(options["baseline"]), check_time=not options["no_time"]
+        )
+        if regressions:
+            raise CommandError(
+                "Performance regressions:\n  " + "\n  ".join(regressions)
+            )
+
+        self.stdout.write(self.style.SUCCESS("No regressions against baseline"))
@@ -0,0 +1,127 @@
+import json
+import statistics
+import time
+import tracemalloc
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+# A scenario regresses when it runs more queries than the baseline, or when
+# time/allocations grow past these ratios. Time also gets an absolute floor
+# so sub-millisecond noise on fast endpoints never fails the run.
+TIME_TOLERANCE = 2.0
+TIME_FLOOR_MS = 10.0
+ALLOCATION_TOLERANCE = 1.25
+
+
+def measure(scenario, context, iterations=10):
+    """
+    Run a scenario repeatedly and return its measurements.
+
+    Queries are counted on the first timed run (they must be identical on
+    every run). Allocations are measured in a separate run because
+    tracemalloc slows execution and would distort the timings.
+
+    Returns:
+        dict: queries, median_ms, p95_ms, peak_kb
+    """
+    client = APIClient()
+    client.force_authenticate(context["user"])
+    path, data = scenario.resolve(context)
+    call = getattr(client, scenario.method)
+
+    extra = {}
+    if scenario.revalidate:
+        # Send the first response's ETag back so every measured call is a 304
+        extra["HTTP_IF_NONE_MATCH"] = call(path, data)["ETag"]
+
+    def run():
+        if scenario.method == "get":
+            response = call(path, data, **extra)
+        else:
+            response = call(path, data, format="json", **extra)
+        if response.status_code != scenario.expected_status:
+            raise AssertionError(
+                f"{scenario.name}: expected {scenario.expected_status}, "
+                f"got {response.status_code}"
+            )
+        return response
+
+    # Warm up caches (prompt registry, catalog index, URL resolver)
+    run()
+
+    with CaptureQueriesContext(connection) as ctx:
+        run()
+    queries = len(ctx.captured_queries)
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "queries": queries,
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, check_time=True):
+    """
+    Compare results against a baseline.
+
+    Returns:
+        list: Human-readable regression messages (empty when all pass)
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+
+        if result["queries"] > expected["queries"]:
+            regressions.append(
+                f"{name}: {result['queries']} queries (baseline {expected['queries']})"
+            )
+
+        time_limit = max(
+            expected["median_ms"] * TIME_TOLERANCE,
+            expected["median_ms"] + TIME_FLOOR_MS,
+        )
+        if check_time and result["median_ms"] > time_limit:
+            regressions.append(
+                f"{name}: median {result['median_ms']}ms "
+                f"(baseline {expected['median_ms']}ms)"
+            )
+
+        if result["peak_kb"] > expected["peak_kb"] * ALLOCATION_TOLERANCE:
+            regressions.append(
+                f"{name}: peak {result['peak_kb']}KB allocated "
+                f"(baseline {expected['peak_kb']}KB)"
+            )
+
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
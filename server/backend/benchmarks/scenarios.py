@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmarked API call.
+
+    `path` and `data` may reference the seeded objects with str.format
+    fields, e.g. "{daily_entry.id}". With `revalidate`, the ETag of a first
+    response is sent back as If-None-Match, measuring the 304 path.
+    """
+
+    name: str
+    path: str
+    method: str = "get"
+    data: dict = field(default_factory=dict)
+    expected_status: int = 200
+    revalidate: bool = False
+
+    def resolve(self, context):
+        path = self.path.format(**context)
+        data = {key: str(value).format(**context) for key, value in self.data.items()}
+        return path, data
+
+
+SCENARIOS = [
+    Scenario(
+        name="daily_entries_today",
+        path="/nutrition/daily-entries/today/",
+    ),
+    Scenario(
+        name="daily_entries_today_not_modified",
+        path="/nutrition/daily-entries/today/",
+        revalidate=True,
+        expected_status=304,
+    ),
+    Scenario(
+        name="daily_entry_with_meals_detail",
+        path="/nutrition/daily-entries/{daily_entry.id}/with_meals_detail/",
+    ),
+    Scenario(
+        name="daily_entries_history",
+        path="/nutrition/daily-entries/history/",
+        data={"page_size": 30},
+    ),
+    Scenario(
+        name="food_entries_by_daily_entry",
+        path="/nutrition/food-entries/by_daily_entry/",
+        data={"daily_entry_id": "{daily_entry.id}"},
+    ),
+    Scenario(
+        name="diet_plan_detail",
+        path="/nutrition/diet-plans/{diet_plan.id}/",
+    ),
+    Scenario(
+        name="diet_plan_detail_not_modified",
+        path="/nutrition/diet-plans/{diet_plan.id}/",
+        revalidate=True,
+        expected_status=304,
+    ),
+    Scenario(
+        name="diet_plan_duplicate",
+        path="/nutrition/diet-plans/{diet_plan.id}/duplicate/",
+        method="post",
+        expected_status=201,
+    ),
+    Scenario(
+        name="weight_history",
+        path="/accounts/weight-history/",
+    ),
+    Scenario(
+        name="workout_history",
+        path="/workouts/templates/workout_history/",
+    ),
+    Scenario(
+        name="workout_stats",
+        path="/workouts/templates/workout_stats/",
+    ),
+    Scenario(
+        name="progress_report_stats",
+        path="/assistant/progress-reports/stats/",
+    ),
+    Scenario(
+        name="chat_send",
+        path="/assistant/chats/{chat.id}/send/",
+        method="post",
+        data={"message": "How was my training this month?"},
+    ),
+]
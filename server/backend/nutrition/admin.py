@@ -1,44 +1,32 @@
 from django.contrib import admin
 from django.contrib.admin import actions
 from django.contrib import messages
+from django.db import transaction
 from accounts.models import Account
 from .models import NutritionProfile, Food, DailyEntry, FoodEntry
+from .services import BulkMacroCalculator
 
 
 @admin.action(description="Create nutrition profiles for selected accounts")
 def create_nutrition_profiles_for_accounts(modeladmin, request, queryset):
     """Admin action to create nutrition profiles for selected accounts"""
-    created_count = 0
-    skipped_count = 0
-    warning_count = 0
-
-    for account in queryset:
-        # Check if account already has a nutrition profile
-        if hasattr(account, "nutrition_profile"):
-            skipped_count += 1
-            continue
-
-        try:
-            # Create nutrition profile - the save method will handle macro calculation
-            nutrition_profile = NutritionProfile.objects.create(account=account)
-
-            # Check if defaults were used (indicates incomplete profile)
-            profile = getattr(account, "profile", None)
-            if not profile or not nutrition_profile._has_complete_profile_data(profile):
-                warning_count += 1
-                messages.warning(
-                    request,
-                    f"Created nutrition profile for {account.email} using default values. "
-                    f"User should complete their fitness profile for personalized macros.",
-                )
-
-            created_count += 1
-
-        except Exception as e:
-            messages.error(
-                request,
-                f"Error creating nutrition profile for {account.email}: {str(e)}",
+    skipped_count = queryset.filter(nutrition_profile__isnull=False).count()
+    accounts = list(queryset.filter(nutrition_profile__isnull=True))
+
+    try:
+        # bulk_create skips save(), so the bulk calculator fills in the macros
+        with transaction.atomic():
+            created = NutritionProfile.objects.bulk_create(
+                [NutritionProfile(account=account) for account in accounts]
             )
+            stats = BulkMacroCalculator.run(
+                NutritionProfile.objects.filter(account__in=accounts)
+            )
+        created_count = len(created)
+        warning_count = stats["defaults"]
+    except Exception as e:
+        messages.error(request, f"Error creating nutrition profiles: {str(e)}")
+        return
 
     # Show summary messages
     if created_count > 0:
@@ -112,22 +100,20 @@ class NutritionProfileAdmin(admin.ModelAdmin):
     @admin.action(description="Recalculate macros for selected profiles")
     def recalculate_macros_action(self, request, queryset):
         """Recalculate macros for selected nutrition profiles"""
-        updated_count = 0
-
-        for profile in queryset:
-            try:
-                profile.update_macros()
-                updated_count += 1
-            except Exception as e:
-                messages.error(
-                    request,
-                    f"Error updating macros for {profile.account.email}: {str(e)}",
-                )
+        # Columnar calculation with chunked bulk_update instead of a save
+        # (and signal cascade) per row
+        try:
+            stats = BulkMacroCalculator.run(queryset)
+        except Exception as e:
+            messages.error(request, f"Error updating macros: {str(e)}")
+            return
 
-        if updated_count > 0:
+        if stats["profiles"] > 0:
             messages.success(
                 request,
-                f"Successfully recalculated macros for {updated_count} profile(s).",
+                f"Recalculated macros: {stats['profiles']} profile(s) checked, "
+                f"{stats['changed']} updated, {stats['defaults']} using default "
+                f"values (incomplete profile).",
             )
 
     def save_model(self, request, obj, form, change):
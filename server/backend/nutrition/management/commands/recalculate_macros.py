@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from nutrition.models import NutritionProfile
+from nutrition.services.macro_engine import BulkMacroCalculator
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate BMI, BMR, TDEE and macro goals for nutrition profiles in "
+        "bulk (e.g. after changing a formula constant)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            help="Only recalculate this account (repeatable)",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=BulkMacroCalculator.CHUNK_SIZE,
+            help=f"Profiles per batch (default: {BulkMacroCalculator.CHUNK_SIZE})",
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many profiles would change without writing",
+        )
+
+    def handle(self, *args, **options):
+        queryset = NutritionProfile.objects.all()
+        if options["user_id"]:
+            queryset = queryset.filter(account_id__in=options["user_id"])
+
+        stats = BulkMacroCalculator.run(
+            queryset, chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+        )
+
+        verb = "would change" if options["dry_run"] else "updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{stats['profiles']} profile(s) checked, {stats['changed']} {verb}, "
+                f"{stats['defaults']} using default values (incomplete profile)"
+            )
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nutrition', '0010_remove_dietplan_meal_plan_dietplanfood_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nutritionprofile',
+            name='macro_inputs_hash',
+            field=models.CharField(blank=True, default='', help_text='Fingerprint of the inputs the current macros were calculated from', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='nutritionprofile',
+            name='macros_dirty',
+            field=models.BooleanField(db_index=True, default=False, help_text='Profile inputs changed; macros are queued for recalculation'),
+        ),
+    ]
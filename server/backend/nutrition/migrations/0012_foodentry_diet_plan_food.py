@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nutrition', '0011_nutritionprofile_macro_recompute'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foodentry',
+            name='diet_plan_food',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='logged_entries', to='nutrition.dietplanfood'),
+        ),
+        migrations.AddConstraint(
+            model_name='foodentry',
+            constraint=models.UniqueConstraint(fields=('daily_entry', 'diet_plan_food'), name='unique_diet_plan_food_per_day'),
+        ),
+    ]
@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from accounts.models import ResourceVersion
 from .profile import NutritionProfile
 from .food import Food
 
@@ -30,18 +34,14 @@ class DailyEntry(models.Model):
 
     def calculate_totals(self):
         """Calculate total nutrition from all food entries for this day"""
-        food_entries = self.food_entries.all()
-        totals = {
-            "total_calories": 0.0,
-            "total_protein": 0.0,
-            "total_carbs": 0.0,
-            "total_fat": 0.0,
-        }
-
-        for entry in food_entries:
-            entry_nutrition = entry.get_nutrition_totals()
-            for key in totals:
-                totals[key] += entry_nutrition.get(key.replace("total_", ""), 0.0)
+        # Aggregated in the database so a prefetched (possibly stale)
+        # food_entries cache on this instance is never used
+        totals = FoodEntry.objects.filter(daily_entry=self).aggregate(
+            total_calories=Coalesce(Sum("calories"), 0.0),
+            total_protein=Coalesce(Sum("protein"), 0.0),
+            total_carbs=Coalesce(Sum("carbs"), 0.0),
+            total_fat=Coalesce(Sum("fat"), 0.0),
+        )
 
         for key, value in totals.items():
             setattr(self, key, round(value, 2))
@@ -49,12 +49,93 @@ class DailyEntry(models.Model):
 
         return totals
 
+    @classmethod
+    def bulk_calculate_totals(cls, daily_entries):
+        """
+        Recalculate the totals of several daily entries at once.
+
+        One grouped aggregate and one bulk_update replace a
+        calculate_totals() call per day.
+
+        Args:
+            daily_entries: DailyEntry instances to update in place
+        """
+        daily_entries = list(daily_entries)
+        if not daily_entries:
+            return
+
+        totals = {
+            row["daily_entry_id"]: row
+            for row in FoodEntry.objects.filter(daily_entry__in=daily_entries)
+            .order_by()
+            .values("daily_entry_id")
+            .annotate(
+                total_calories=Sum("calories"),
+                total_protein=Sum("protein"),
+                total_carbs=Sum("carbs"),
+                total_fat=Sum("fat"),
+            )
+        }
+
+        fields = ["total_calories", "total_protein", "total_carbs", "total_fat"]
+        now = timezone.now()
+        for daily_entry in daily_entries:
+            row = totals.get(daily_entry.pk, {})
+            for field in fields:
+                setattr(daily_entry, field, round(row.get(field) or 0.0, 2))
+            daily_entry.updated_at = now
+
+        cls.objects.bulk_update(daily_entries, fields + ["updated_at"])
+        # bulk_update (and the callers' bulk_create) skip the post_save receivers
+        cls.bump_versions(daily_entries)
+
+    @staticmethod
+    def bump_versions(daily_entries):
+        """Give the owners of these daily entries a new nutrition version"""
+        profile_ids = {entry.nutrition_profile_id for entry in daily_entries}
+        ResourceVersion.bump(
+            NutritionProfile.objects.filter(pk__in=profile_ids).values_list(
+                "account_id", flat=True
+            ),
+            "nutrition",
+        )
+
+    @staticmethod
+    def food_entries_prefetch():
+        """Prefetch for food entries with their foods, in breakdown order"""
+        return models.Prefetch(
+            "food_entries",
+            queryset=FoodEntry.objects.select_related("food").order_by(
+                "meal_type", "created_at"
+            ),
+        )
+
+    def get_food_entries(self):
+        """
+        Get this day's food entries with their foods.
+
+        Uses the prefetched entries when the queryset applied
+        food_entries_prefetch(); otherwise loads them in one query and keeps
+        them cached on the instance.
+        """
+        if "food_entries" not in getattr(self, "_prefetched_objects_cache", {}):
+            models.prefetch_related_objects([self], self.food_entries_prefetch())
+        return list(self.food_entries.all())
+
+    def group_food_entries(self):
+        """Partition the food entries by meal type in a single pass"""
+        grouped = {meal_type: [] for meal_type, _ in FoodEntry.MEAL_TYPE_CHOICES}
+        for entry in self.get_food_entries():
+            grouped.setdefault(entry.meal_type, []).append(entry)
+        return grouped
+
     def get_meals_breakdown(self):
         """Get nutrition breakdown by meal type"""
         meal_breakdown = {}
+        grouped = self.group_food_entries()
 
         for meal_type, meal_name in FoodEntry.MEAL_TYPE_CHOICES:
-            entries = self.food_entries.filter(meal_type=meal_type)
+            entries = grouped[meal_type]
             totals = {
                 "calories": 0.0,
                 "protein": 0.0,
@@ -97,6 +178,15 @@ class FoodEntry(models.Model):
     )
     food = models.ForeignKey(Food, on_delete=models.CASCADE)
 
+    # Diet plan item this entry was logged from (when a plan was applied)
+    diet_plan_food = models.ForeignKey(
+        "DietPlanFood",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="logged_entries",
+    )
+
     # Meal categorization
     meal_type = models.CharField(max_length=20, choices=MEAL_TYPE_CHOICES)
 
@@ -140,6 +230,13 @@ class FoodEntry(models.Model):
         verbose_name = "Food Entry"
         verbose_name_plural = "Food Entries"
         ordering = ["daily_entry__date", "meal_type", "created_at"]
+        constraints = [
+            # Applying the same diet plan to a day twice logs each item once
+            models.UniqueConstraint(
+                fields=["daily_entry", "diet_plan_food"],
+                name="unique_diet_plan_food_per_day",
+            )
+        ]
 
     def save(self, *args, **kwargs):
         """Override save to calculate nutrition values before saving"""
@@ -1,7 +1,11 @@
-from django.db import models
-from accounts.models import Account
+from django.db import models, transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from accounts.models import Account, ResourceVersion
 from .food import Food
 
+NUTRITION_FIELDS = ("calories", "protein", "carbs", "fat")
+
 
 class DietPlan(models.Model):
     """Diet plan container - similar to Template in workouts app"""
@@ -32,19 +36,19 @@ class DietPlan(models.Model):
         return f"{self.user_id.email} - Diet Plan{alt_text}"
 
     def calculate_totals(self):
-        """Calculate total nutrition from all meal items in this diet plan"""
-        meal_items = self.diet_plan_foods.all()
-        totals = {
-            "total_calories": 0.0,
-            "total_protein": 0.0,
-            "total_carbs": 0.0,
-            "total_fat": 0.0,
-        }
-
-        for item in meal_items:
-            item_nutrition = item.get_nutrition_totals()
-            for key in totals:
-                totals[key] += item_nutrition.get(key.replace("total_", ""), 0.0)
+        """
+        Recalculate total nutrition from all meal items in this diet plan.
+
+        Item saves and deletes keep the totals up to date by deltas (see
+        apply_totals_delta); this full recalculation repairs totals that
+        drifted, e.g. after a queryset delete.
+        """
+        totals = DietPlanFood.objects.filter(diet_plan=self).aggregate(
+            total_calories=Coalesce(Sum("calories"), 0.0),
+            total_protein=Coalesce(Sum("protein"), 0.0),
+            total_carbs=Coalesce(Sum("carbs"), 0.0),
+            total_fat=Coalesce(Sum("fat"), 0.0),
+        )
 
         for key, value in totals.items():
             setattr(self, key, round(value, 2))
@@ -52,12 +56,70 @@ class DietPlan(models.Model):
 
         return totals
 
+    def apply_totals_delta(self, delta):
+        """
+        Add a nutrition delta to the stored plan totals.
+
+        The plan row is locked while its totals are read and rewritten, so
+        concurrent item changes cannot overwrite each other's deltas.
+
+        Args:
+            delta: Dict with calories, protein, carbs and fat to add
+                (negative values subtract)
+        """
+        if not any(delta.values()):
+            return
+
+        total_fields = [f"total_{key}" for key in NUTRITION_FIELDS]
+        with transaction.atomic():
+            current = (
+                DietPlan.objects.select_for_update()
+                .values(*total_fields)
+                .get(pk=self.pk)
+            )
+            for key in NUTRITION_FIELDS:
+                field = f"total_{key}"
+                setattr(
+                    self, field, max(0.0, round(current[field] + delta.get(key, 0.0), 2))
+                )
+            self.save(update_fields=total_fields + ["updated_at"])
+
+    @staticmethod
+    def diet_plan_foods_prefetch():
+        """Prefetch for meal items with their foods, in plan order"""
+        return models.Prefetch(
+            "diet_plan_foods",
+            queryset=DietPlanFood.objects.select_related("food").order_by(
+                "meal_type", "order", "created_at"
+            ),
+        )
+
+    def get_diet_plan_foods(self):
+        """
+        Get this plan's meal items with their foods.
+
+        Uses the prefetched items when the queryset applied
+        diet_plan_foods_prefetch(); otherwise loads them in one query and
+        keeps them cached on the instance.
+        """
+        if "diet_plan_foods" not in getattr(self, "_prefetched_objects_cache", {}):
+            models.prefetch_related_objects([self], self.diet_plan_foods_prefetch())
+        return list(self.diet_plan_foods.all())
+
+    def group_diet_plan_foods(self):
+        """Partition the meal items by meal type in a single pass"""
+        grouped = {meal_type: [] for meal_type, _ in DietPlanFood.MEAL_TYPE_CHOICES}
+        for item in self.get_diet_plan_foods():
+            grouped.setdefault(item.meal_type, []).append(item)
+        return grouped
+
     def get_meals_breakdown(self):
         """Get nutrition breakdown by meal type"""
         meal_breakdown = {}
+        grouped = self.group_diet_plan_foods()
 
         for meal_type, meal_name in DietPlanFood.MEAL_TYPE_CHOICES:
-            items = self.diet_plan_foods.filter(meal_type=meal_type)
+            items = grouped[meal_type]
             totals = {
                 "calories": 0.0,
                 "protein": 0.0,
@@ -165,18 +227,132 @@ class DietPlanFood(models.Model):
         )  # Prevent duplicate foods in same meal
         ordering = ["meal_type", "order", "created_at"]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if all(name in field_names for name in ("diet_plan_id", *NUTRITION_FIELDS)):
+            instance._remember_saved_nutrition()
+        return instance
+
+    def _remember_saved_nutrition(self):
+        """Record the plan and nutrition values as stored in the database"""
+        self._saved_nutrition = {
+            "diet_plan_id": self.diet_plan_id,
+            **self.get_nutrition_totals(),
+        }
+
+    def _get_saved_nutrition(self):
+        """Plan and nutrition values stored for this item (None if unsaved)"""
+        if self._state.adding:
+            return None
+        saved = getattr(self, "_saved_nutrition", None)
+        if saved is None:
+            saved = (
+                DietPlanFood.objects.filter(pk=self.pk)
+                .values("diet_plan_id", *NUTRITION_FIELDS)
+                .first()
+            )
+        return saved
+
     def save(self, *args, **kwargs):
-        """Override save to calculate nutrition values before saving"""
+        """
+        Override save to calculate nutrition values before saving, then
+        adjust the diet plan totals by the change in this item's nutrition
+        """
+        saved = self._get_saved_nutrition()
         self.calculate_nutrition()
-        super().save(*args, **kwargs)
-        # Recalculate diet plan totals after saving
-        self.diet_plan.calculate_totals()
+        current = self.get_nutrition_totals()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if saved is None or saved["diet_plan_id"] == self.diet_plan_id:
+                previous = saved or dict.fromkeys(NUTRITION_FIELDS, 0.0)
+                self.diet_plan.apply_totals_delta(
+                    {key: current[key] - previous[key] for key in NUTRITION_FIELDS}
+                )
+            else:
+                # Moved to another plan: take it out of the old plan's totals
+                DietPlan(pk=saved["diet_plan_id"]).apply_totals_delta(
+                    {key: -saved[key] for key in NUTRITION_FIELDS}
+                )
+                self.diet_plan.apply_totals_delta(current)
+
+        self._remember_saved_nutrition()
 
     def delete(self, *args, **kwargs):
-        """Override delete to recalculate diet plan totals after deletion"""
+        """Override delete to subtract this item from the diet plan totals"""
+        saved = self._get_saved_nutrition()
         diet_plan = self.diet_plan
-        super().delete(*args, **kwargs)
-        diet_plan.calculate_totals()
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            if saved is not None:
+                diet_plan.apply_totals_delta(
+                    {key: -saved[key] for key in NUTRITION_FIELDS}
+                )
+
+        return result
+
+    @classmethod
+    def bulk_add(cls, diet_plan, items):
+        """
+        Add several meal items to a diet plan at once.
+
+        Nutrition is calculated in memory (each item's food must already be
+        set), the items are inserted with one bulk_create and the plan totals
+        are adjusted once instead of after every item.
+
+        Args:
+            diet_plan: DietPlan to add the items to
+            items: Unsaved DietPlanFood instances
+
+        Returns:
+            list: The created DietPlanFood instances
+        """
+        delta = dict.fromkeys(NUTRITION_FIELDS, 0.0)
+        for item in items:
+            item.diet_plan = diet_plan
+            item.calculate_nutrition()
+            for key, value in item.get_nutrition_totals().items():
+                delta[key] += value
+
+        with transaction.atomic():
+            created = cls.objects.bulk_create(items)
+            diet_plan.apply_totals_delta(delta)
+            if not any(delta.values()):
+                # No totals save either, and bulk_create skips the receivers
+                ResourceVersion.bump([diet_plan.user_id_id], "diet_plans")
+
+        for item in created:
+            item._remember_saved_nutrition()
+
+        # Drop a prefetched item list that no longer matches the plan
+        getattr(diet_plan, "_prefetched_objects_cache", {}).pop("diet_plan_foods", None)
+        return created
+
+    def copy(self, **overrides):
+        """
+        Build an unsaved copy of this item for bulk_add.
+
+        Args:
+            **overrides: Field values to change on the copy (e.g. meal_type)
+
+        Returns:
+            DietPlanFood: The unsaved copy, sharing this item's food
+        """
+        values = {
+            "food": self.food,
+            "meal_type": self.meal_type,
+            "serving_type": self.serving_type,
+            "fatsecret_serving_id": self.fatsecret_serving_id,
+            "custom_serving_unit": self.custom_serving_unit,
+            "custom_serving_amount": self.custom_serving_amount,
+            "quantity": self.quantity,
+            "order": self.order,
+        }
+        values.update(overrides)
+        return DietPlanFood(**values)
 
     def get_nutrition_totals(self):
         """Get nutrition totals as a dictionary"""
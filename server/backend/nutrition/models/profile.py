@@ -1,3 +1,4 @@
+import hashlib
 from django.db import models
 from accounts.models import Account
 
@@ -55,9 +56,39 @@ class NutritionProfile(models.Model):
         default=True, help_text="Whether macros were auto-calculated or manually set"
     )
 
+    # Coalesced recomputation (see MacroRecomputeService)
+    macros_dirty = models.BooleanField(
+        default=False,
+        db_index=True,
+        help_text="Profile inputs changed; macros are queued for recalculation",
+    )
+    macro_inputs_hash = models.CharField(
+        max_length=40,
+        blank=True,
+        default="",
+        help_text="Fingerprint of the inputs the current macros were calculated from",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Formula constants, shared with the bulk calculator (services/macro_engine.py)
+    ACTIVITY_MULTIPLIERS = {
+        "sedentary": 1.2,
+        "lightly_active": 1.375,
+        "moderately_active": 1.55,
+        "very_active": 1.725,
+    }
+    DEFAULT_ACTIVITY_MULTIPLIER = 1.55
+
+    GOAL_CALORIE_ADJUSTMENTS = {
+        "lose_weight": -500,
+        "gain_weight": +500,
+        "maintain_weight": 0,
+        "gain_muscle": +300,
+        "build_strength": +200,
+    }
+
     class Meta:
         db_table = "nutrition_profiles"
         verbose_name = "Nutrition Profile"
@@ -67,6 +98,7 @@ class NutritionProfile(models.Model):
         """Override save to ensure BMR, TDEE, and BMI are calculated before saving"""
         if not self.pk or not self.bmr or not self.tdee or not self.bmi:
             macros = self.calculate_macros()
+            self.macro_inputs_hash = self.macro_inputs_fingerprint()
 
             self.bmi = macros["bmi"]
             self.bmr = macros["bmr"]
@@ -121,6 +153,35 @@ class NutritionProfile(models.Model):
         else:
             return "Obese"
 
+    def macro_inputs_fingerprint(self):
+        """
+        Fingerprint the inputs calculate_macros() reads.
+
+        Weight, height, age, gender, activity level and body goal; when the
+        fingerprint matches macro_inputs_hash the stored macros are current.
+        """
+        profile = getattr(self.account, "profile", None)
+        try:
+            age = self.account.age
+        except (AttributeError, TypeError):
+            age = None
+
+        inputs = [
+            self.account.height_ft,
+            self.account.height_in,
+            self.account.gender,
+            age,
+        ]
+        if profile:
+            inputs += [profile.starting_weight, profile.activity_level, profile.body_goal]
+
+        return self.fingerprint_inputs(inputs)
+
+    @staticmethod
+    def fingerprint_inputs(inputs):
+        """Hash a list of macro inputs (see macro_inputs_fingerprint)"""
+        return hashlib.sha1("|".join(map(str, inputs)).encode()).hexdigest()
+
     def calculate_macros(self):
         """Calculate daily macros based on user's profile data"""
         profile = getattr(self.account, "profile", None)
@@ -151,35 +212,17 @@ class NutritionProfile(models.Model):
                 bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * user_age) - 161
 
             # Calculate TDEE
-            activity_multipliers = {
-                "sedentary": 1.2,
-                "lightly_active": 1.375,
-                "moderately_active": 1.55,
-                "very_active": 1.725,
-            }
-
-            multiplier = activity_multipliers.get(profile.activity_level, 1.55)
+            multiplier = self.ACTIVITY_MULTIPLIERS.get(
+                profile.activity_level, self.DEFAULT_ACTIVITY_MULTIPLIER
+            )
             tdee = bmr * multiplier
 
             # Adjust calories based on goal
-            goal_adjustments = {
-                "lose_weight": -500,
-                "gain_weight": +500,
-                "maintain_weight": 0,
-                "gain_muscle": +300,
-                "build_strength": +200,
-            }
-
-            calorie_adjustment = goal_adjustments.get(profile.body_goal, 0)
+            calorie_adjustment = self.GOAL_CALORIE_ADJUSTMENTS.get(profile.body_goal, 0)
             daily_calories = int(tdee + calorie_adjustment)
 
             # Calculate macro ratios based on goal
-            if profile.body_goal in ["gain_muscle", "build_strength"]:
-                protein_ratio, carb_ratio, fat_ratio = 0.30, 0.40, 0.30
-            elif profile.body_goal == "lose_weight":
-                protein_ratio, carb_ratio, fat_ratio = 0.35, 0.35, 0.30
-            else:
-                protein_ratio, carb_ratio, fat_ratio = 0.25, 0.45, 0.30
+            protein_ratio, carb_ratio, fat_ratio = self.macro_ratios(profile.body_goal)
 
             # Calculate macro amounts
             daily_protein = (daily_calories * protein_ratio) / 4
@@ -202,6 +245,15 @@ class NutritionProfile(models.Model):
         except (AttributeError, TypeError, ValueError):
             return self._get_default_macros()
 
+    @staticmethod
+    def macro_ratios(body_goal):
+        """Protein, carb and fat shares of daily calories for a body goal"""
+        if body_goal in ["gain_muscle", "build_strength"]:
+            return 0.30, 0.40, 0.30
+        elif body_goal == "lose_weight":
+            return 0.35, 0.35, 0.30
+        return 0.25, 0.45, 0.30
+
     def _has_complete_profile_data(self, profile):
         """Check if the user profile has all required data"""
         try:
@@ -225,7 +277,12 @@ class NutritionProfile(models.Model):
 
     def _get_default_macros(self):
         """Default macros when profile data is not available"""
-        if hasattr(self.account, "gender") and self.account.gender == "male":
+        return self.default_macros(getattr(self.account, "gender", None))
+
+    @staticmethod
+    def default_macros(gender):
+        """Default macros for a gender when profile data is incomplete"""
+        if gender == "male":
             default_calories = 2200
         else:
             default_calories = 1800
@@ -240,9 +297,21 @@ class NutritionProfile(models.Model):
             "daily_fat_goal": round(default_calories * 0.30 / 9, 1),
         }
 
-    def update_macros(self):
-        """Recalculate and update macro goals"""
+    def apply_macros(self):
+        """
+        Set freshly calculated macros and the input fingerprint, without saving
+
+        Returns:
+            list: Names of the fields that were set
+        """
         macros = self.calculate_macros()
         for key, value in macros.items():
             setattr(self, key, value)
+        self.macro_inputs_hash = self.macro_inputs_fingerprint()
+        self.macros_dirty = False
+        return list(macros) + ["macro_inputs_hash", "macros_dirty"]
+
+    def update_macros(self):
+        """Recalculate and update macro goals"""
+        self.apply_macros()
         self.save()
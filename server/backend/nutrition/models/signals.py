@@ -2,10 +2,12 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.db import models
 
-from accounts.models import Account, Profile
+from accounts.models import Account, Profile, ResourceVersion
+from accounts.models.signals import deleted_with_account
 from .profile import NutritionProfile
-from .daily_entry import FoodEntry
-from .diet_plan import DietPlan
+from .food import Food
+from .daily_entry import DailyEntry, FoodEntry
+from .diet_plan import DietPlan, DietPlanFood
 
 
 @receiver(post_save, sender=Account)
@@ -15,15 +17,35 @@ def create_nutrition_profile(sender, instance, created, **kwargs):
         NutritionProfile.objects.create(account=instance)
 
 
+# Account fields that feed the macro calculation
+MACRO_ACCOUNT_FIELDS = {"height_ft", "height_in", "birth_date", "gender"}
+
+
+@receiver(post_save, sender=Account)
+def queue_macros_for_account(sender, instance, created, update_fields=None, **kwargs):
+    """Queue macro recalculation when body data on the account changes"""
+    if created:
+        return
+    if update_fields is not None and not MACRO_ACCOUNT_FIELDS & set(update_fields):
+        return  # e.g. last_login on every sign-in
+
+    from ..services import MacroRecomputeService
+
+    MacroRecomputeService.mark_dirty([instance.pk])
+
+
 @receiver(post_save, sender=Profile)
 def update_nutrition_profile(sender, instance, update_fields=None, **kwargs):
-    """Update nutrition profile when user profile changes"""
-    nutrition_profile = getattr(instance.account, "nutrition_profile", None)
-
-    if update_fields is not None and update_fields == {"current_weight"}:
+    """Queue macro recalculation when user profile changes"""
+    if update_fields is not None and set(update_fields) <= {
+        "current_weight",
+        "updated_at",
+    }:
         return
-    if nutrition_profile:
-        nutrition_profile.update_macros()
+
+    from ..services import MacroRecomputeService
+
+    MacroRecomputeService.mark_dirty([instance.account_id])
 
 
 @receiver(post_save, sender=FoodEntry)
@@ -49,3 +71,71 @@ def create_user_diet_plans(sender, instance, created, **kwargs):
         DietPlan.objects.create(user_id=instance, is_alternative=True)
 
         print(f"Created diet plans for user: {instance.email}")
+
+
+# Resource versions (ETags of the nutrition read endpoints). FoodEntry
+# changes are covered by the DailyEntry save in update_daily_totals.
+
+
+@receiver(post_save, sender=NutritionProfile)
+@receiver(models.signals.post_delete, sender=NutritionProfile)
+def bump_nutrition_profile_version(sender, instance, origin=None, **kwargs):
+    """Goals are shown on the nutrition profile and every daily entry"""
+    if deleted_with_account(origin):
+        return
+    ResourceVersion.bump([instance.account_id], "nutrition")
+
+
+@receiver(post_save, sender=DailyEntry)
+@receiver(models.signals.post_delete, sender=DailyEntry)
+def bump_daily_entry_version(sender, instance, origin=None, **kwargs):
+    """Bump the nutrition version when a daily entry or its totals change"""
+    if deleted_with_account(origin):
+        return
+    DailyEntry.bump_versions([instance])
+
+
+@receiver(post_save, sender=DietPlan)
+@receiver(models.signals.post_delete, sender=DietPlan)
+def bump_diet_plan_version(sender, instance, origin=None, **kwargs):
+    """Bump the diet plan version when a plan or its totals change"""
+    if deleted_with_account(origin):
+        return
+    ResourceVersion.bump([instance.user_id_id], "diet_plans")
+
+
+@receiver(post_save, sender=DietPlanFood)
+@receiver(models.signals.post_delete, sender=DietPlanFood)
+def bump_diet_plan_food_version(sender, instance, origin=None, **kwargs):
+    """Meal item changes that leave the plan totals alone still show up"""
+    if deleted_with_account(origin):
+        return
+
+    if DietPlanFood.diet_plan.is_cached(instance):
+        account_ids = [instance.diet_plan.user_id_id]
+    else:
+        # e.g. items deleted along with their plan
+        account_ids = DietPlan.objects.filter(pk=instance.diet_plan_id).values_list(
+            "user_id", flat=True
+        )
+    ResourceVersion.bump(account_ids, "diet_plans")
+
+
+@receiver(post_save, sender=Food)
+def bump_food_versions(sender, instance, created, **kwargs):
+    """Foods are shared: bump every account that logged or planned this one"""
+    if created:
+        return
+
+    ResourceVersion.bump(
+        FoodEntry.objects.filter(food=instance)
+        .values_list("daily_entry__nutrition_profile__account_id", flat=True)
+        .distinct(),
+        "nutrition",
+    )
+    ResourceVersion.bump(
+        DietPlanFood.objects.filter(food=instance)
+        .values_list("diet_plan__user_id", flat=True)
+        .distinct(),
+        "diet_plans",
+    )
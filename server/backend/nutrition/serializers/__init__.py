@@ -17,6 +17,7 @@ from .daily_entry import (
     DailyEntrySerializer,
     FoodEntryCreateSerializer,
     QuickAddFoodEntrySerializer,
+    FoodEntryBulkCreateSerializer,
     MealBreakdownSerializer,
     DailyEntryDetailSerializer,
 )
@@ -26,6 +27,8 @@ from .diet_plan import (
     DietPlanListSerializer,
     DietPlanFoodSerializer,
     DietPlanFoodCreateSerializer,
+    DietPlanFoodBulkAddSerializer,
+    ApplyDietPlanSerializer,
 )
 
 __all__ = [
@@ -41,6 +44,7 @@ __all__ = [
     "DailyEntrySerializer",
     "FoodEntryCreateSerializer",
     "QuickAddFoodEntrySerializer",
+    "FoodEntryBulkCreateSerializer",
     "MealBreakdownSerializer",
     "DailyEntryDetailSerializer",
     # Diet Plan
@@ -48,4 +52,6 @@ __all__ = [
     "DietPlanListSerializer",
     "MealItemSerializer",
     "MealItemCreateSerializer",
+    "DietPlanFoodBulkAddSerializer",
+    "ApplyDietPlanSerializer",
 ]
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ..models import DailyEntry, FoodEntry
+from ..services import DailyEntryService
 
 
 class FoodEntrySerializer(serializers.ModelSerializer):
@@ -43,6 +44,7 @@ class FoodEntrySerializer(serializers.ModelSerializer):
             "carbs",
             "fat",
             "nutrition_totals",
+            "diet_plan_food",
             "created_at",
             "updated_at",
         ]
@@ -59,6 +61,7 @@ class FoodEntrySerializer(serializers.ModelSerializer):
             "carbs",
             "fat",
             "nutrition_totals",
+            "diet_plan_food",
             "created_at",
             "updated_at",
         ]
@@ -120,7 +123,9 @@ class DailyEntrySerializer(serializers.ModelSerializer):
 
     # Group food entries by meal type
     meals_breakdown = serializers.SerializerMethodField()
-    food_entries = FoodEntrySerializer(many=True, read_only=True)
+    food_entries = FoodEntrySerializer(
+        source="get_food_entries", many=True, read_only=True
+    )
     food_entries_count = serializers.SerializerMethodField()
 
     # Nutrition profile goals for comparison
@@ -173,7 +178,7 @@ class DailyEntrySerializer(serializers.ModelSerializer):
 
     def get_food_entries_count(self, obj):
         """Get count of food entries for this daily entry"""
-        return obj.food_entries.count()
+        return len(obj.get_food_entries())
 
     def get_meals_breakdown(self, obj):
         """Get food entries grouped by meal type with totals"""
@@ -181,10 +186,15 @@ class DailyEntrySerializer(serializers.ModelSerializer):
         from ..models import FoodEntry
 
         meal_breakdown = {}
+        grouped = obj.group_food_entries()
+
+        # The same food and serving is usually logged many times; scan its
+        # servings JSON once
+        serving_descriptions = {}
 
         # Get all meal type choices
         for meal_type, meal_name in FoodEntry.MEAL_TYPE_CHOICES:
-            entries = obj.food_entries.filter(meal_type=meal_type)
+            entries = grouped[meal_type]
 
             # Calculate totals for this meal type
             totals = {
@@ -202,6 +212,16 @@ class DailyEntrySerializer(serializers.ModelSerializer):
                 for key in totals:
                     totals[key] += entry_nutrition[key]
 
+                serving_key = (
+                    entry.food_id,
+                    entry.serving_type,
+                    entry.fatsecret_serving_id,
+                    entry.custom_serving_unit,
+                    entry.custom_serving_amount,
+                )
+                if serving_key not in serving_descriptions:
+                    serving_descriptions[serving_key] = entry.get_serving_description()
+
                 # Serialize the entry (but avoid circular serialization)
                 entry_data = {
                     "id": entry.id,
@@ -210,7 +230,7 @@ class DailyEntrySerializer(serializers.ModelSerializer):
                     "food_name": entry.food.food_name,
                     "food_brand": entry.food.brand_name or "",
                     "quantity": entry.quantity,
-                    "serving_description": entry.get_serving_description(),
+                    "serving_description": serving_descriptions[serving_key],
                     "calories": entry.calories,
                     "protein": entry.protein,
                     "carbs": entry.carbs,
@@ -419,6 +439,111 @@ class QuickAddFoodEntrySerializer(serializers.Serializer):
         )
 
 
+class FoodEntryBulkItemSerializer(serializers.Serializer):
+    """One food entry of a bulk log, addressed by date instead of daily entry"""
+
+    date = serializers.DateField()
+    food = serializers.IntegerField()
+    meal_type = serializers.ChoiceField(choices=FoodEntry.MEAL_TYPE_CHOICES)
+    serving_type = serializers.ChoiceField(
+        choices=FoodEntry.SERVING_TYPE_CHOICES, default="fatsecret"
+    )
+    fatsecret_serving_id = serializers.CharField(
+        max_length=10, required=False, allow_null=True, allow_blank=True
+    )
+    custom_serving_unit = serializers.CharField(
+        max_length=50, required=False, allow_null=True, allow_blank=True
+    )
+    custom_serving_amount = serializers.FloatField(required=False, allow_null=True)
+    quantity = serializers.FloatField(default=1.0)
+
+    def validate_quantity(self, value):
+        """Validate quantity is positive"""
+        if value <= 0:
+            raise serializers.ValidationError("Quantity must be greater than 0.")
+        return value
+
+    def validate(self, data):
+        """Validate serving data based on serving type"""
+        serving_type = data.get("serving_type", "fatsecret")
+
+        if serving_type == "fatsecret":
+            if not data.get("fatsecret_serving_id"):
+                raise serializers.ValidationError(
+                    "fatsecret_serving_id is required for FatSecret servings."
+                )
+        elif serving_type == "custom":
+            if not data.get("custom_serving_unit") or not data.get(
+                "custom_serving_amount"
+            ):
+                raise serializers.ValidationError(
+                    "Both custom_serving_unit and custom_serving_amount are required for custom servings."
+                )
+            if data.get("custom_serving_amount") <= 0:
+                raise serializers.ValidationError(
+                    "custom_serving_amount must be greater than 0."
+                )
+
+        return data
+
+
+class FoodEntryBulkCreateSerializer(serializers.Serializer):
+    """
+    Log many food entries across many dates at once.
+
+    Foods are loaded with one in_bulk and the entries are written by
+    DailyEntryService.log_food_entries (bulk inserts and one totals update).
+    """
+
+    MAX_ENTRIES = 200
+
+    entries = FoodEntryBulkItemSerializer(
+        many=True, allow_empty=False, max_length=MAX_ENTRIES
+    )
+
+    def validate_entries(self, entries):
+        """Check every food exists and offers the selected FatSecret serving"""
+        from ..models import Food
+
+        self._foods = Food.objects.in_bulk({entry["food"] for entry in entries})
+
+        errors = []
+        for entry in entries:
+            food = self._foods.get(entry["food"])
+            if food is None:
+                errors.append({"food": ["Food does not exist."]})
+            elif (
+                entry["serving_type"] == "fatsecret"
+                and food.fatsecret_servings
+                and str(entry["fatsecret_serving_id"])
+                not in [s.get("serving_id") for s in food.fatsecret_servings]
+            ):
+                errors.append(
+                    {
+                        "fatsecret_serving_id": [
+                            "Selected FatSecret serving is not available for this food."
+                        ]
+                    }
+                )
+            else:
+                errors.append({})
+
+        # Same shape as DRF's nested list errors: one dict per entry
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return entries
+
+    def create(self, validated_data):
+        """Log the entries into the nutrition profile given to save()"""
+        entries = [
+            {**entry, "food": self._foods[entry["food"]]}
+            for entry in validated_data["entries"]
+        ]
+        return DailyEntryService.log_food_entries(
+            validated_data["nutrition_profile"], entries
+        )
+
+
 # Meal-specific serializers for easier frontend consumption
 class MealBreakdownSerializer(serializers.Serializer):
     """Serializer for individual meal breakdown within a daily entry"""
@@ -446,17 +571,17 @@ class DailyEntryDetailSerializer(DailyEntrySerializer):
         ]
 
     def get_breakfast_entries(self, obj):
-        entries = obj.food_entries.filter(meal_type="breakfast")
+        entries = obj.group_food_entries()["breakfast"]
         return FoodEntrySerializer(entries, many=True).data
 
     def get_lunch_entries(self, obj):
-        entries = obj.food_entries.filter(meal_type="lunch")
+        entries = obj.group_food_entries()["lunch"]
         return FoodEntrySerializer(entries, many=True).data
 
     def get_dinner_entries(self, obj):
-        entries = obj.food_entries.filter(meal_type="dinner")
+        entries = obj.group_food_entries()["dinner"]
         return FoodEntrySerializer(entries, many=True).data
 
     def get_snack_entries(self, obj):
-        entries = obj.food_entries.filter(meal_type="snack")
+        entries = obj.group_food_entries()["snack"]
         return FoodEntrySerializer(entries, many=True).data
@@ -1,3 +1,5 @@
+from datetime import timedelta
+from django.db import transaction
 from rest_framework import serializers
 from ..models import Food, DietPlan, DietPlanFood
 from .food import FoodSerializer
@@ -100,7 +102,9 @@ class DietPlanSerializer(serializers.ModelSerializer):
     """Base serializer for DietPlan model"""
 
     # All foods (for backward compatibility)
-    diet_plan_foods = DietPlanFoodSerializer(many=True, read_only=True)
+    diet_plan_foods = DietPlanFoodSerializer(
+        source="get_diet_plan_foods", many=True, read_only=True
+    )
 
     # Write-only field for creating foods with the diet plan
     diet_plan_foods_data = serializers.ListField(
@@ -146,11 +150,14 @@ class DietPlanSerializer(serializers.ModelSerializer):
 
     def get_meals_breakdown(self, obj):
         """Get nutrition breakdown by meal type"""
-        return obj.get_meals_breakdown()
+        meal_breakdown = obj.get_meals_breakdown()
+        for meal in meal_breakdown.values():
+            meal["items"] = DietPlanFoodSerializer(meal["items"], many=True).data
+        return meal_breakdown
 
     def get_foods_count(self, obj):
         """Get total count of foods in this diet plan"""
-        return obj.diet_plan_foods.count()
+        return len(obj.get_diet_plan_foods())
 
     def validate_diet_plan_foods_data(self, value):
         """Validate diet plan foods data structure"""
@@ -196,48 +203,27 @@ class DietPlanSerializer(serializers.ModelSerializer):
                         "custom_serving_unit and custom_serving_amount are required when serving_type is 'custom'"
                     )
 
-        return value
-
-    def create(self, validated_data):
-        """Create diet plan with foods"""
-        diet_plan_foods_data = validated_data.pop("diet_plan_foods_data", [])
-        diet_plan = DietPlan.objects.create(**validated_data)
-
-        # Create diet plan foods
-        for food_data in diet_plan_foods_data:
-            DietPlanFood.objects.create(
-                diet_plan=diet_plan,
-                food_id=food_data["food_id"],
-                meal_type=food_data["meal_type"],
-                serving_type=food_data.get("serving_type", "fatsecret"),
-                fatsecret_serving_id=food_data.get("fatsecret_serving_id"),
-                custom_serving_unit=food_data.get("custom_serving_unit"),
-                custom_serving_amount=food_data.get("custom_serving_amount"),
-                quantity=food_data.get("quantity", 1.0),
-                order=food_data.get("order", 0),
+        # Load every referenced food once; bulk_add needs them for nutrition
+        food_ids = {item["food_id"] for item in value}
+        self._foods = Food.objects.in_bulk(food_ids)
+        missing = sorted(food_ids - set(self._foods))
+        if missing:
+            raise serializers.ValidationError(
+                f"Food with ID(s) {', '.join(map(str, missing))} does not exist"
             )
 
-        return diet_plan
+        return value
 
-    def update(self, instance, validated_data):
-        """Update diet plan and foods"""
-        diet_plan_foods_data = validated_data.pop("diet_plan_foods_data", None)
+    def _add_diet_plan_foods(self, diet_plan, diet_plan_foods_data):
+        """Insert the plan's foods with one bulk_create"""
+        if not diet_plan_foods_data:
+            return []
 
-        # Update diet plan fields
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-
-        # Update foods if provided
-        if diet_plan_foods_data is not None:
-            # Delete existing foods
-            instance.diet_plan_foods.all().delete()
-
-            # Create new foods
-            for food_data in diet_plan_foods_data:
-                DietPlanFood.objects.create(
-                    diet_plan=instance,
-                    food_id=food_data["food_id"],
+        return DietPlanFood.bulk_add(
+            diet_plan,
+            [
+                DietPlanFood(
+                    food=self._foods[food_data["food_id"]],
                     meal_type=food_data["meal_type"],
                     serving_type=food_data.get("serving_type", "fatsecret"),
                     fatsecret_serving_id=food_data.get("fatsecret_serving_id"),
@@ -246,6 +232,38 @@ class DietPlanSerializer(serializers.ModelSerializer):
                     quantity=food_data.get("quantity", 1.0),
                     order=food_data.get("order", 0),
                 )
+                for food_data in diet_plan_foods_data
+            ],
+        )
+
+    def create(self, validated_data):
+        """Create diet plan with foods"""
+        diet_plan_foods_data = validated_data.pop("diet_plan_foods_data", [])
+
+        with transaction.atomic():
+            diet_plan = DietPlan.objects.create(**validated_data)
+            self._add_diet_plan_foods(diet_plan, diet_plan_foods_data)
+
+        return diet_plan
+
+    def update(self, instance, validated_data):
+        """Update diet plan and foods"""
+        diet_plan_foods_data = validated_data.pop("diet_plan_foods_data", None)
+
+        with transaction.atomic():
+            # Update diet plan fields
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save()
+
+            # Update foods if provided
+            if diet_plan_foods_data is not None:
+                # Delete existing foods; a queryset delete skips the per-item
+                # deltas, so reset the totals before adding the new foods
+                instance.diet_plan_foods.all().delete()
+                instance.calculate_totals()
+
+                self._add_diet_plan_foods(instance, diet_plan_foods_data)
 
         return instance
 
@@ -269,30 +287,22 @@ class DietPlanDetailSerializer(DietPlanSerializer):
 
     def get_breakfast_foods(self, obj):
         """Get breakfast foods for this diet plan"""
-        breakfast_foods = obj.diet_plan_foods.filter(meal_type="breakfast").order_by(
-            "order", "created_at"
-        )
+        breakfast_foods = obj.group_diet_plan_foods()["breakfast"]
         return DietPlanFoodSerializer(breakfast_foods, many=True).data
 
     def get_lunch_foods(self, obj):
         """Get lunch foods for this diet plan"""
-        lunch_foods = obj.diet_plan_foods.filter(meal_type="lunch").order_by(
-            "order", "created_at"
-        )
+        lunch_foods = obj.group_diet_plan_foods()["lunch"]
         return DietPlanFoodSerializer(lunch_foods, many=True).data
 
     def get_dinner_foods(self, obj):
         """Get dinner foods for this diet plan"""
-        dinner_foods = obj.diet_plan_foods.filter(meal_type="dinner").order_by(
-            "order", "created_at"
-        )
+        dinner_foods = obj.group_diet_plan_foods()["dinner"]
         return DietPlanFoodSerializer(dinner_foods, many=True).data
 
     def get_snack_foods(self, obj):
         """Get snack foods for this diet plan"""
-        snack_foods = obj.diet_plan_foods.filter(meal_type="snack").order_by(
-            "order", "created_at"
-        )
+        snack_foods = obj.group_diet_plan_foods()["snack"]
         return DietPlanFoodSerializer(snack_foods, many=True).data
 
 
@@ -330,35 +340,27 @@ class DietPlanListSerializer(serializers.ModelSerializer):
 
     def get_breakfast_foods(self, obj):
         """Get breakfast foods for this diet plan"""
-        breakfast_foods = obj.diet_plan_foods.filter(meal_type="breakfast").order_by(
-            "order", "created_at"
-        )
+        breakfast_foods = obj.group_diet_plan_foods()["breakfast"]
         return DietPlanFoodSerializer(breakfast_foods, many=True).data
 
     def get_lunch_foods(self, obj):
         """Get lunch foods for this diet plan"""
-        lunch_foods = obj.diet_plan_foods.filter(meal_type="lunch").order_by(
-            "order", "created_at"
-        )
+        lunch_foods = obj.group_diet_plan_foods()["lunch"]
         return DietPlanFoodSerializer(lunch_foods, many=True).data
 
     def get_dinner_foods(self, obj):
         """Get dinner foods for this diet plan"""
-        dinner_foods = obj.diet_plan_foods.filter(meal_type="dinner").order_by(
-            "order", "created_at"
-        )
+        dinner_foods = obj.group_diet_plan_foods()["dinner"]
         return DietPlanFoodSerializer(dinner_foods, many=True).data
 
     def get_snack_foods(self, obj):
         """Get snack foods for this diet plan"""
-        snack_foods = obj.diet_plan_foods.filter(meal_type="snack").order_by(
-            "order", "created_at"
-        )
+        snack_foods = obj.group_diet_plan_foods()["snack"]
         return DietPlanFoodSerializer(snack_foods, many=True).data
 
     def get_foods_count(self, obj):
         """Get count of foods in this diet plan"""
-        return obj.diet_plan_foods.count()
+        return len(obj.get_diet_plan_foods())
 
 
 class DietPlanFoodCreateSerializer(serializers.ModelSerializer):
@@ -446,3 +448,166 @@ class QuickAddDietPlanFoodSerializer(serializers.ModelSerializer):
                 )
 
         return data
+
+
+class DietPlanFoodItemSerializer(serializers.Serializer):
+    """One food of a bulk add to a diet plan"""
+
+    food = serializers.IntegerField()
+    meal_type = serializers.ChoiceField(choices=DietPlanFood.MEAL_TYPE_CHOICES)
+    serving_type = serializers.ChoiceField(
+        choices=DietPlanFood.SERVING_TYPE_CHOICES, default="fatsecret"
+    )
+    fatsecret_serving_id = serializers.CharField(
+        max_length=10, required=False, allow_null=True, allow_blank=True
+    )
+    custom_serving_unit = serializers.CharField(
+        max_length=50, required=False, allow_null=True, allow_blank=True
+    )
+    custom_serving_amount = serializers.FloatField(required=False, allow_null=True)
+    quantity = serializers.FloatField(default=1.0)
+    order = serializers.IntegerField(default=0, min_value=0)
+
+    def validate_quantity(self, value):
+        """Validate quantity is positive"""
+        if value <= 0:
+            raise serializers.ValidationError("Quantity must be greater than 0")
+        return value
+
+    def validate(self, data):
+        """Validate serving information"""
+        serving_type = data.get("serving_type", "fatsecret")
+
+        if serving_type == "fatsecret":
+            if not data.get("fatsecret_serving_id"):
+                raise serializers.ValidationError(
+                    "fatsecret_serving_id is required when serving_type is 'fatsecret'"
+                )
+        elif serving_type == "custom":
+            if not data.get("custom_serving_unit") or not data.get(
+                "custom_serving_amount"
+            ):
+                raise serializers.ValidationError(
+                    "custom_serving_unit and custom_serving_amount are required when serving_type is 'custom'"
+                )
+
+        return data
+
+
+class DietPlanFoodBulkAddSerializer(serializers.Serializer):
+    """
+    Add several foods to one diet plan at once.
+
+    Foods are loaded in one query, the items are inserted with a single
+    bulk_create and the plan totals are updated once (DietPlanFood.bulk_add).
+    """
+
+    MAX_ITEMS = 100
+
+    diet_plan = serializers.PrimaryKeyRelatedField(
+        queryset=DietPlan.objects.none(),  # Will be set dynamically
+        help_text="Select the diet plan to add these foods to",
+    )
+    foods = DietPlanFoodItemSerializer(
+        many=True, allow_empty=False, max_length=MAX_ITEMS
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request and hasattr(request, "user"):
+            # Limit diet plan choices to current user's plans
+            self.fields["diet_plan"].queryset = DietPlan.objects.filter(
+                user_id=request.user
+            )
+
+    def validate(self, data):
+        """Check the foods exist and are not already in the same meal"""
+        items = data["foods"]
+        food_ids = {item["food"] for item in items}
+
+        self._foods = Food.objects.in_bulk(food_ids)
+        missing = sorted(food_ids - set(self._foods))
+        if missing:
+            raise serializers.ValidationError(
+                {
+                    "foods": f"Food with ID(s) {', '.join(map(str, missing))} does not exist"
+                }
+            )
+
+        meals = [(item["food"], item["meal_type"]) for item in items]
+        if len(set(meals)) != len(meals):
+            raise serializers.ValidationError(
+                {"foods": "The same food is listed more than once for a meal"}
+            )
+
+        existing = set(
+            DietPlanFood.objects.filter(
+                diet_plan=data["diet_plan"], food_id__in=food_ids
+            ).values_list("food_id", "meal_type")
+        )
+        if existing & set(meals):
+            raise serializers.ValidationError(
+                {"foods": "Some of these foods are already in that meal of the plan"}
+            )
+
+        return data
+
+    def create(self, validated_data):
+        """Create the diet plan foods in bulk"""
+        items = [
+            DietPlanFood(
+                food=self._foods[item["food"]],
+                **{key: value for key, value in item.items() if key != "food"},
+            )
+            for item in validated_data["foods"]
+        ]
+        return DietPlanFood.bulk_add(validated_data["diet_plan"], items)
+
+
+class ApplyDietPlanSerializer(serializers.Serializer):
+    """Dates (and optionally meals) to log a diet plan into"""
+
+    MAX_DATES = 31
+
+    dates = serializers.ListField(
+        child=serializers.DateField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_DATES,
+    )
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    meal_types = serializers.ListField(
+        child=serializers.ChoiceField(choices=DietPlanFood.MEAL_TYPE_CHOICES),
+        required=False,
+        allow_empty=False,
+    )
+
+    def validate(self, data):
+        """Resolve either an explicit list of dates or a date range"""
+        start_date = data.get("start_date")
+        end_date = data.get("end_date")
+
+        if "dates" in data:
+            if start_date or end_date:
+                raise serializers.ValidationError(
+                    "Provide either dates or start_date/end_date, not both"
+                )
+            return data
+
+        if not start_date or not end_date:
+            raise serializers.ValidationError(
+                "Provide dates or both start_date and end_date"
+            )
+        if end_date < start_date:
+            raise serializers.ValidationError("end_date must not be before start_date")
+
+        days = (end_date - start_date).days + 1
+        if days > self.MAX_DATES:
+            raise serializers.ValidationError(
+                f"A diet plan can be applied to at most {self.MAX_DATES} dates at once"
+            )
+
+        data["dates"] = [start_date + timedelta(days=i) for i in range(days)]
+        return data
@@ -1,3 +1,11 @@
 from .daily_entry_service import DailyEntryService
+from .diet_plan_service import DietPlanService
+from .macro_engine import BulkMacroCalculator
+from .macro_recompute_service import MacroRecomputeService
 
-__all__ = ["DailyEntryService"]
+__all__ = [
+    "DailyEntryService",
+    "DietPlanService",
+    "BulkMacroCalculator",
+    "MacroRecomputeService",
+]
@@ -2,7 +2,7 @@ from django.utils import timezone
 from django.db import transaction
 from datetime import date, datetime
 import logging
-from ..models import NutritionProfile, DailyEntry
+from ..models import NutritionProfile, DailyEntry, FoodEntry
 from ..utils import DateUtils
 
 logger = logging.getLogger(__name__)
@@ -279,3 +279,60 @@ class DailyEntryService:
         except Exception as e:
             logger.error(f"Error getting daily entry stats: {str(e)}")
             return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def log_food_entries(nutrition_profile, entries):
+        """
+        Log many food entries, possibly across many dates, at once.
+
+        Missing daily entries are created with one bulk_create, nutrition is
+        calculated in memory (each entry's food must already be loaded), the
+        food entries are inserted with one bulk_create and the totals of the
+        affected days are recalculated with one grouped aggregate. bulk_create
+        skips FoodEntry.save and the update_daily_totals signal, so this
+        replaces a totals recalculation per entry.
+
+        Args:
+            nutrition_profile: NutritionProfile to log into
+            entries: List of dicts with a date plus FoodEntry field values
+                (food, meal_type, serving_type, quantity, ...)
+
+        Returns:
+            tuple: (created FoodEntry list in input order, affected DailyEntry list)
+        """
+        dates = sorted({entry["date"] for entry in entries})
+
+        with transaction.atomic():
+            DailyEntry.objects.bulk_create(
+                [
+                    DailyEntry(nutrition_profile=nutrition_profile, date=day)
+                    for day in dates
+                ],
+                ignore_conflicts=True,
+            )
+            daily_entries = {
+                daily_entry.date: daily_entry
+                for daily_entry in DailyEntry.objects.filter(
+                    nutrition_profile=nutrition_profile, date__in=dates
+                )
+            }
+
+            food_entries = []
+            for entry in entries:
+                values = {key: value for key, value in entry.items() if key != "date"}
+                food_entry = FoodEntry(
+                    daily_entry=daily_entries[entry["date"]], **values
+                )
+                food_entry.calculate_nutrition()
+                food_entries.append(food_entry)
+
+            created = FoodEntry.objects.bulk_create(food_entries)
+
+            affected = [daily_entries[day] for day in dates]
+            DailyEntry.bulk_calculate_totals(affected)
+
+        logger.info(
+            f"Logged {len(created)} food entries across {len(dates)} date(s) "
+            f"for account {nutrition_profile.account_id}"
+        )
+        return created, affected
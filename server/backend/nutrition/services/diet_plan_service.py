@@ -0,0 +1,115 @@
+import logging
+from django.db import transaction
+from ..models import DailyEntry, FoodEntry
+
+logger = logging.getLogger(__name__)
+
+
+class DietPlanService:
+    """Service for logging diet plans into daily entries"""
+
+    @staticmethod
+    def apply_to_dates(diet_plan, nutrition_profile, dates, meal_types=None):
+        """
+        Log a diet plan's foods into the daily entries of one or more dates.
+
+        Plan items become FoodEntry rows in one bulk_create that copies the
+        nutrition already stored on each item, and each day's totals are
+        recalculated once. Items already logged from this plan on a date are
+        skipped, so applying the same plan again changes nothing. Everything
+        runs in one transaction, with the dates' daily entries locked so
+        concurrent applies run one after the other and the created counts
+        are exact.
+
+        Args:
+            diet_plan: DietPlan to apply
+            nutrition_profile: The plan owner's NutritionProfile
+            dates: Iterable of dates to log the plan into
+            meal_types: Optional list of meal types to apply (default: all)
+
+        Returns:
+            dict: created and skipped totals plus a per-date summary
+        """
+        dates = sorted(set(dates))
+        items = [
+            item
+            for item in diet_plan.get_diet_plan_foods()
+            if not meal_types or item.meal_type in meal_types
+        ]
+
+        with transaction.atomic():
+            # Make sure every date has a daily entry
+            DailyEntry.objects.bulk_create(
+                [
+                    DailyEntry(nutrition_profile=nutrition_profile, date=day)
+                    for day in dates
+                ],
+                ignore_conflicts=True,
+            )
+            # Row locks in date order; a concurrent apply waits here and then
+            # sees this one's entries as already logged
+            daily_entries = list(
+                DailyEntry.objects.select_for_update()
+                .filter(nutrition_profile=nutrition_profile, date__in=dates)
+                .order_by("date")
+            )
+
+            already_logged = set(
+                FoodEntry.objects.filter(
+                    daily_entry__in=daily_entries, diet_plan_food__in=items
+                ).values_list("daily_entry_id", "diet_plan_food_id")
+            )
+
+            new_entries = []
+            summary = []
+            for daily_entry in daily_entries:
+                created = 0
+                for item in items:
+                    if (daily_entry.pk, item.pk) in already_logged:
+                        continue
+                    new_entries.append(
+                        FoodEntry(
+                            daily_entry=daily_entry,
+                            food_id=item.food_id,
+                            diet_plan_food=item,
+                            meal_type=item.meal_type,
+                            serving_type=item.serving_type,
+                            fatsecret_serving_id=item.fatsecret_serving_id,
+                            custom_serving_unit=item.custom_serving_unit,
+                            custom_serving_amount=item.custom_serving_amount,
+                            quantity=item.quantity,
+                            # Reuse the nutrition stored on the plan item
+                            calories=item.calories,
+                            protein=item.protein,
+                            carbs=item.carbs,
+                            fat=item.fat,
+                        )
+                    )
+                    created += 1
+                summary.append(
+                    {
+                        "daily_entry": daily_entry,
+                        "created": created,
+                        "skipped": len(items) - created,
+                    }
+                )
+
+            # bulk_create skips FoodEntry.save and the update_daily_totals
+            # signal; the unique constraint is a last guard against duplicates
+            FoodEntry.objects.bulk_create(new_entries, ignore_conflicts=True)
+
+            changed = [row["daily_entry"] for row in summary if row["created"]]
+            DailyEntry.bulk_calculate_totals(changed)
+
+        created_total = len(new_entries)
+        skipped_total = sum(row["skipped"] for row in summary)
+        logger.info(
+            f"Applied diet plan {diet_plan.pk} to {len(dates)} date(s): "
+            f"{created_total} food entries created, {skipped_total} already logged"
+        )
+
+        return {
+            "created": created_total,
+            "skipped": skipped_total,
+            "dates": summary,
+        }
@@ -0,0 +1,280 @@
+import logging
+from datetime import date
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+from accounts.models import ResourceVersion
+from ..models import NutritionProfile
+
+logger = logging.getLogger(__name__)
+
+MACRO_FIELDS = [
+    "bmi",
+    "bmr",
+    "tdee",
+    "daily_calories_goal",
+    "daily_protein_goal",
+    "daily_carbs_goal",
+    "daily_fat_goal",
+]
+
+
+class BulkMacroCalculator:
+    """
+    Columnar counterpart of NutritionProfile.calculate_macros.
+
+    Loads only the needed columns with .values(), computes BMI, BMR, TDEE and
+    macros for a whole chunk with NumPy arrays and writes back the rows that
+    changed with bulk_update. The arithmetic follows the scalar method
+    operation by operation and final values are rounded with Python's round(),
+    so results are identical to calling update_macros() on every profile.
+    """
+
+    CHUNK_SIZE = 1000
+
+    VALUE_FIELDS = [
+        "pk",
+        "account_id",
+        "account__height_ft",
+        "account__height_in",
+        "account__gender",
+        "account__birth_date",
+        "account__profile__account_id",
+        "account__profile__starting_weight",
+        "account__profile__activity_level",
+        "account__profile__body_goal",
+        "macro_inputs_hash",
+        "macros_dirty",
+        *MACRO_FIELDS,
+    ]
+
+    @staticmethod
+    def _age(birth_date, today):
+        """Same as Account.age, with calculate_macros' 13-120 fallback to 25"""
+        age = (
+            today.year
+            - birth_date.year
+            - ((today.month, today.day) < (birth_date.month, birth_date.day))
+        )
+        if age < 13 or age > 120:
+            return 25
+        return age
+
+    @staticmethod
+    def _has_profile(row):
+        return row["account__profile__account_id"] is not None
+
+    @staticmethod
+    def _is_complete(row):
+        """Same checks as NutritionProfile._has_complete_profile_data"""
+        return bool(
+            BulkMacroCalculator._has_profile(row)
+            and row["account__profile__starting_weight"]
+            and row["account__height_ft"]
+            and row["account__height_in"] is not None
+            and row["account__profile__activity_level"]
+            and row["account__profile__body_goal"]
+            and row["account__birth_date"]
+        )
+
+    @staticmethod
+    def calculate(rows, today=None):
+        """
+        Calculate macros for rows loaded with VALUE_FIELDS.
+
+        Args:
+            rows: List of value dicts
+            today: Date used for ages (default: today)
+
+        Returns:
+            list: One macros dict per row, keyed like calculate_macros()
+        """
+        today = today or date.today()
+        complete = [BulkMacroCalculator._is_complete(row) for row in rows]
+        results = [
+            None if is_complete else NutritionProfile.default_macros(row["account__gender"])
+            for row, is_complete in zip(rows, complete)
+        ]
+
+        full = [row for row, is_complete in zip(rows, complete) if is_complete]
+        if not full:
+            return results
+
+        weight = np.array(
+            [float(row["account__profile__starting_weight"]) for row in full]
+        )
+        total_inches = np.array(
+            [row["account__height_ft"] * 12 + row["account__height_in"] for row in full],
+            dtype=np.float64,
+        )
+        age = np.array(
+            [BulkMacroCalculator._age(row["account__birth_date"], today) for row in full],
+            dtype=np.float64,
+        )
+        is_male = np.array([row["account__gender"] == "male" for row in full])
+        multiplier = np.array(
+            [
+                NutritionProfile.ACTIVITY_MULTIPLIERS.get(
+                    row["account__profile__activity_level"],
+                    NutritionProfile.DEFAULT_ACTIVITY_MULTIPLIER,
+                )
+                for row in full
+            ]
+        )
+        adjustment = np.array(
+            [
+                NutritionProfile.GOAL_CALORIE_ADJUSTMENTS.get(
+                    row["account__profile__body_goal"], 0
+                )
+                for row in full
+            ],
+            dtype=np.float64,
+        )
+        ratios = np.array(
+            [
+                NutritionProfile.macro_ratios(row["account__profile__body_goal"])
+                for row in full
+            ]
+        )
+
+        # Mifflin-St Jeor, in the scalar method's evaluation order
+        height_cm = total_inches * 2.54
+        base = (10 * weight) + (6.25 * height_cm) - (5 * age)
+        bmr = np.where(is_male, base + 5, base - 161)
+        tdee = bmr * multiplier
+        daily_calories = np.trunc(tdee + adjustment)
+        protein = (daily_calories * ratios[:, 0]) / 4
+        carbs = (daily_calories * ratios[:, 1]) / 4
+        fat = (daily_calories * ratios[:, 2]) / 9
+
+        height_m = total_inches * 0.0254
+        bmi = weight / (height_m**2)
+
+        columns = zip(
+            bmi.tolist(),
+            bmr.tolist(),
+            tdee.tolist(),
+            daily_calories.tolist(),
+            protein.tolist(),
+            carbs.tolist(),
+            fat.tolist(),
+        )
+        full_results = iter(
+            {
+                "bmi": round(row_bmi, 1),
+                "bmr": round(row_bmr, 1),
+                "tdee": round(row_tdee, 1),
+                "daily_calories_goal": int(row_calories),
+                "daily_protein_goal": round(row_protein, 1),
+                "daily_carbs_goal": round(row_carbs, 1),
+                "daily_fat_goal": round(row_fat, 1),
+            }
+            for row_bmi, row_bmr, row_tdee, row_calories, row_protein, row_carbs, row_fat in columns
+        )
+        return [result or next(full_results) for result in results]
+
+    @staticmethod
+    def fingerprint(row, today):
+        """Same value as NutritionProfile.macro_inputs_fingerprint for a row"""
+        birth_date = row["account__birth_date"]
+        age = None
+        if birth_date:
+            age = (
+                today.year
+                - birth_date.year
+                - ((today.month, today.day) < (birth_date.month, birth_date.day))
+            )
+
+        inputs = [
+            row["account__height_ft"],
+            row["account__height_in"],
+            row["account__gender"],
+            age,
+        ]
+        if BulkMacroCalculator._has_profile(row):
+            inputs += [
+                row["account__profile__starting_weight"],
+                row["account__profile__activity_level"],
+                row["account__profile__body_goal"],
+            ]
+        return NutritionProfile.fingerprint_inputs(inputs)
+
+    @staticmethod
+    def run(queryset=None, chunk_size=None, dry_run=False):
+        """
+        Recalculate macros for nutrition profiles chunk by chunk.
+
+        Args:
+            queryset: NutritionProfile queryset (default: all profiles)
+            chunk_size: Rows per computation and bulk_update
+            dry_run: Compute and count changes without writing
+
+        Returns:
+            dict: profiles, changed and defaults (incomplete profile) counts
+        """
+        queryset = NutritionProfile.objects.all() if queryset is None else queryset
+        chunk_size = chunk_size or BulkMacroCalculator.CHUNK_SIZE
+        today = date.today()
+        stats = {"profiles": 0, "changed": 0, "defaults": 0}
+
+        rows = (
+            queryset.order_by("pk")
+            .values(*BulkMacroCalculator.VALUE_FIELDS)
+            .iterator(chunk_size=chunk_size)
+        )
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                BulkMacroCalculator._process_chunk(chunk, today, dry_run, stats)
+                chunk = []
+        if chunk:
+            BulkMacroCalculator._process_chunk(chunk, today, dry_run, stats)
+
+        logger.info(
+            f"Bulk macro calculation: {stats['profiles']} profiles, "
+            f"{stats['changed']} changed, {stats['defaults']} using defaults"
+        )
+        return stats
+
+    @staticmethod
+    def _process_chunk(chunk, today, dry_run, stats):
+        results = BulkMacroCalculator.calculate(chunk, today)
+        now = timezone.now()
+
+        changed = []
+        for row, macros in zip(chunk, results):
+            stats["profiles"] += 1
+            if not BulkMacroCalculator._is_complete(row):
+                stats["defaults"] += 1
+
+            inputs_hash = BulkMacroCalculator.fingerprint(row, today)
+            if (
+                all(row[field] == macros[field] for field in MACRO_FIELDS)
+                and row["macro_inputs_hash"] == inputs_hash
+                and not row["macros_dirty"]
+            ):
+                continue
+
+            changed.append(
+                NutritionProfile(
+                    pk=row["pk"],
+                    account_id=row["account_id"],
+                    macro_inputs_hash=inputs_hash,
+                    macros_dirty=False,
+                    updated_at=now,
+                    **macros,
+                )
+            )
+
+        stats["changed"] += len(changed)
+        if changed and not dry_run:
+            with transaction.atomic():
+                NutritionProfile.objects.bulk_update(
+                    changed,
+                    MACRO_FIELDS + ["macro_inputs_hash", "macros_dirty", "updated_at"],
+                )
+                ResourceVersion.bump(
+                    [nutrition_profile.account_id for nutrition_profile in changed],
+                    "nutrition",
+                )
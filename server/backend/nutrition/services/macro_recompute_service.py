@@ -0,0 +1,124 @@
+import logging
+from django.db import transaction
+from django.utils import timezone
+from accounts.models import ResourceVersion
+from ..models import NutritionProfile
+
+logger = logging.getLogger(__name__)
+
+
+class MacroRecomputeService:
+    """
+    Coalesced recalculation of NutritionProfile macros.
+
+    Profile changes only mark nutrition profiles dirty. The dirty profiles of
+    a transaction are recalculated when it commits, so signup or a form
+    that saves several times costs one recalculation. Profiles whose inputs
+    fingerprint is unchanged are not recalculated at all. Anything left dirty
+    (e.g. a failed commit hook) is swept by recompute_dirty_macros_task.
+    """
+
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def mark_dirty(account_ids):
+        """
+        Queue macro recalculation for the given accounts.
+
+        Args:
+            account_ids: Iterable of account IDs
+
+        Returns:
+            int: Number of nutrition profiles newly marked dirty
+        """
+        account_ids = set(account_ids)
+        if not account_ids:
+            return 0
+
+        marked = NutritionProfile.objects.filter(
+            account_id__in=account_ids, macros_dirty=False
+        ).update(macros_dirty=True)
+
+        # Repeated marks in one transaction coalesce: the first hook clears
+        # the dirty flags, so later hooks find nothing left to recalculate.
+        # The write has committed by then, so a failing hook is only logged
+        # and its profiles stay dirty for the sweep.
+        transaction.on_commit(
+            lambda: MacroRecomputeService.recompute_accounts(account_ids),
+            robust=True,
+        )
+        return marked
+
+    @staticmethod
+    def recompute_accounts(account_ids):
+        """Recalculate the still-dirty profiles of the given accounts"""
+        return MacroRecomputeService.recompute(
+            NutritionProfile.objects.filter(
+                account_id__in=account_ids, macros_dirty=True
+            )
+        )
+
+    @staticmethod
+    def recompute(queryset, force=False, batch_size=None):
+        """
+        Recalculate macros for a queryset of nutrition profiles in batches.
+
+        Args:
+            queryset: NutritionProfile queryset
+            force: Recalculate even when the inputs fingerprint is unchanged
+            batch_size: Profiles per bulk_update (default: BATCH_SIZE)
+
+        Returns:
+            dict: recomputed and skipped counts
+        """
+        batch_size = batch_size or MacroRecomputeService.BATCH_SIZE
+        recomputed = 0
+        skipped = 0
+        batch = []
+        fields = set()
+
+        profiles = queryset.select_related("account__profile").order_by("pk")
+        for nutrition_profile in profiles.iterator(chunk_size=batch_size):
+            if (
+                not force
+                and nutrition_profile.macro_inputs_hash
+                == nutrition_profile.macro_inputs_fingerprint()
+            ):
+                nutrition_profile.macros_dirty = False
+                fields.add("macros_dirty")
+                skipped += 1
+            else:
+                fields.update(nutrition_profile.apply_macros())
+                recomputed += 1
+
+            nutrition_profile.updated_at = timezone.now()
+            batch.append(nutrition_profile)
+            if len(batch) >= batch_size:
+                MacroRecomputeService._save_batch(batch, fields)
+                batch = []
+                fields = set()
+
+        if batch:
+            MacroRecomputeService._save_batch(batch, fields)
+
+        if recomputed or skipped:
+            logger.info(
+                f"Recomputed macros for {recomputed} profile(s), "
+                f"skipped {skipped} unchanged"
+            )
+        return {"recomputed": recomputed, "skipped": skipped}
+
+    @staticmethod
+    def _save_batch(batch, fields):
+        NutritionProfile.objects.bulk_update(batch, sorted(fields | {"updated_at"}))
+        # bulk_update skips the post_save receivers
+        ResourceVersion.bump(
+            [nutrition_profile.account_id for nutrition_profile in batch], "nutrition"
+        )
+
+    @staticmethod
+    def recompute_dirty(batch_size=None):
+        """Recalculate every profile still marked dirty"""
+        return MacroRecomputeService.recompute(
+            NutritionProfile.objects.filter(macros_dirty=True), batch_size=batch_size
+        )
@@ -3,9 +3,11 @@ from .daily_entry_tasks import (
     cleanup_old_daily_entries_task,
     create_daily_entry_for_single_user_task,
 )
+from .macro_tasks import recompute_dirty_macros_task
 
 __all__ = [
     "create_daily_entries_task",
     "cleanup_old_daily_entries_task",
     "create_daily_entry_for_single_user_task",
+    "recompute_dirty_macros_task",
 ]
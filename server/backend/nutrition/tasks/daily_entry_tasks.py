@@ -7,7 +7,7 @@ from ..services.daily_entry_service import DailyEntryService
 logger = logging.getLogger(__name__)
 
 
-@shared_task(bind=True, max_retries=3)
+@shared_task(bind=True, max_retries=3, ignore_result=True)
 def create_daily_entries_task(self, target_date=None):
     """
     Celery task to create daily entries for all users
@@ -63,7 +63,7 @@ def create_daily_entries_task(self, target_date=None):
             }
 
 
-@shared_task
+@shared_task(ignore_result=True)
 def cleanup_old_daily_entries_task(days_to_keep=90):
     """
     Celery task to clean up old daily entries
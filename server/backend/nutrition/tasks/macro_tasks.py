@@ -0,0 +1,24 @@
+from celery import shared_task
+import logging
+from ..services.macro_recompute_service import MacroRecomputeService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def recompute_dirty_macros_task():
+    """
+    Celery task to recalculate macros for profiles still marked dirty
+    Catches profiles whose commit-time recalculation did not run
+    """
+    try:
+        results = MacroRecomputeService.recompute_dirty()
+        logger.info(
+            f"Dirty macro sweep completed: {results['recomputed']} recomputed, "
+            f"{results['skipped']} unchanged"
+        )
+        return results
+
+    except Exception as exc:
+        logger.error(f"Dirty macro sweep failed: {str(exc)}")
+        return {"success": False, "error": str(exc)}
@@ -6,6 +6,7 @@ from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 from datetime import date
+from backend.conditional import resource_etag
 from ..models import DailyEntry, FoodEntry, Food
 from ..serializers import (
     DailyEntrySerializer,
@@ -13,6 +14,7 @@ from ..serializers import (
     FoodEntrySerializer,
     FoodEntryCreateSerializer,
     QuickAddFoodEntrySerializer,
+    FoodEntryBulkCreateSerializer,
 )
 
 
@@ -44,7 +46,13 @@ class DailyEntryViewSet(viewsets.ModelViewSet):
         """Filter daily entries by the authenticated user's nutrition profile."""
         nutrition_profile = getattr(self.request.user, "nutrition_profile", None)
         if nutrition_profile:
-            return DailyEntry.objects.filter(nutrition_profile=nutrition_profile)
+            # Entries, their foods and the profile load in a fixed number of
+            # queries however many days are serialized
+            return (
+                DailyEntry.objects.filter(nutrition_profile=nutrition_profile)
+                .select_related("nutrition_profile")
+                .prefetch_related(DailyEntry.food_entries_prefetch())
+            )
         return DailyEntry.objects.none()
 
     def create(self, request, *args, **kwargs):
@@ -68,6 +76,7 @@ class DailyEntryViewSet(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(detail=False, methods=["get"])
+    @resource_etag("nutrition")
     def today(self, request):
         """Get or create today's daily entry for the authenticated user."""
         nutrition_profile = getattr(request.user, "nutrition_profile", None)
@@ -81,6 +90,7 @@ class DailyEntryViewSet(viewsets.ModelViewSet):
             nutrition_profile=nutrition_profile,
             date=date.today(),
         )
+        daily_entry.nutrition_profile = nutrition_profile
 
         serializer = self.get_serializer(daily_entry)
         return Response({"data": serializer.data})
@@ -105,7 +115,8 @@ class DailyEntryViewSet(viewsets.ModelViewSet):
             entries = self.get_queryset().filter(date__range=[start_date, end_date])
 
             serializer = self.get_serializer(entries, many=True)
-            return Response({"count": entries.count(), "results": serializer.data})
+            results = serializer.data
+            return Response({"count": len(results), "results": results})
 
         except ValueError:
             return Response(
@@ -163,7 +174,8 @@ class DailyEntryViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def summary(self, request):
         """Get nutrition summary statistics for the authenticated user."""
-        queryset = self.get_queryset()
+        # Only the stored daily totals are needed
+        queryset = self.get_queryset().prefetch_related(None)
 
         # Calculate averages for the last 30 days
         recent_entries = queryset[:30]
@@ -335,6 +347,48 @@ class FoodEntryViewSet(viewsets.ModelViewSet):
         # The signal will automatically recalculate totals
         return response
 
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Log many food entries across many dates in one request.
+
+        Body: {"entries": [{date, food, meal_type, serving info, quantity}]}.
+        Missing daily entries are created, the entries are inserted in bulk
+        and each affected day's totals are recalculated once. Nothing is
+        saved if any entry is invalid.
+        """
+        nutrition_profile = getattr(request.user, "nutrition_profile", None)
+        if not nutrition_profile:
+            return Response(
+                {"error": "User does not have a nutrition profile"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = FoodEntryBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        food_entries, daily_entries = serializer.save(
+            nutrition_profile=nutrition_profile
+        )
+
+        return Response(
+            {
+                "message": f"{len(food_entries)} food entries added successfully",
+                "food_entries": FoodEntrySerializer(food_entries, many=True).data,
+                "daily_entries": [
+                    {
+                        "id": daily_entry.id,
+                        "date": daily_entry.date,
+                        "total_calories": daily_entry.total_calories,
+                        "total_protein": daily_entry.total_protein,
+                        "total_carbs": daily_entry.total_carbs,
+                        "total_fat": daily_entry.total_fat,
+                    }
+                    for daily_entry in daily_entries
+                ],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(detail=False, methods=["get"])
     def by_meal_type(self, request):
         """
@@ -3,16 +3,22 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from django.db.models import Q, Count
 from django.utils import timezone
+from backend.conditional import resource_etag
 
 from ..models import Food, DietPlan, DietPlanFood
+from ..services import DietPlanService
 from ..serializers.diet_plan import (
     DietPlanSerializer,
     DietPlanDetailSerializer,  # Add this import
     DietPlanListSerializer,
     DietPlanFoodSerializer,
     DietPlanFoodCreateSerializer,
+    DietPlanFoodBulkAddSerializer,
+    DietPlanFoodItemSerializer,
+    ApplyDietPlanSerializer,
 )
 
 
@@ -28,7 +34,7 @@ class DietPlanViewSet(viewsets.ModelViewSet):
         """Filter diet plans by authenticated user"""
         return (
             DietPlan.objects.filter(user_id=self.request.user)
-            .prefetch_related("diet_plan_foods__food")
+            .prefetch_related(DietPlan.diet_plan_foods_prefetch())
             .order_by("-created_at")
         )
 
@@ -82,6 +88,7 @@ class DietPlanViewSet(viewsets.ModelViewSet):
         self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @resource_etag("diet_plans")
     def list(self, request, *args, **kwargs):
         """List all diet plans for the authenticated user with filtering"""
         queryset = self.filter_queryset(self.get_queryset())
@@ -107,6 +114,7 @@ class DietPlanViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    @resource_etag("diet_plans")
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific diet plan with full details"""
         instance = self.get_object()
@@ -153,6 +161,71 @@ class DietPlanViewSet(viewsets.ModelViewSet):
         response_serializer = DietPlanFoodSerializer(diet_plan_food)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=["post"])
+    def add_foods(self, request, pk=None):
+        """Add several foods to a diet plan in one insert"""
+        diet_plan = self.get_object()
+
+        serializer = DietPlanFoodBulkAddSerializer(
+            data={"diet_plan": diet_plan.id, "foods": request.data.get("foods")},
+            context={"request": request},
+        )
+        serializer.is_valid(raise_exception=True)
+        diet_plan_foods = serializer.save()
+
+        response_serializer = DietPlanFoodSerializer(diet_plan_foods, many=True)
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["post"])
+    def apply(self, request, pk=None):
+        """
+        Log this diet plan's foods into the daily entries of one or more dates.
+
+        Body: dates (list of YYYY-MM-DD) or start_date and end_date, plus
+        optional meal_types. Foods already logged from this plan on a date
+        are skipped, so repeating the request is safe.
+        """
+        diet_plan = self.get_object()
+
+        nutrition_profile = getattr(request.user, "nutrition_profile", None)
+        if not nutrition_profile:
+            return Response(
+                {"error": "User does not have a nutrition profile"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = ApplyDietPlanSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = DietPlanService.apply_to_dates(
+            diet_plan,
+            nutrition_profile,
+            serializer.validated_data["dates"],
+            meal_types=serializer.validated_data.get("meal_types"),
+        )
+
+        return Response(
+            {
+                "message": "Diet plan applied successfully",
+                "created": result["created"],
+                "skipped": result["skipped"],
+                "dates": [
+                    {
+                        "date": row["daily_entry"].date,
+                        "daily_entry_id": row["daily_entry"].id,
+                        "created": row["created"],
+                        "skipped": row["skipped"],
+                        "total_calories": row["daily_entry"].total_calories,
+                        "total_protein": row["daily_entry"].total_protein,
+                        "total_carbs": row["daily_entry"].total_carbs,
+                        "total_fat": row["daily_entry"].total_fat,
+                    }
+                    for row in result["dates"]
+                ],
+            },
+            status=status.HTTP_201_CREATED if result["created"] else status.HTTP_200_OK,
+        )
+
     @action(detail=True, methods=["post"])
     def recalculate_totals(self, request, pk=None):
         """Recalculate nutrition totals for the diet plan - similar to daily_entry"""
@@ -168,24 +241,20 @@ class DietPlanViewSet(viewsets.ModelViewSet):
         """Duplicate a diet plan"""
         original_plan = self.get_object()
 
-        # Create new diet plan
-        new_plan = DietPlan.objects.create(
-            user_id=original_plan.user_id,
-            is_alternative=request.data.get("is_alternative", True),
-        )
+        with transaction.atomic():
+            # Create new diet plan
+            new_plan = DietPlan.objects.create(
+                user_id_id=original_plan.user_id_id,
+                is_alternative=request.data.get("is_alternative", True),
+            )
 
-        # Copy foods
-        for diet_plan_food in original_plan.diet_plan_foods.all():
-            DietPlanFood.objects.create(
-                diet_plan=new_plan,
-                food=diet_plan_food.food,
-                meal_type=diet_plan_food.meal_type,
-                serving_type=diet_plan_food.serving_type,
-                fatsecret_serving_id=diet_plan_food.fatsecret_serving_id,
-                custom_serving_unit=diet_plan_food.custom_serving_unit,
-                custom_serving_amount=diet_plan_food.custom_serving_amount,
-                quantity=diet_plan_food.quantity,
-                order=diet_plan_food.order,
+            # Copy foods in one insert (they are already prefetched)
+            DietPlanFood.bulk_add(
+                new_plan,
+                [
+                    diet_plan_food.copy()
+                    for diet_plan_food in original_plan.get_diet_plan_foods()
+                ],
             )
 
         serializer = DietPlanDetailSerializer(new_plan)
@@ -232,7 +301,8 @@ class DietPlanViewSet(viewsets.ModelViewSet):
             )
             diet_plan_food.delete()
 
-            # Return updated diet plan
+            # Return updated diet plan (totals and foods changed)
+            diet_plan.refresh_from_db()
             serializer = self.get_serializer(diet_plan)
             return Response(serializer.data)
 
@@ -288,6 +358,8 @@ class DietPlanViewSet(viewsets.ModelViewSet):
 
         # Get meals breakdown
         meals_breakdown = diet_plan.get_meals_breakdown()
+        for meal in meals_breakdown.values():
+            meal["items"] = DietPlanFoodSerializer(meal["items"], many=True).data
 
         # Calculate nutrition percentages (assuming 2000 calorie diet)
         total_calories = diet_plan.total_calories
@@ -466,16 +538,13 @@ class DietPlanFoodViewSet(viewsets.ModelViewSet):
             )
 
         # Create duplicate
-        duplicated_food = DietPlanFood.objects.create(
-            diet_plan=target_diet_plan,
-            food=original_food.food,
-            meal_type=request.data.get("meal_type", original_food.meal_type),
-            serving_type=original_food.serving_type,
-            fatsecret_serving_id=original_food.fatsecret_serving_id,
-            custom_serving_unit=original_food.custom_serving_unit,
-            custom_serving_amount=original_food.custom_serving_amount,
-            quantity=original_food.quantity,
-            order=original_food.order,
+        (duplicated_food,) = DietPlanFood.bulk_add(
+            target_diet_plan,
+            [
+                original_food.copy(
+                    meal_type=request.data.get("meal_type", original_food.meal_type)
+                )
+            ],
         )
 
         serializer = DietPlanFoodSerializer(duplicated_food)
@@ -483,8 +552,18 @@ class DietPlanFoodViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["post"])
     def quick_add(self, request):
-        """Quickly add a food with minimal information - similar to daily_entry"""
-        required_fields = ["diet_plan", "food", "meal_type"]
+        """
+        Quickly add foods with minimal information - similar to daily_entry.
+
+        Accepts a single food (diet_plan, food, meal_type, ...) or several
+        at once as {"diet_plan": id, "foods": [...]}. Either way the foods
+        are inserted with one bulk_create and the plan totals updated once.
+        """
+        many = "foods" in request.data
+        if many:
+            required_fields = ["diet_plan", "foods"]
+        else:
+            required_fields = ["diet_plan", "food", "meal_type"]
         for field in required_fields:
             if field not in request.data:
                 return Response(
@@ -492,18 +571,25 @@ class DietPlanFoodViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-        # Use default serving and quantity if not provided
-        data = request.data.copy()
-        if "serving_type" not in data:
-            data["serving_type"] = "fatsecret"
-        if "quantity" not in data:
-            data["quantity"] = 1.0
-
-        serializer = DietPlanFoodCreateSerializer(
-            data=data, context={"request": request}
+        # Missing serving_type and quantity fall back to the serializer
+        # defaults (FatSecret serving, quantity 1)
+        if many:
+            foods = request.data["foods"]
+        else:
+            item_fields = DietPlanFoodItemSerializer().fields
+            foods = [
+                {key: request.data[key] for key in item_fields if key in request.data}
+            ]
+
+        serializer = DietPlanFoodBulkAddSerializer(
+            data={"diet_plan": request.data["diet_plan"], "foods": foods},
+            context={"request": request},
         )
         serializer.is_valid(raise_exception=True)
-        diet_plan_food = serializer.save()
+        diet_plan_foods = serializer.save()
 
-        response_serializer = DietPlanFoodSerializer(diet_plan_food)
+        if many:
+            response_serializer = DietPlanFoodSerializer(diet_plan_foods, many=True)
+        else:
+            response_serializer = DietPlanFoodSerializer(diet_plan_foods[0])
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
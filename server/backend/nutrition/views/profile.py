@@ -3,6 +3,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from datetime import date, timedelta
+from backend.conditional import resource_etag
 from ..models import NutritionProfile
 from ..serializers import NutritionProfileSerializer
 
@@ -22,6 +23,16 @@ class NutritionProfileViewSet(viewsets.ModelViewSet):
         """Return nutrition profile for the authenticated user only"""
         return NutritionProfile.objects.filter(account=self.request.user)
 
+    @resource_etag("nutrition", "profile")
+    def list(self, request, *args, **kwargs):
+        """List the user's nutrition profile (304 when unchanged)"""
+        return super().list(request, *args, **kwargs)
+
+    @resource_etag("nutrition", "profile")
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve the user's nutrition profile (304 when unchanged)"""
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=True, methods=["post"])
     def recalculate_macros(self, request, pk=None):
         """
@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+from workouts.models import TemplateHistoryExercise
+from workouts.utils import calculate_set_stats
+
+STAT_FIELDS = ["total_volume", "total_reps", "max_weight", "estimated_1rm"]
+
+
+class Command(BaseCommand):
+    help = "Recompute stored set statistics (volume, reps, max weight, e1RM) for workout history"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            help="Only backfill workout history for this user",
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows to update per query (default: 500)",
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many rows would change without writing",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        queryset = TemplateHistoryExercise.objects.only(
+            "id", "performed_sets_data", *STAT_FIELDS
+        ).order_by("id")
+        if options["user_id"]:
+            queryset = queryset.filter(workout_history__user_id=options["user_id"])
+
+        scanned = 0
+        changed = 0
+        batch = []
+
+        for performed_exercise in queryset.iterator(chunk_size=batch_size):
+            scanned += 1
+            stats = calculate_set_stats(performed_exercise.performed_sets_data)
+
+            if all(
+                getattr(performed_exercise, field) == value
+                for field, value in stats.items()
+            ):
+                continue
+
+            for field, value in stats.items():
+                setattr(performed_exercise, field, value)
+            batch.append(performed_exercise)
+            changed += 1
+
+            if len(batch) >= batch_size:
+                self._flush(batch, dry_run)
+                batch = []
+
+        self._flush(batch, dry_run)
+
+        prefix = "[DRY RUN] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Scanned {scanned} performed exercises, updated {changed}"
+            )
+        )
+
+    def _flush(self, batch, dry_run):
+        if batch and not dry_run:
+            TemplateHistoryExercise.objects.bulk_update(batch, STAT_FIELDS)
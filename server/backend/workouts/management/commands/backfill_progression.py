@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from workouts.models import TemplateHistory
+from workouts.services import ProgressionService
+
+
+class Command(BaseCommand):
+    help = "Rebuild exercise progression points and personal records from workout history"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            help="Only rebuild progression for this user",
+        )
+
+    def handle(self, *args, **options):
+        if options["user_id"]:
+            user_ids = [options["user_id"]]
+        else:
+            user_ids = (
+                TemplateHistory.objects.values_list("user_id", flat=True)
+                .order_by("user_id")
+                .distinct()
+            )
+
+        users = 0
+        total_points = 0
+        total_records = 0
+
+        for user_id in user_ids:
+            points, records = ProgressionService.rebuild_for_user(user_id)
+            users += 1
+            total_points += points
+            total_records += records
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt progression for {users} users: "
+                f"{total_points} points, {total_records} personal records"
+            )
+        )
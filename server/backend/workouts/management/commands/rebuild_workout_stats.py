@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from workouts.models import TemplateHistory, WorkoutStats
+from workouts.services import WorkoutStatsService
+
+
+class Command(BaseCommand):
+    help = "Recompute per-user workout stats counters and daily buckets from workout history"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            help="Only rebuild stats for this user",
+        )
+
+    def handle(self, *args, **options):
+        if options["user_id"]:
+            user_ids = [options["user_id"]]
+        else:
+            # Include users whose history is gone so stale counters are reset
+            user_ids = sorted(
+                set(TemplateHistory.objects.values_list("user_id", flat=True))
+                | set(WorkoutStats.objects.values_list("user_id", flat=True))
+            )
+
+        users = 0
+        total_workouts = 0
+        total_days = 0
+
+        for user_id in user_ids:
+            workouts, days = WorkoutStatsService.rebuild_for_user(user_id)
+            users += 1
+            total_workouts += workouts
+            total_days += days
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt workout stats for {users} users: "
+                f"{total_workouts} workouts across {total_days} days"
+            )
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0010_templateexercise_weight_unit_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='templatehistoryexercise',
+            name='estimated_1rm',
+            field=models.FloatField(blank=True, help_text='Best estimated one-rep max across sets (Epley formula)', null=True),
+        ),
+        migrations.AddField(
+            model_name='templatehistoryexercise',
+            name='max_weight',
+            field=models.FloatField(blank=True, help_text='Heaviest weight lifted in any set', null=True),
+        ),
+        migrations.AddField(
+            model_name='templatehistoryexercise',
+            name='total_reps',
+            field=models.PositiveIntegerField(default=0, help_text='Sum of reps across performed sets'),
+        ),
+        migrations.AddField(
+            model_name='templatehistoryexercise',
+            name='total_volume',
+            field=models.FloatField(default=0, help_text='Sum of reps × weight across performed sets'),
+        ),
+        migrations.AddIndex(
+            model_name='templatehistoryexercise',
+            index=models.Index(fields=['exercise', 'estimated_1rm'], name='workouts_te_exercis_6434b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='templatehistoryexercise',
+            index=models.Index(fields=['exercise', 'max_weight'], name='workouts_te_exercis_ca485f_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:10
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+STAT_FIELDS = ["total_volume", "total_reps", "max_weight", "estimated_1rm"]
+
+
+def calculate_set_stats(sets_data):
+    """
+    Frozen copy of workouts.utils.calculate_set_stats as of this migration,
+    so later changes to the app code don't change the backfill.
+    """
+    total_volume = 0
+    total_reps = 0
+    max_weight = None
+    estimated_1rm = None
+
+    for set_data in sets_data or []:
+        reps = set_data.get("reps", 0) or 0
+        weight = set_data.get("weight", 0) or 0
+
+        total_volume += reps * weight
+        total_reps += reps
+
+        if weight > 0:
+            if max_weight is None or weight > max_weight:
+                max_weight = weight
+
+            # Epley formula; a single rep is the lift itself
+            if reps > 0:
+                set_1rm = weight if reps == 1 else weight * (1 + reps / 30)
+                if estimated_1rm is None or set_1rm > estimated_1rm:
+                    estimated_1rm = set_1rm
+
+    return {
+        "total_volume": round(total_volume, 2),
+        "total_reps": total_reps,
+        "max_weight": max_weight,
+        "estimated_1rm": (
+            round(estimated_1rm, 2) if estimated_1rm is not None else None
+        ),
+    }
+
+
+def backfill_set_stats(apps, schema_editor):
+    TemplateHistoryExercise = apps.get_model("workouts", "TemplateHistoryExercise")
+
+    batch = []
+    queryset = TemplateHistoryExercise.objects.only("id", "performed_sets_data")
+    for performed_exercise in queryset.iterator(chunk_size=BATCH_SIZE):
+        stats = calculate_set_stats(performed_exercise.performed_sets_data)
+        for field, value in stats.items():
+            setattr(performed_exercise, field, value)
+        batch.append(performed_exercise)
+
+        if len(batch) >= BATCH_SIZE:
+            TemplateHistoryExercise.objects.bulk_update(batch, STAT_FIELDS)
+            batch = []
+
+    if batch:
+        TemplateHistoryExercise.objects.bulk_update(batch, STAT_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0011_templatehistoryexercise_set_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_set_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0012_backfill_templatehistoryexercise_set_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExercisePersonalRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('best_weight', models.FloatField(blank=True, null=True)),
+                ('best_weight_reps', models.PositiveIntegerField(default=0)),
+                ('best_weight_at', models.DateTimeField(blank=True, null=True)),
+                ('best_estimated_1rm', models.FloatField(blank=True, null=True)),
+                ('best_estimated_1rm_at', models.DateTimeField(blank=True, null=True)),
+                ('best_session_volume', models.FloatField(default=0)),
+                ('best_session_volume_at', models.DateTimeField(blank=True, null=True)),
+                ('total_sessions', models.PositiveIntegerField(default=0)),
+                ('last_performed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('exercise', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='personal_records', to='workouts.exercise')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='personal_records', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-last_performed_at'],
+                'unique_together': {('user', 'exercise')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ExerciseProgressionPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('completed_at', models.DateTimeField()),
+                ('top_set_weight', models.FloatField(blank=True, null=True)),
+                ('top_set_reps', models.PositiveIntegerField(default=0)),
+                ('weight_unit', models.CharField(default='kg', max_length=3)),
+                ('estimated_1rm', models.FloatField(blank=True, null=True)),
+                ('total_volume', models.FloatField(default=0)),
+                ('total_reps', models.PositiveIntegerField(default=0)),
+                ('exercise', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progression_points', to='workouts.exercise')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exercise_progression', to=settings.AUTH_USER_MODEL)),
+                ('workout_history', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progression_points', to='workouts.templatehistory')),
+            ],
+            options={
+                'ordering': ['completed_at'],
+                'indexes': [models.Index(fields=['user', 'exercise', 'completed_at'], name='workouts_ex_user_id_ffb703_idx')],
+                'unique_together': {('workout_history', 'exercise')},
+            },
+        ),
+    ]
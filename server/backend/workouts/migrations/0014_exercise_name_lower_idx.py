@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:13
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0013_exercise_progression'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exercise',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='workouts_ex_name_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0014_exercise_name_lower_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='templatehistory',
+            index=models.Index(fields=['user_id', '-completed_at', '-id'], name='workouts_te_user_id_d5b26b_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:18
+
+import datetime
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_account_birth_date'),
+        ('workouts', '0015_templatehistory_user_completed_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkoutStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='workout_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_workouts', models.PositiveIntegerField(default=0)),
+                ('total_exercises', models.PositiveIntegerField(default=0)),
+                ('total_sets', models.PositiveIntegerField(default=0)),
+                ('total_duration', models.DurationField(default=datetime.timedelta)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Workout Stats',
+                'verbose_name_plural': 'Workout Stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='WorkoutDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('workouts', models.PositiveIntegerField(default=0)),
+                ('exercises', models.PositiveIntegerField(default=0)),
+                ('sets', models.PositiveIntegerField(default=0)),
+                ('duration', models.DurationField(default=datetime.timedelta)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workout_daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Workout Daily Stats',
+                'verbose_name_plural': 'Workout Daily Stats',
+                'ordering': ['-date'],
+                'unique_together': {('user', 'date')},
+            },
+        ),
+    ]
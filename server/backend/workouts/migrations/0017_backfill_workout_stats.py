@@ -0,0 +1,69 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:40
+
+from datetime import timedelta
+
+from django.db import migrations
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+BATCH_SIZE = 500
+
+
+def backfill_workout_stats(apps, schema_editor):
+    TemplateHistory = apps.get_model("workouts", "TemplateHistory")
+    WorkoutStats = apps.get_model("workouts", "WorkoutStats")
+    WorkoutDailyStats = apps.get_model("workouts", "WorkoutDailyStats")
+
+    history = TemplateHistory.objects.order_by()
+    totals = {
+        "workouts": Count("id"),
+        "exercises": Sum("total_exercises"),
+        "sets": Sum("total_sets"),
+        "duration": Sum("total_duration"),
+    }
+
+    WorkoutStats.objects.bulk_create(
+        [
+            WorkoutStats(
+                user_id=row["user_id"],
+                total_workouts=row["workouts"],
+                total_exercises=row["exercises"] or 0,
+                total_sets=row["sets"] or 0,
+                total_duration=row["duration"] or timedelta(),
+            )
+            for row in history.values("user_id").annotate(**totals)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    WorkoutDailyStats.objects.bulk_create(
+        [
+            WorkoutDailyStats(
+                user_id=row["user_id"],
+                date=row["date"],
+                workouts=row["workouts"],
+                exercises=row["exercises"] or 0,
+                sets=row["sets"] or 0,
+                duration=row["duration"] or timedelta(),
+            )
+            for row in history.annotate(date=TruncDate("completed_at"))
+            .values("user_id", "date")
+            .annotate(**totals)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def clear_workout_stats(apps, schema_editor):
+    apps.get_model("workouts", "WorkoutDailyStats").objects.all().delete()
+    apps.get_model("workouts", "WorkoutStats").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0016_workout_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_workout_stats, clear_workout_stats),
+    ]
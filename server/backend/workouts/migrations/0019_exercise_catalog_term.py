@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-19 11:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0018_exercise_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExerciseCatalogTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=255, unique=True)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('fetched_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,103 @@
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+# Exact by definition of the international pound; inlined so later changes
+# to workouts.utils don't change what this migration does
+KG_PER_LB = 0.45359237
+
+RECORD_FIELDS = [
+    "best_weight",
+    "best_weight_reps",
+    "best_weight_at",
+    "best_estimated_1rm",
+    "best_estimated_1rm_at",
+    "best_session_volume",
+    "best_session_volume_at",
+]
+
+
+def to_kg(value, unit):
+    if value is None or unit != "lbs":
+        return value
+    return value * KG_PER_LB
+
+
+def recompute_records_in_kg(apps, schema_editor):
+    """
+    Personal records used to compare raw weights across units. Recompute the
+    records of every exercise that has points logged in lbs, in kg.
+    """
+    ExerciseProgressionPoint = apps.get_model("workouts", "ExerciseProgressionPoint")
+    ExercisePersonalRecord = apps.get_model("workouts", "ExercisePersonalRecord")
+
+    pairs = set(
+        ExerciseProgressionPoint.objects.filter(weight_unit="lbs")
+        .values_list("user_id", "exercise_id")
+        .distinct()
+    )
+    if not pairs:
+        return
+
+    best = {}
+    user_ids = {user_id for user_id, _ in pairs}
+    points = ExerciseProgressionPoint.objects.filter(user_id__in=user_ids).order_by(
+        "completed_at", "id"
+    )
+    for point in points.iterator(chunk_size=BATCH_SIZE):
+        key = (point.user_id, point.exercise_id)
+        if key not in pairs:
+            continue
+        values = best.setdefault(key, dict.fromkeys(RECORD_FIELDS))
+        weight = to_kg(point.top_set_weight, point.weight_unit)
+        estimated_1rm = to_kg(point.estimated_1rm, point.weight_unit)
+        volume = to_kg(point.total_volume, point.weight_unit)
+
+        if weight is not None and (
+            values["best_weight"] is None
+            or weight > values["best_weight"]
+            or (
+                weight == values["best_weight"]
+                and point.top_set_reps > values["best_weight_reps"]
+            )
+        ):
+            values["best_weight"] = weight
+            values["best_weight_reps"] = point.top_set_reps
+            values["best_weight_at"] = point.completed_at
+
+        if estimated_1rm is not None and (
+            values["best_estimated_1rm"] is None
+            or estimated_1rm > values["best_estimated_1rm"]
+        ):
+            values["best_estimated_1rm"] = estimated_1rm
+            values["best_estimated_1rm_at"] = point.completed_at
+
+        if volume > (values["best_session_volume"] or 0):
+            values["best_session_volume"] = volume
+            values["best_session_volume_at"] = point.completed_at
+
+    records = []
+    for record in ExercisePersonalRecord.objects.filter(user_id__in=user_ids):
+        values = best.get((record.user_id, record.exercise_id))
+        if values is None:
+            continue
+        for field, value in values.items():
+            setattr(record, field, value)
+        record.best_weight_reps = record.best_weight_reps or 0
+        record.best_session_volume = record.best_session_volume or 0
+        records.append(record)
+
+    ExercisePersonalRecord.objects.bulk_update(
+        records, RECORD_FIELDS, batch_size=BATCH_SIZE
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workouts", "0019_exercise_catalog_term"),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_records_in_kg, migrations.RunPython.noop),
+    ]
@@ -7,8 +7,22 @@ from .template import (
 
 from .exercise import (
     Exercise,
+    ExerciseCatalogTerm,
 )
 
+from .progression import (
+    ExerciseProgressionPoint,
+    ExercisePersonalRecord,
+)
+
+from .stats import (
+    WorkoutStats,
+    WorkoutDailyStats,
+)
+
+# Import signals to ensure they're registered
+from . import signals
+
 __all__ = [
     # Template
     "Template",
@@ -17,4 +31,11 @@ __all__ = [
     "TemplateHistoryExercise",
     # Exercise
     "Exercise",
+    "ExerciseCatalogTerm",
+    # Progression
+    "ExerciseProgressionPoint",
+    "ExercisePersonalRecord",
+    # Stats
+    "WorkoutStats",
+    "WorkoutDailyStats",
 ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class Exercise(models.Model):
@@ -15,10 +16,31 @@ class Exercise(models.Model):
 
     # Add this to track when we first saved this exercise
     created_at = models.DateTimeField(auto_now_add=True)
+    # Part of the catalog version the search index is checked against
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["muscle"]),
             models.Index(fields=["difficulty"]),
+            # Case-insensitive name lookups when saving workouts
+            models.Index(Lower("name"), name="workouts_ex_name_lower_idx"),
         ]
+
+
+class ExerciseCatalogTerm(models.Model):
+    """
+    Remote catalog lookups, shared by every process.
+
+    One row per normalized search term (name|muscle|difficulty). claimed_at
+    marks a lookup in progress so concurrent searches don't repeat it;
+    fetched_at records when the results were stored in Exercise.
+    """
+
+    term = models.CharField(max_length=255, unique=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    fetched_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.term
@@ -0,0 +1,137 @@
+from django.db import models
+from accounts.models import Account
+from ..utils import to_kg
+from .exercise import Exercise
+from .template import TemplateHistory
+
+
+class ExerciseProgressionPoint(models.Model):
+    """
+    One point per exercise per completed workout: the session's top set.
+    Forms the time series behind progression charts.
+    """
+
+    user = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name="exercise_progression",
+    )
+    exercise = models.ForeignKey(
+        Exercise,
+        on_delete=models.CASCADE,
+        related_name="progression_points",
+    )
+    workout_history = models.ForeignKey(
+        TemplateHistory,
+        on_delete=models.CASCADE,
+        related_name="progression_points",
+    )
+
+    # Copied from the workout so charts never join back to history
+    completed_at = models.DateTimeField()
+
+    # Heaviest set of the session (ties broken by reps)
+    top_set_weight = models.FloatField(null=True, blank=True)
+    top_set_reps = models.PositiveIntegerField(default=0)
+    weight_unit = models.CharField(max_length=3, default="kg")
+
+    estimated_1rm = models.FloatField(null=True, blank=True)
+    total_volume = models.FloatField(default=0)
+    total_reps = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["completed_at"]
+        unique_together = ("workout_history", "exercise")
+        indexes = [
+            models.Index(fields=["user", "exercise", "completed_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.exercise.name} - {self.completed_at.strftime('%Y-%m-%d')}"
+
+
+class ExercisePersonalRecord(models.Model):
+    """
+    Best-ever results for a user on a single exercise.
+    Maintained incrementally as workouts are saved. Weights and volume are
+    stored in kg whatever unit the workouts were logged in.
+    """
+
+    user = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name="personal_records",
+    )
+    exercise = models.ForeignKey(
+        Exercise,
+        on_delete=models.CASCADE,
+        related_name="personal_records",
+    )
+
+    # Heaviest set ever lifted
+    best_weight = models.FloatField(null=True, blank=True)
+    best_weight_reps = models.PositiveIntegerField(default=0)
+    best_weight_at = models.DateTimeField(null=True, blank=True)
+
+    # Best estimated one-rep max
+    best_estimated_1rm = models.FloatField(null=True, blank=True)
+    best_estimated_1rm_at = models.DateTimeField(null=True, blank=True)
+
+    # Highest single-session volume
+    best_session_volume = models.FloatField(default=0)
+    best_session_volume_at = models.DateTimeField(null=True, blank=True)
+
+    total_sessions = models.PositiveIntegerField(default=0)
+    last_performed_at = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("user", "exercise")
+        ordering = ["-last_performed_at"]
+
+    def __str__(self):
+        return f"{self.user.email} - {self.exercise.name} PR"
+
+    def apply_point(self, point):
+        """
+        Fold a progression point into this record, converting it to kg.
+
+        Returns:
+            list: Names of the records that were improved
+        """
+        improved = []
+        top_set_weight = to_kg(point.top_set_weight, point.weight_unit)
+        estimated_1rm = to_kg(point.estimated_1rm, point.weight_unit)
+        total_volume = to_kg(point.total_volume, point.weight_unit)
+
+        if top_set_weight is not None and (
+            self.best_weight is None
+            or top_set_weight > self.best_weight
+            or (
+                top_set_weight == self.best_weight
+                and point.top_set_reps > self.best_weight_reps
+            )
+        ):
+            self.best_weight = top_set_weight
+            self.best_weight_reps = point.top_set_reps
+            self.best_weight_at = point.completed_at
+            improved.append("best_weight")
+
+        if estimated_1rm is not None and (
+            self.best_estimated_1rm is None or estimated_1rm > self.best_estimated_1rm
+        ):
+            self.best_estimated_1rm = estimated_1rm
+            self.best_estimated_1rm_at = point.completed_at
+            improved.append("best_estimated_1rm")
+
+        if total_volume > self.best_session_volume:
+            self.best_session_volume = total_volume
+            self.best_session_volume_at = point.completed_at
+            improved.append("best_session_volume")
+
+        self.total_sessions += 1
+        if self.last_performed_at is None or point.completed_at > self.last_performed_at:
+            self.last_performed_at = point.completed_at
+
+        return improved
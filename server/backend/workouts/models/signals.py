@@ -0,0 +1,89 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from accounts.models import ResourceVersion
+from accounts.models.signals import deleted_with_account
+from .template import Template, TemplateExercise, TemplateHistory
+from .exercise import Exercise
+from .progression import ExerciseProgressionPoint
+from .stats import apply_workout_to_stats
+
+
+@receiver(post_save, sender=TemplateHistory)
+def add_workout_to_stats(sender, instance, created, **kwargs):
+    """Count a newly saved workout in the user's running stats"""
+    if created:
+        apply_workout_to_stats(instance, sign=1)
+
+
+@receiver(post_delete, sender=TemplateHistory)
+def remove_workout_from_stats(sender, instance, **kwargs):
+    """Take a deleted workout out of the user's running stats"""
+    apply_workout_to_stats(instance, sign=-1)
+
+
+@receiver(pre_delete, sender=TemplateHistory)
+def remember_progression_exercises(sender, instance, origin=None, **kwargs):
+    """Note the exercises a workout counts toward before its points cascade"""
+    if deleted_with_account(origin):
+        return
+    instance._progression_exercise_ids = list(
+        ExerciseProgressionPoint.objects.filter(workout_history=instance).values_list(
+            "exercise_id", flat=True
+        )
+    )
+
+
+@receiver(post_delete, sender=TemplateHistory)
+def rebuild_records_for_deleted_workout(sender, instance, **kwargs):
+    """A deleted workout must stop counting toward personal records"""
+    exercise_ids = getattr(instance, "_progression_exercise_ids", None)
+    if not exercise_ids:
+        return
+
+    from ..services import ProgressionService
+
+    ProgressionService.rebuild_records(instance.user_id_id, exercise_ids)
+
+
+# Resource versions (ETags of the template read endpoints)
+
+
+@receiver(post_save, sender=Template)
+@receiver(post_delete, sender=Template)
+def bump_template_version(sender, instance, origin=None, **kwargs):
+    """Bump the workouts version when a template changes"""
+    if deleted_with_account(origin):
+        return
+    ResourceVersion.bump([instance.user_id_id], "workouts")
+
+
+@receiver(post_save, sender=TemplateExercise)
+@receiver(post_delete, sender=TemplateExercise)
+def bump_template_exercise_version(sender, instance, origin=None, **kwargs):
+    """Bump the workouts version when a template's exercises change"""
+    if deleted_with_account(origin):
+        return
+
+    if TemplateExercise.template.is_cached(instance):
+        account_ids = [instance.template.user_id_id]
+    else:
+        # e.g. exercises deleted along with their template
+        account_ids = Template.objects.filter(pk=instance.template_id).values_list(
+            "user_id", flat=True
+        )
+    ResourceVersion.bump(account_ids, "workouts")
+
+
+@receiver(post_save, sender=Exercise)
+def bump_exercise_versions(sender, instance, created, **kwargs):
+    """Exercises are shared: bump every account with a template using this one"""
+    if created:
+        return
+
+    ResourceVersion.bump(
+        Template.objects.filter(template_exercises__exercise=instance)
+        .values_list("user_id", flat=True)
+        .distinct(),
+        "workouts",
+    )
@@ -0,0 +1,107 @@
+from datetime import timedelta
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+from accounts.models import Account
+
+
+class WorkoutStats(models.Model):
+    """
+    Running lifetime workout totals for a user.
+    Maintained incrementally as workout history is created and deleted.
+    """
+
+    user = models.OneToOneField(
+        Account,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="workout_stats",
+    )
+
+    total_workouts = models.PositiveIntegerField(default=0)
+    total_exercises = models.PositiveIntegerField(default=0)
+    total_sets = models.PositiveIntegerField(default=0)
+    total_duration = models.DurationField(default=timedelta)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Workout Stats"
+        verbose_name_plural = "Workout Stats"
+
+    def __str__(self):
+        return f"{self.user.email} - {self.total_workouts} workouts"
+
+
+class WorkoutDailyStats(models.Model):
+    """
+    Per-day workout totals for a user, keyed by the local completion date.
+    Rolling windows (last 7/30 days) are sums over these buckets.
+    """
+
+    user = models.ForeignKey(
+        Account,
+        on_delete=models.CASCADE,
+        related_name="workout_daily_stats",
+    )
+    date = models.DateField()
+
+    workouts = models.PositiveIntegerField(default=0)
+    exercises = models.PositiveIntegerField(default=0)
+    sets = models.PositiveIntegerField(default=0)
+    duration = models.DurationField(default=timedelta)
+
+    class Meta:
+        ordering = ["-date"]
+        unique_together = ("user", "date")
+        verbose_name = "Workout Daily Stats"
+        verbose_name_plural = "Workout Daily Stats"
+
+    def __str__(self):
+        return f"{self.user.email} - {self.date}: {self.workouts} workouts"
+
+
+def apply_workout_to_stats(workout_history, sign=1):
+    """
+    Add (sign=1) or remove (sign=-1) one workout from its user's counters.
+
+    Uses F() expressions so concurrent saves for the same user never lose
+    updates. Rows are only created when adding; removing from a user whose
+    counters were never built is a no-op.
+    """
+    user_id = workout_history.user_id_id
+    duration = workout_history.total_duration or timedelta()
+    local_date = timezone.localdate(workout_history.completed_at)
+
+    totals = {
+        "total_workouts": F("total_workouts") + sign,
+        "total_exercises": F("total_exercises") + sign * workout_history.total_exercises,
+        "total_sets": F("total_sets") + sign * workout_history.total_sets,
+        "total_duration": F("total_duration") + sign * duration,
+    }
+    bucket = {
+        "workouts": F("workouts") + sign,
+        "exercises": F("exercises") + sign * workout_history.total_exercises,
+        "sets": F("sets") + sign * workout_history.total_sets,
+        "duration": F("duration") + sign * duration,
+    }
+
+    with transaction.atomic():
+        if sign > 0:
+            WorkoutStats.objects.bulk_create(
+                [WorkoutStats(user_id=user_id)], ignore_conflicts=True
+            )
+            WorkoutDailyStats.objects.bulk_create(
+                [WorkoutDailyStats(user_id=user_id, date=local_date)],
+                ignore_conflicts=True,
+            )
+
+        WorkoutStats.objects.filter(user_id=user_id).update(**totals)
+        WorkoutDailyStats.objects.filter(user_id=user_id, date=local_date).update(
+            **bucket
+        )
+
+        if sign < 0:
+            WorkoutDailyStats.objects.filter(
+                user_id=user_id, date=local_date, workouts__lte=0
+            ).delete()
@@ -2,6 +2,7 @@ from django.db import models
 from django.db.models import JSONField
 from accounts.models import Account
 from .exercise import Exercise
+from ..utils import calculate_set_stats
 
 
 class WeightUnitChoices(models.TextChoices):
@@ -173,6 +174,10 @@ class TemplateHistory(models.Model):
 
     class Meta:
         ordering = ["-completed_at"]
+        indexes = [
+            # Keyset pagination of a user's history by (completed_at, id)
+            models.Index(fields=["user_id", "-completed_at", "-id"]),
+        ]
         verbose_name = "Workout History"
         verbose_name_plural = "Workout Histories"
 
@@ -236,6 +241,22 @@ class TemplateHistoryExercise(models.Model):
         default=0, help_text="Total number of sets performed for this exercise"
     )
 
+    # Derived set statistics, materialized so they can be filtered/aggregated in SQL
+    total_volume = models.FloatField(
+        default=0, help_text="Sum of reps × weight across performed sets"
+    )
+    total_reps = models.PositiveIntegerField(
+        default=0, help_text="Sum of reps across performed sets"
+    )
+    max_weight = models.FloatField(
+        null=True, blank=True, help_text="Heaviest weight lifted in any set"
+    )
+    estimated_1rm = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Best estimated one-rep max across sets (Epley formula)",
+    )
+
     # Optional exercise-specific notes
     exercise_notes = models.TextField(
         blank=True, help_text="Notes specific to this exercise during the workout"
@@ -252,16 +273,26 @@ class TemplateHistoryExercise(models.Model):
     class Meta:
         ordering = ["order", "created_at"]
         unique_together = ("workout_history", "exercise", "order")
+        indexes = [
+            models.Index(fields=["exercise", "estimated_1rm"]),
+            models.Index(fields=["exercise", "max_weight"]),
+        ]
 
     def __str__(self):
         return f"{self.exercise_name} - {self.workout_history.template_title}"
 
     def save(self, *args, **kwargs):
-        """Override save to calculate total sets performed"""
+        """Override save to calculate total sets performed and set statistics"""
         if self.performed_sets_data:
             self.total_sets_performed = len(self.performed_sets_data)
+        self.refresh_set_stats()
         super().save(*args, **kwargs)
 
+    def refresh_set_stats(self):
+        """Recompute the materialized set statistics from performed_sets_data"""
+        for field, value in calculate_set_stats(self.performed_sets_data).items():
+            setattr(self, field, value)
+
     @property
     def formatted_sets_display(self):
         """Return a formatted string representation of performed sets"""
@@ -276,17 +307,3 @@ class TemplateHistoryExercise(models.Model):
             sets_display.append(f"Set {i}: {reps} reps @ {weight}{unit}")
 
         return " | ".join(sets_display)
-
-    @property
-    def total_volume(self):
-        """Calculate total volume (reps × weight) for this exercise"""
-        if not self.performed_sets_data:
-            return 0
-
-        total = 0
-        for set_data in self.performed_sets_data:
-            reps = set_data.get("reps", 0) or 0
-            weight = set_data.get("weight", 0) or 0
-            total += reps * weight
-
-        return round(total, 2)
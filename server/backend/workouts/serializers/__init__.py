@@ -7,6 +7,7 @@ from .template import (
     UpdateTemplateWithExercisesSerializer,
     SaveCompletedWorkoutSerializer,
     TemplateHistorySerializer,
+    TemplateHistoryListSerializer,
     TemplateHistoryExerciseSerializer,
 )
 
@@ -14,6 +15,11 @@ from .exercise import (
     ExerciseSerializer,
 )
 
+from .progression import (
+    ExercisePersonalRecordSerializer,
+    ExerciseProgressionPointSerializer,
+)
+
 
 __all__ = [
     # Template
@@ -25,7 +31,11 @@ __all__ = [
     "UpdateTemplateWithExercisesSerializer",
     "SaveCompletedWorkoutSerializer",
     "TemplateHistorySerializer",
+    "TemplateHistoryListSerializer",
     "TemplateHistoryExerciseSerializer",
     # Exercise
     "ExerciseSerializer",
+    # Progression
+    "ExercisePersonalRecordSerializer",
+    "ExerciseProgressionPointSerializer",
 ]
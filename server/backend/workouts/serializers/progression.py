@@ -0,0 +1,54 @@
+from rest_framework import serializers
+from ..models import ExerciseProgressionPoint, ExercisePersonalRecord
+
+
+class ExercisePersonalRecordSerializer(serializers.ModelSerializer):
+    """
+    Serializer for a user's best results on one exercise
+    """
+
+    exercise_name = serializers.CharField(source="exercise.name", read_only=True)
+    # Records are kept in kg whatever unit the workouts were logged in
+    weight_unit = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExercisePersonalRecord
+        fields = [
+            "id",
+            "exercise",
+            "exercise_name",
+            "weight_unit",
+            "best_weight",
+            "best_weight_reps",
+            "best_weight_at",
+            "best_estimated_1rm",
+            "best_estimated_1rm_at",
+            "best_session_volume",
+            "best_session_volume_at",
+            "total_sessions",
+            "last_performed_at",
+        ]
+        read_only_fields = fields
+
+    def get_weight_unit(self, obj):
+        return "kg"
+
+
+class ExerciseProgressionPointSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one point of an exercise progression chart
+    """
+
+    class Meta:
+        model = ExerciseProgressionPoint
+        fields = [
+            "workout_history",
+            "completed_at",
+            "top_set_weight",
+            "top_set_reps",
+            "weight_unit",
+            "estimated_1rm",
+            "total_volume",
+            "total_reps",
+        ]
+        read_only_fields = fields
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.db import models
+from django.db.models.functions import Lower
 from ..models import (
     Template,
     TemplateExercise,
@@ -35,10 +36,9 @@ class TemplateSerializer(serializers.ModelSerializer):
         """
         Return all template exercises for this template
         """
-        # Use prefetch_related to avoid N+1 queries if available
-        template_exercises = obj.template_exercises.all().order_by(
-            "order", "created_at"
-        )
+        # Default ordering is ("order", "created_at"), so .all() keeps using
+        # the prefetch cache when available instead of re-querying
+        template_exercises = obj.template_exercises.all()
         return TemplateExerciseSerializer(
             template_exercises, many=True, read_only=True
         ).data
@@ -181,6 +181,33 @@ class TemplateHistorySerializer(serializers.ModelSerializer):
         }
 
 
+class TemplateHistoryListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for paging through workout history.
+    Omits per-set data; exercises are fetched per workout from
+    /workouts/history/{id}/exercises/
+    """
+
+    duration_minutes = serializers.ReadOnlyField()
+
+    class Meta:
+        model = TemplateHistory
+        fields = [
+            "id",
+            "original_template",
+            "template_title",
+            "started_at",
+            "completed_at",
+            "total_duration",
+            "duration_minutes",
+            "total_exercises",
+            "total_sets",
+            "workout_notes",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
 class SaveCompletedWorkoutSerializer(serializers.Serializer):
     """
     Serializer for saving a completed workout to history
@@ -214,8 +241,10 @@ class SaveCompletedWorkoutSerializer(serializers.Serializer):
             template = Template.objects.get(id=value)
             # Check if template belongs to the requesting user
             request = self.context.get("request")
-            if request and template.user_id != request.user:
+            if request and template.user_id_id != request.user.id:
                 raise serializers.ValidationError("Template not found or access denied")
+            # Keep the instance so create() doesn't fetch it again
+            self._original_template = template
             return value
         except Template.DoesNotExist:
             raise serializers.ValidationError("Template not found")
@@ -276,21 +305,43 @@ class SaveCompletedWorkoutSerializer(serializers.Serializer):
         return data
 
     def create(self, validated_data):
-        """Create a new workout history from completed workout data"""
+        """
+        Create a new workout history from completed workout data.
+        Runs a constant number of queries regardless of session length:
+        one exercise lookup, one history insert and one bulk insert.
+        """
         from django.db import transaction
 
         completed_exercises_data = validated_data.pop("completed_exercises")
         request = self.context.get("request")
 
+        # Resolve every exercise name in one case-insensitive query
+        exercises_by_name = self._resolve_exercises(
+            ex["exercise_name"] for ex in completed_exercises_data
+        )
+
+        # Build history rows and their derived set stats up front
+        performed_exercises = []
+        for order, exercise_data in enumerate(completed_exercises_data):
+            exercise_name = exercise_data["exercise_name"]
+            performed = TemplateHistoryExercise(
+                # Can be None if exercise not found
+                exercise=exercises_by_name.get(exercise_name.lower()),
+                exercise_name=exercise_name,
+                performed_sets_data=exercise_data["performed_sets_data"],
+                weight_unit=exercise_data.get("weight_unit", "kg"),
+                exercise_notes=exercise_data.get("exercise_notes", ""),
+                order=exercise_data.get("order", order),
+                total_sets_performed=len(exercise_data["performed_sets_data"]),
+            )
+            performed.refresh_set_stats()
+            performed_exercises.append(performed)
+
         with transaction.atomic():
-            # Get the original template if provided
+            # Template was validated above; it may be missing if deleted since
             original_template = None
-            template_id = validated_data.get("template_id")
-            if template_id:
-                try:
-                    original_template = Template.objects.get(id=template_id)
-                except Template.DoesNotExist:
-                    pass  # Template was deleted, that's okay
+            if validated_data.get("template_id"):
+                original_template = getattr(self, "_original_template", None)
 
             # Create the workout history
             workout_history = TemplateHistory.objects.create(
@@ -300,40 +351,33 @@ class SaveCompletedWorkoutSerializer(serializers.Serializer):
                 started_at=validated_data["started_at"],
                 completed_at=validated_data["completed_at"],
                 workout_notes=validated_data.get("workout_notes", ""),
-                total_exercises=len(completed_exercises_data),
-                total_sets=sum(
-                    len(ex["performed_sets_data"]) for ex in completed_exercises_data
-                ),
+                total_exercises=len(performed_exercises),
+                total_sets=sum(p.total_sets_performed for p in performed_exercises),
             )
 
-            # Create history exercises
-            for order, exercise_data in enumerate(completed_exercises_data):
-                # Try to find the exercise in our database
-                exercise = None
-                exercise_name = exercise_data["exercise_name"]
+            for performed in performed_exercises:
+                performed.workout_history = workout_history
 
-                # Look for exercise by name (you might want to improve this matching)
-                try:
-                    exercise = Exercise.objects.filter(
-                        name__iexact=exercise_name
-                    ).first()
-                except Exercise.DoesNotExist:
-                    pass
-
-                # If exercise not found, you might want to create it or handle it differently
-                # For now, we'll store the data even without an exercise reference
-
-                TemplateHistoryExercise.objects.create(
-                    workout_history=workout_history,
-                    exercise=exercise,  # Can be None if exercise not found
-                    exercise_name=exercise_name,
-                    performed_sets_data=exercise_data["performed_sets_data"],
-                    weight_unit=exercise_data.get("weight_unit", "kg"),
-                    exercise_notes=exercise_data.get("exercise_notes", ""),
-                    order=exercise_data.get("order", order),
-                )
+            # bulk_create skips save(), so stats and counts are set above
+            TemplateHistoryExercise.objects.bulk_create(performed_exercises)
 
-            return workout_history
+        return workout_history
+
+    @staticmethod
+    def _resolve_exercises(names):
+        """
+        Map lowercased exercise names to Exercise rows in a single query,
+        using the functional index on LOWER(name).
+        """
+        lowered = {name.lower() for name in names}
+        exercises_by_name = {}
+        for exercise in (
+            Exercise.objects.annotate(name_lower=Lower("name"))
+            .filter(name_lower__in=lowered)
+            .order_by("id")
+        ):
+            exercises_by_name.setdefault(exercise.name_lower, exercise)
+        return exercises_by_name
 
 
 class AddExercisesToTemplateSerializer(serializers.Serializer):
@@ -518,6 +562,16 @@ class UpdateTemplateWithExercisesSerializer(serializers.ModelSerializer):
                         f"Exercise must have a '{field}' field"
                     )
 
+            # Rows are matched by integer pk; clients may send ids as strings
+            template_exercise_id = exercise_data.get("template_exercise_id")
+            if template_exercise_id:
+                try:
+                    exercise_data["template_exercise_id"] = int(template_exercise_id)
+                except (TypeError, ValueError):
+                    raise serializers.ValidationError(
+                        f"Invalid template_exercise_id: {template_exercise_id!r}"
+                    )
+
             # Validate sets_data if provided
             sets_data = exercise_data.get("sets_data", [])
             if sets_data:
@@ -535,19 +589,20 @@ class UpdateTemplateWithExercisesSerializer(serializers.ModelSerializer):
         return value
 
     def update(self, instance, validated_data):
-        """Update template and replace exercises with the provided list"""
+        """
+        Update template and replace exercises with the provided list.
+
+        Current rows are loaded once and diffed against the payload into
+        add/update/remove sets, which are applied with one bulk_create, one
+        bulk_update and one delete.
+        """
         from django.db import transaction
-        from django.db import models
         import logging
 
         logger = logging.getLogger(__name__)
 
         exercises_data = validated_data.pop("exercises", None)
 
-        logger.info(
-            f"Updating template {instance.id} with {len(exercises_data) if exercises_data else 0} exercises"
-        )
-
         with transaction.atomic():
             # Update template basic fields
             instance.title = validated_data.get("title", instance.title)
@@ -558,139 +613,138 @@ class UpdateTemplateWithExercisesSerializer(serializers.ModelSerializer):
 
             # If exercises data is provided, replace all exercises
             if exercises_data is not None:
-                # Get all current template exercises for this template
-                current_template_exercises = list(instance.template_exercises.all())
-                current_exercise_ids = {te.id for te in current_template_exercises}
-
-                # Get the IDs of exercises we want to keep/update
-                provided_exercise_ids = set()
-                for exercise_data in exercises_data:
-                    template_exercise_id = exercise_data.get("template_exercise_id")
-                    if template_exercise_id:
-                        provided_exercise_ids.add(template_exercise_id)
-
-                # Find exercises to remove (existing ones not in the provided list)
-                exercises_to_remove = current_exercise_ids - provided_exercise_ids
-
-                logger.info(f"Current exercises: {current_exercise_ids}")
-                logger.info(f"Provided exercises: {provided_exercise_ids}")
-                logger.info(f"Exercises to remove: {exercises_to_remove}")
-
-                # Remove exercises that weren't included in the update
-                if exercises_to_remove:
-                    removed_count = TemplateExercise.objects.filter(
-                        id__in=exercises_to_remove, template=instance
-                    ).delete()[0]
-                    logger.info(f"Removed {removed_count} exercises")
-                else:
-                    removed_count = 0
-
-                # Now process the exercises we want to keep/add
-                updated_exercises = []
-                added_exercises = []
-
-                for i, exercise_data in enumerate(exercises_data):
-                    logger.info(
-                        f"Processing exercise {i+1}: {exercise_data.get('name')} - ID: {exercise_data.get('template_exercise_id')}"
-                    )
+                instance._update_info = self._apply_exercise_diff(
+                    instance, exercises_data
+                )
 
-                    # Get or create the exercise in our database
-                    exercise, created = Exercise.objects.get_or_create(
-                        name=exercise_data["name"].strip(),
-                        defaults={
-                            "type": exercise_data.get("type", ""),
-                            "muscle": exercise_data.get("muscle", ""),
-                            "equipment": exercise_data.get("equipment", ""),
-                            "difficulty": exercise_data.get("difficulty", ""),
-                            "instructions": exercise_data.get("instructions", ""),
-                        },
-                    )
+                logger.info(
+                    f"Updated template {instance.id}: "
+                    f"{instance._update_info['updated_count']} updated, "
+                    f"{instance._update_info['added_count']} added, "
+                    f"{instance._update_info['removed_count']} removed"
+                )
 
-                    # Check if template_exercise_id is provided (for updating existing)
-                    template_exercise_id = exercise_data.get("template_exercise_id")
+        return instance
 
-                    if template_exercise_id:
-                        logger.info(
-                            f"Updating existing template exercise ID: {template_exercise_id}"
-                        )
-                        # Update existing template exercise
-                        try:
-                            template_exercise = TemplateExercise.objects.get(
-                                id=template_exercise_id, template=instance
-                            )
-                            # Update the fields
-                            old_sets = template_exercise.sets_data.copy()
-                            template_exercise.sets_data = exercise_data.get(
-                                "sets_data", template_exercise.sets_data
-                            )
-                            template_exercise.weight_unit = exercise_data.get(
-                                "weight_unit", template_exercise.weight_unit
-                            )
-                            template_exercise.rest_time = exercise_data.get(
-                                "rest_time", template_exercise.rest_time
-                            )
-                            template_exercise.notes = exercise_data.get(
-                                "notes", template_exercise.notes
-                            )
-                            template_exercise.order = exercise_data.get(
-                                "order", template_exercise.order
-                            )
-                            template_exercise.save()
-                            logger.info(
-                                f"Updated sets from {old_sets} to {template_exercise.sets_data}"
-                            )
-                            updated_exercises.append(template_exercise)
-                        except TemplateExercise.DoesNotExist:
-                            logger.warning(
-                                f"Template exercise ID {template_exercise_id} not found, creating new"
-                            )
-                            # If template_exercise_id doesn't exist, create new one
-                            template_exercise = self._create_template_exercise(
-                                instance, exercise, exercise_data
-                            )
-                            added_exercises.append(template_exercise)
-                    else:
-                        logger.info(
-                            f"No template_exercise_id provided, creating new exercise"
-                        )
-                        # Create new template exercise
-                        template_exercise = self._create_template_exercise(
-                            instance, exercise, exercise_data
-                        )
-                        added_exercises.append(template_exercise)
+    def _apply_exercise_diff(self, template, exercises_data):
+        """Diff the payload against current rows and apply it in bulk"""
+        current = {te.id: te for te in template.template_exercises.all()}
 
-                logger.info(
-                    f"Update complete: {len(updated_exercises)} updated, {len(added_exercises)} added, {removed_count} removed"
+        provided_ids = {
+            ex.get("template_exercise_id")
+            for ex in exercises_data
+            if ex.get("template_exercise_id")
+        }
+        removed_ids = set(current) - provided_ids
+
+        exercises_by_name = self._get_or_create_exercises(exercises_data)
+
+        # Next free order slot, mirroring rows as they are updated/added
+        max_order = max(
+            (te.order for te_id, te in current.items() if te_id not in removed_ids),
+            default=-1,
+        )
+
+        to_update = []
+        to_create = []
+
+        for exercise_data in exercises_data:
+            exercise = exercises_by_name[exercise_data["name"].strip()]
+            template_exercise = current.get(exercise_data.get("template_exercise_id"))
+
+            if template_exercise is not None:
+                template_exercise.sets_data = exercise_data.get(
+                    "sets_data", template_exercise.sets_data
+                )
+                template_exercise.weight_unit = exercise_data.get(
+                    "weight_unit", template_exercise.weight_unit
                 )
+                template_exercise.rest_time = exercise_data.get(
+                    "rest_time", template_exercise.rest_time
+                )
+                template_exercise.notes = exercise_data.get(
+                    "notes", template_exercise.notes
+                )
+                template_exercise.order = exercise_data.get(
+                    "order", template_exercise.order
+                )
+                to_update.append(template_exercise)
+            else:
+                # Missing or unknown template_exercise_id: create a new row
+                template_exercise = TemplateExercise(
+                    template=template,
+                    exercise=exercise,
+                    sets_data=exercise_data.get("sets_data", []),
+                    weight_unit=exercise_data.get("weight_unit", "kg"),
+                    rest_time=exercise_data.get("rest_time"),
+                    notes=exercise_data.get("notes", ""),
+                    order=exercise_data.get("order", max_order + 1),
+                )
+                to_create.append(template_exercise)
+
+            # bulk paths skip save(), so keep total_sets in sync here
+            if template_exercise.sets_data:
+                template_exercise.total_sets = len(template_exercise.sets_data)
+            max_order = max(max_order, template_exercise.order)
+
+        removed_count = 0
+        if removed_ids:
+            removed_count = TemplateExercise.objects.filter(
+                id__in=removed_ids, template=template
+            ).delete()[0]
+        if to_update:
+            TemplateExercise.objects.bulk_update(
+                to_update,
+                ["sets_data", "weight_unit", "rest_time", "notes", "order", "total_sets"],
+            )
+        if to_create:
+            TemplateExercise.objects.bulk_create(to_create)
+
+        return {
+            "updated_count": len(to_update),
+            "added_count": len(to_create),
+            "removed_count": removed_count,
+            "updated_exercises": [te.exercise.name for te in to_update],
+            "added_exercises": [te.exercise.name for te in to_create],
+            "removed_exercises": list(removed_ids),
+        }
 
-                # Store update info for response
-                instance._update_info = {
-                    "updated_count": len(updated_exercises),
-                    "added_count": len(added_exercises),
-                    "removed_count": removed_count,
-                    "updated_exercises": [te.exercise.name for te in updated_exercises],
-                    "added_exercises": [te.exercise.name for te in added_exercises],
-                    "removed_exercises": list(exercises_to_remove),
-                }
+    @staticmethod
+    def _get_or_create_exercises(exercises_data):
+        """
+        Resolve exercise payloads to Exercise rows by name, creating any
+        missing ones, in a fixed number of queries.
 
-        return instance
+        Returns:
+            dict: stripped name -> Exercise
+        """
+        payload_by_name = {}
+        for exercise_data in exercises_data:
+            payload_by_name.setdefault(exercise_data["name"].strip(), exercise_data)
 
-    def _create_template_exercise(self, template, exercise, exercise_data):
-        """Helper method to create a new template exercise"""
-        # Get the next order number
-        max_order = (
-            TemplateExercise.objects.filter(template=template).aggregate(
-                max_order=models.Max("order")
-            )["max_order"]
-            or -1
+        exercises_by_name = Exercise.objects.in_bulk(
+            list(payload_by_name), field_name="name"
         )
 
-        return TemplateExercise.objects.create(
-            template=template,
-            exercise=exercise,
-            sets_data=exercise_data.get("sets_data", []),
-            weight_unit=exercise_data.get("weight_unit", "kg"),
-            rest_time=exercise_data.get("rest_time"),
-            notes=exercise_data.get("notes", ""),
-            order=exercise_data.get("order", max_order + 1),
-        )
+        missing = [name for name in payload_by_name if name not in exercises_by_name]
+        if missing:
+            Exercise.objects.bulk_create(
+                [
+                    Exercise(
+                        name=name,
+                        type=payload_by_name[name].get("type", ""),
+                        muscle=payload_by_name[name].get("muscle", ""),
+                        equipment=payload_by_name[name].get("equipment", ""),
+                        difficulty=payload_by_name[name].get("difficulty", ""),
+                        instructions=payload_by_name[name].get("instructions", ""),
+                    )
+                    for name in missing
+                ],
+                ignore_conflicts=True,
+            )
+            # ignore_conflicts leaves pks unset; read the rows back
+            exercises_by_name.update(
+                Exercise.objects.in_bulk(missing, field_name="name")
+            )
+
+        return exercises_by_name
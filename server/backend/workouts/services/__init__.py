@@ -0,0 +1,5 @@
+from .progression_service import ProgressionService
+from .exercise_catalog import ExerciseCatalogService
+from .workout_stats_service import WorkoutStatsService
+
+__all__ = ["ProgressionService", "ExerciseCatalogService", "WorkoutStatsService"]
@@ -0,0 +1,441 @@
+import logging
+import os
+import threading
+import requests
+from datetime import timedelta
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from dotenv import load_dotenv
+from accounts.models import ResourceVersion
+from ..models import Exercise, ExerciseCatalogTerm, Template
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FIELDS = ["name", "type", "muscle", "equipment", "difficulty", "instructions"]
+
+# Remote lookups are remembered for a month; the catalog rarely changes
+FETCHED_TERM_TTL = 60 * 60 * 24 * 30
+
+# A claimed lookup is not repeated by other searches for this long
+CLAIMED_TERM_TTL = 60 * 10
+
+# A search waits this long for a new term before handing it to a worker
+SEARCH_REMOTE_TIMEOUT = 3
+REMOTE_TIMEOUT = 10
+
+# Share of the query's trigrams a name must contain to count as a fuzzy match
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+# Shorter name queries (autocomplete keystrokes) are answered locally only
+MIN_REMOTE_TERM_LENGTH = 3
+
+
+class ApiNinjasExerciseClient:
+    """Thin client for the API Ninjas exercises endpoint"""
+
+    name = "api_ninjas"
+
+    def __init__(self):
+        # Only load .env in development
+        if os.getenv("RENDER") is None:
+            load_dotenv()
+
+        self.api_key = os.getenv("API_NINJAS_KEY")
+        if not self.api_key:
+            raise ValueError("API_NINJAS_KEY is not set in environment variables")
+
+        self.search_url = "https://api.api-ninjas.com/v1/exercises"
+
+    def search(self, name="", muscle="", difficulty="", timeout=REMOTE_TIMEOUT):
+        """
+        Fetch exercises matching the given filters.
+
+        Returns:
+            list: Exercise dicts with the CATALOG_FIELDS keys
+        """
+        params = {
+            key: value
+            for key, value in (
+                ("name", name),
+                ("muscle", muscle),
+                ("difficulty", difficulty),
+            )
+            if value
+        }
+        response = requests.get(
+            self.search_url,
+            headers={"X-Api-Key": self.api_key},
+            params=params,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+class StubExerciseClient:
+    """Offline client serving a small fixed catalog, for tests and local development"""
+
+    name = "stub"
+
+    # (name, type, muscle, equipment, difficulty)
+    EXERCISES = [
+        ("Barbell Bench Press", "strength", "chest", "barbell", "beginner"),
+        ("Incline Dumbbell Press", "strength", "chest", "dumbbell", "beginner"),
+        ("Push-Up", "strength", "chest", "body_only", "beginner"),
+        ("Barbell Back Squat", "strength", "quadriceps", "barbell", "intermediate"),
+        ("Goblet Squat", "strength", "quadriceps", "dumbbell", "beginner"),
+        ("Romanian Deadlift", "strength", "hamstrings", "barbell", "intermediate"),
+        ("Barbell Deadlift", "powerlifting", "lower_back", "barbell", "intermediate"),
+        ("Pull-Up", "strength", "lats", "body_only", "intermediate"),
+        ("Seated Cable Row", "strength", "middle_back", "cable", "beginner"),
+        ("Overhead Press", "strength", "shoulders", "barbell", "intermediate"),
+        ("Dumbbell Bicep Curl", "strength", "biceps", "dumbbell", "beginner"),
+        ("Triceps Pushdown", "strength", "triceps", "cable", "beginner"),
+        ("Plank", "strength", "abdominals", "body_only", "beginner"),
+        ("Standing Calf Raise", "strength", "calves", "machine", "beginner"),
+    ]
+
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, name="", muscle="", difficulty="", timeout=REMOTE_TIMEOUT):
+        self.calls += 1
+        name = name.lower()
+        results = []
+        for values in self.EXERCISES:
+            exercise = dict(zip(CATALOG_FIELDS, values))
+            if name and name not in exercise["name"].lower():
+                continue
+            if muscle and muscle != exercise["muscle"]:
+                continue
+            if difficulty and difficulty != exercise["difficulty"]:
+                continue
+            exercise["instructions"] = f"Perform {exercise['name'].lower()} with control."
+            results.append(exercise)
+        return results
+
+
+def _normalize(text):
+    return " ".join((text or "").lower().replace("-", " ").split())
+
+
+def _trigrams(text):
+    # Pad each word separately so word starts weigh as much as in pg_trgm
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ExerciseSearchIndex:
+    """
+    In-memory autocomplete index over Exercise rows.
+
+    Word prefixes give exact "starts with" hits; trigrams catch typos and
+    partial words. Built once per process and rebuilt whenever the catalog
+    version in the database changes.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.prefixes = {}  # prefix -> set of row positions
+        self.trigrams = {}  # trigram -> set of row positions
+        self.row_trigrams = []
+
+        for position, row in enumerate(rows):
+            name = _normalize(row["name"])
+            for word in name.split():
+                for end in range(1, len(word) + 1):
+                    self.prefixes.setdefault(word[:end], set()).add(position)
+
+            grams = _trigrams(name)
+            self.row_trigrams.append(grams)
+            for gram in grams:
+                self.trigrams.setdefault(gram, set()).add(position)
+
+    def _prefix_matches(self, words):
+        matches = None
+        for word in words:
+            hits = self.prefixes.get(word, set())
+            matches = hits if matches is None else matches & hits
+            if not matches:
+                return set()
+        return matches or set()
+
+    def _trigram_matches(self, query):
+        grams = _trigrams(query)
+        candidates = set()
+        for gram in grams:
+            candidates |= self.trigrams.get(gram, set())
+
+        scored = []
+        for position in candidates:
+            row_grams = self.row_trigrams[position]
+            similarity = len(grams & row_grams) / len(grams)
+            if similarity >= MIN_TRIGRAM_SIMILARITY:
+                scored.append((similarity, position))
+        return scored
+
+    def search(self, query="", muscle="", difficulty="", limit=50):
+        """
+        Return matching exercise dicts, best matches first.
+
+        Prefix matches rank above trigram matches; within each group shorter
+        names rank first.
+        """
+        query = _normalize(query)
+        muscle = muscle.lower()
+
+        def allowed(row):
+            return (not muscle or muscle in row["muscle"].lower()) and (
+                not difficulty or row["difficulty"] == difficulty
+            )
+
+        if not query:
+            return [row for row in self.rows if allowed(row)][:limit]
+
+        prefix_hits = self._prefix_matches(query.split())
+        ranked = sorted(prefix_hits, key=lambda p: (len(self.rows[p]["name"]), p))
+
+        fuzzy = sorted(
+            (
+                (-similarity, position)
+                for similarity, position in self._trigram_matches(query)
+                if position not in prefix_hits
+            )
+        )
+        ranked.extend(position for _, position in fuzzy)
+
+        results = []
+        for position in ranked:
+            row = self.rows[position]
+            if allowed(row):
+                results.append(row)
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def _build_client():
+    # Only load .env in development
+    if os.getenv("RENDER") is None:
+        load_dotenv()
+
+    backend = os.getenv("EXERCISE_CATALOG_PROVIDER", "api_ninjas").lower()
+    if backend == "stub":
+        return StubExerciseClient()
+    if backend != "api_ninjas":
+        raise ValueError(f"Unknown EXERCISE_CATALOG_PROVIDER: {backend}")
+    return ApiNinjasExerciseClient()
+
+
+class ExerciseCatalogService:
+    """
+    Serves exercise search from the local Exercise table.
+
+    The first search for a new term looks it up in the remote catalog with a
+    short timeout and upserts the results into Exercise; if that fails the
+    lookup is handed to a worker and the search reports it as pending.
+    Fetched and in-progress terms are recorded in ExerciseCatalogTerm, so
+    the remote catalog is asked once per term across all processes.
+
+    Searches are answered from the in-memory index, which is rebuilt when
+    the catalog version (row count and latest updated_at) changes, so
+    exercises written by any process or code path show up on the next search.
+    """
+
+    _client = None
+    _index = None
+    _index_version = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls):
+        if cls._client is None:
+            with cls._lock:
+                if cls._client is None:
+                    cls._client = _build_client()
+        return cls._client
+
+    @classmethod
+    def set_client(cls, client):
+        """Override the remote client (tests, management commands)"""
+        with cls._lock:
+            cls._client = client
+
+    @staticmethod
+    def _term(query, muscle, difficulty):
+        return f"{_normalize(query)}|{muscle.lower()}|{difficulty.lower()}"
+
+    @staticmethod
+    def get_catalog_version():
+        """
+        Version of the Exercise table, shared by every process.
+
+        Inserts and updates move the latest updated_at and deletes change the
+        count, so one aggregate query tells whether an index is stale.
+        """
+        version = Exercise.objects.aggregate(
+            count=Count("id"), updated=Max("updated_at")
+        )
+        return (version["count"], version["updated"])
+
+    @classmethod
+    def get_index(cls):
+        version = cls.get_catalog_version()
+        if cls._index is None or cls._index_version != version:
+            with cls._lock:
+                if cls._index is None or cls._index_version != version:
+                    rows = list(
+                        Exercise.objects.order_by("id").values("id", *CATALOG_FIELDS)
+                    )
+                    cls._index = ExerciseSearchIndex(rows)
+                    cls._index_version = version
+        return cls._index
+
+    @staticmethod
+    def upsert_exercises(exercises):
+        """
+        Insert or refresh exercises by name.
+
+        Refreshed exercises are embedded in templates, so the workouts version
+        of every account with a template using one is bumped, as the Exercise
+        post_save receiver does for single saves.
+
+        Returns:
+            int: Number of rows written
+        """
+        rows = {}
+        for data in exercises:
+            name = (data.get("name") or "").strip()[:150]
+            if not name:
+                continue
+            rows[name] = Exercise(
+                name=name,
+                type=(data.get("type") or "")[:50],
+                muscle=(data.get("muscle") or "")[:50],
+                equipment=(data.get("equipment") or "")[:100],
+                difficulty=(data.get("difficulty") or "")[:20],
+                instructions=data.get("instructions") or "",
+            )
+        if not rows:
+            return 0
+
+        Exercise.objects.bulk_create(
+            list(rows.values()),
+            update_conflicts=True,
+            unique_fields=["name"],
+            # updated_at moves the catalog version for every process's index
+            update_fields=[f for f in CATALOG_FIELDS if f != "name"]
+            + ["updated_at"],
+        )
+        ResourceVersion.bump(
+            Template.objects.filter(template_exercises__exercise__name__in=list(rows))
+            .values_list("user_id", flat=True)
+            .distinct(),
+            "workouts",
+        )
+        return len(rows)
+
+    @staticmethod
+    def _claim(term):
+        """
+        Claim a term's remote lookup.
+
+        Returns:
+            bool: True if this caller should fetch it, False if it was already
+            fetched or another search or worker is fetching it
+        """
+        now = timezone.now()
+        catalog_term, _ = ExerciseCatalogTerm.objects.get_or_create(term=term)
+        if catalog_term.fetched_at and catalog_term.fetched_at > now - timedelta(
+            seconds=FETCHED_TERM_TTL
+        ):
+            return False
+
+        # Conditional update: only one process wins an unclaimed term
+        return bool(
+            ExerciseCatalogTerm.objects.filter(pk=catalog_term.pk)
+            .filter(
+                Q(claimed_at__isnull=True)
+                | Q(claimed_at__lt=now - timedelta(seconds=CLAIMED_TERM_TTL))
+            )
+            .update(claimed_at=now)
+        )
+
+    @classmethod
+    def fetch_remote(cls, query="", muscle="", difficulty="", timeout=REMOTE_TIMEOUT):
+        """
+        Look a term up in the remote catalog and store the results.
+
+        Returns:
+            int: Number of exercises written
+        """
+        exercises = cls.get_client().search(
+            name=query, muscle=muscle, difficulty=difficulty, timeout=timeout
+        )
+        written = cls.upsert_exercises(exercises)
+        ExerciseCatalogTerm.objects.filter(
+            term=cls._term(query, muscle, difficulty)
+        ).update(fetched_at=timezone.now(), claimed_at=None)
+        return written
+
+    @classmethod
+    def _fetch_new_term(cls, query, muscle, difficulty):
+        """
+        Fetch a term the catalog hasn't seen yet.
+
+        Returns:
+            bool: True while a lookup for the term is still outstanding
+        """
+        from ..tasks import fetch_exercise_catalog_term_task
+
+        query = query.strip()
+        if query and len(query) < MIN_REMOTE_TERM_LENGTH:
+            return False
+
+        term = cls._term(query, muscle, difficulty)
+        if not cls._claim(term):
+            return not ExerciseCatalogTerm.objects.filter(
+                term=term, fetched_at__isnull=False
+            ).exists()
+
+        try:
+            cls.fetch_remote(
+                query=query,
+                muscle=muscle,
+                difficulty=difficulty,
+                timeout=SEARCH_REMOTE_TIMEOUT,
+            )
+            return False
+        except Exception as e:
+            logger.warning(f"Exercise catalog fetch failed for {term}: {e}")
+
+        try:
+            fetch_exercise_catalog_term_task.delay(query, muscle, difficulty)
+        except Exception as e:
+            # The claim expires and a later search tries again
+            logger.warning(f"Could not queue exercise catalog fetch for {term}: {e}")
+        return True
+
+    @classmethod
+    def search(cls, query="", muscle="", difficulty="", limit=50):
+        """
+        Search the exercise catalog.
+
+        Args:
+            query: Name or partial name
+            muscle: Optional muscle filter
+            difficulty: Optional difficulty filter
+            limit: Maximum number of results
+
+        Returns:
+            tuple: (list of exercise dicts (id plus CATALOG_FIELDS), whether a
+            remote lookup for the term is still pending)
+        """
+        pending = cls._fetch_new_term(query, muscle, difficulty)
+        results = cls.get_index().search(
+            query=query, muscle=muscle, difficulty=difficulty, limit=limit
+        )
+        return results, pending
@@ -0,0 +1,244 @@
+from django.db import transaction
+import logging
+from ..models import (
+    TemplateHistory,
+    TemplateHistoryExercise,
+    ExerciseProgressionPoint,
+    ExercisePersonalRecord,
+)
+from ..utils import calculate_set_stats, convert_sets
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+
+class ProgressionService:
+    """Maintains per-user exercise progression points and personal records"""
+
+    @staticmethod
+    def build_points(workout_history, performed_exercises):
+        """
+        Build unsaved progression points for one workout.
+
+        Exercises performed more than once in the same workout are merged
+        into a single point, in the unit of the first row. Rows without an
+        exercise reference are skipped.
+
+        Args:
+            workout_history: TemplateHistory instance
+            performed_exercises: Iterable of TemplateHistoryExercise instances
+
+        Returns:
+            list: Unsaved ExerciseProgressionPoint instances
+        """
+        sets_by_exercise = {}
+        units = {}
+        for performed in performed_exercises:
+            if performed.exercise_id is None:
+                continue
+            unit = units.setdefault(performed.exercise_id, performed.weight_unit)
+            sets_by_exercise.setdefault(performed.exercise_id, []).extend(
+                convert_sets(performed.performed_sets_data, performed.weight_unit, unit)
+            )
+
+        points = []
+        for exercise_id, sets_data in sets_by_exercise.items():
+            stats = calculate_set_stats(sets_data)
+
+            # Top set = heaviest set, ties broken by reps
+            top_set = max(
+                sets_data,
+                key=lambda s: (s.get("weight") or 0, s.get("reps") or 0),
+                default={},
+            )
+
+            points.append(
+                ExerciseProgressionPoint(
+                    user_id=workout_history.user_id_id,
+                    exercise_id=exercise_id,
+                    workout_history=workout_history,
+                    completed_at=workout_history.completed_at,
+                    top_set_weight=top_set.get("weight") or None,
+                    top_set_reps=top_set.get("reps") or 0,
+                    weight_unit=units[exercise_id],
+                    estimated_1rm=stats["estimated_1rm"],
+                    total_volume=stats["total_volume"],
+                    total_reps=stats["total_reps"],
+                )
+            )
+
+        return points
+
+    @staticmethod
+    def record_workout(workout_history, performed_exercises=None):
+        """
+        Incrementally add a saved workout to the progression index.
+
+        Safe to call more than once for the same workout; exercises that
+        already have a point for it are skipped.
+
+        Args:
+            workout_history: Saved TemplateHistory instance
+            performed_exercises: Its TemplateHistoryExercise rows, if already loaded
+
+        Returns:
+            dict: exercise_id -> list of record names improved by this workout
+        """
+        if performed_exercises is None:
+            performed_exercises = list(workout_history.performed_exercises.all())
+
+        points = ProgressionService.build_points(workout_history, performed_exercises)
+        if not points:
+            return {}
+
+        existing = set(
+            ExerciseProgressionPoint.objects.filter(
+                workout_history=workout_history
+            ).values_list("exercise_id", flat=True)
+        )
+        points = [p for p in points if p.exercise_id not in existing]
+        if not points:
+            return {}
+
+        user_id = workout_history.user_id_id
+
+        with transaction.atomic():
+            ExerciseProgressionPoint.objects.bulk_create(points)
+
+            records = {
+                record.exercise_id: record
+                for record in ExercisePersonalRecord.objects.select_for_update().filter(
+                    user_id=user_id,
+                    exercise_id__in=[p.exercise_id for p in points],
+                )
+            }
+            existing_records = list(records.values())
+
+            new_records = []
+            improvements = {}
+            for point in points:
+                record = records.get(point.exercise_id)
+                if record is None:
+                    record = ExercisePersonalRecord(
+                        user_id=user_id, exercise_id=point.exercise_id
+                    )
+                    new_records.append(record)
+                    records[point.exercise_id] = record
+
+                improved = record.apply_point(point)
+                if improved:
+                    improvements[point.exercise_id] = improved
+
+            ExercisePersonalRecord.objects.bulk_create(new_records)
+            ExercisePersonalRecord.objects.bulk_update(
+                existing_records,
+                [
+                    "best_weight",
+                    "best_weight_reps",
+                    "best_weight_at",
+                    "best_estimated_1rm",
+                    "best_estimated_1rm_at",
+                    "best_session_volume",
+                    "best_session_volume_at",
+                    "total_sessions",
+                    "last_performed_at",
+                ],
+            )
+
+        return improvements
+
+    @staticmethod
+    def rebuild_records(user_id, exercise_ids):
+        """
+        Recompute a user's personal records for some exercises from their
+        stored progression points, e.g. after a workout was deleted.
+        Records with no points left are removed.
+
+        Returns:
+            int: Number of records rebuilt
+        """
+        exercise_ids = set(exercise_ids)
+        if not exercise_ids:
+            return 0
+
+        records = {}
+        points = ExerciseProgressionPoint.objects.filter(
+            user_id=user_id, exercise_id__in=exercise_ids
+        ).order_by("completed_at", "id")
+        for point in points.iterator(chunk_size=BATCH_SIZE):
+            record = records.get(point.exercise_id)
+            if record is None:
+                record = ExercisePersonalRecord(
+                    user_id=user_id, exercise_id=point.exercise_id
+                )
+                records[point.exercise_id] = record
+            record.apply_point(point)
+
+        with transaction.atomic():
+            ExercisePersonalRecord.objects.filter(
+                user_id=user_id, exercise_id__in=exercise_ids
+            ).delete()
+            ExercisePersonalRecord.objects.bulk_create(list(records.values()))
+
+        return len(records)
+
+    @staticmethod
+    def rebuild_for_user(user_id):
+        """
+        Rebuild progression points and personal records for one user from
+        their full workout history.
+
+        Returns:
+            tuple: (points created, records created)
+        """
+        workouts = (
+            TemplateHistory.objects.filter(user_id=user_id)
+            .only("id", "user_id", "completed_at")
+            .order_by("completed_at", "id")
+        )
+
+        performed_by_workout = {}
+        performed_rows = TemplateHistoryExercise.objects.filter(
+            workout_history__user_id=user_id
+        ).only(
+            "id",
+            "workout_history_id",
+            "exercise_id",
+            "performed_sets_data",
+            "weight_unit",
+        )
+        for performed in performed_rows.iterator(chunk_size=BATCH_SIZE):
+            performed_by_workout.setdefault(performed.workout_history_id, []).append(
+                performed
+            )
+
+        points = []
+        records = {}
+        for workout in workouts.iterator(chunk_size=BATCH_SIZE):
+            workout_points = ProgressionService.build_points(
+                workout, performed_by_workout.get(workout.id, [])
+            )
+            for point in workout_points:
+                record = records.get(point.exercise_id)
+                if record is None:
+                    record = ExercisePersonalRecord(
+                        user_id=user_id, exercise_id=point.exercise_id
+                    )
+                    records[point.exercise_id] = record
+                record.apply_point(point)
+            points.extend(workout_points)
+
+        with transaction.atomic():
+            ExerciseProgressionPoint.objects.filter(user_id=user_id).delete()
+            ExercisePersonalRecord.objects.filter(user_id=user_id).delete()
+            ExerciseProgressionPoint.objects.bulk_create(points, batch_size=BATCH_SIZE)
+            ExercisePersonalRecord.objects.bulk_create(
+                list(records.values()), batch_size=BATCH_SIZE
+            )
+
+        logger.info(
+            f"Rebuilt progression for user {user_id}: "
+            f"{len(points)} points, {len(records)} records"
+        )
+        return len(points), len(records)
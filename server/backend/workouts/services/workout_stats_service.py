@@ -0,0 +1,128 @@
+from datetime import timedelta
+import logging
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from ..models import TemplateHistory, WorkoutStats, WorkoutDailyStats
+
+logger = logging.getLogger(__name__)
+
+EMPTY_STATS = {
+    "total_workouts": 0,
+    "total_exercises_performed": 0,
+    "total_sets_performed": 0,
+    "total_time_minutes": 0,
+    "average_workout_duration": 0,
+    "workouts_this_week": 0,
+    "workouts_this_month": 0,
+}
+
+
+def _window_workouts(days, today):
+    """Subquery summing a user's daily buckets over the last `days` days"""
+    return Coalesce(
+        Subquery(
+            WorkoutDailyStats.objects.filter(
+                user_id=OuterRef("user_id"),
+                date__gt=today - timedelta(days=days),
+            )
+            .values("user_id")
+            .annotate(total=Sum("workouts"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+class WorkoutStatsService:
+    """Reads and repairs the denormalized per-user workout counters"""
+
+    @staticmethod
+    def get_stats(user):
+        """
+        Return the workout_stats payload for a user in a single query.
+
+        The week and month windows cover the last 7 and 30 local calendar
+        days, today included.
+        """
+        today = timezone.localdate()
+        stats = (
+            WorkoutStats.objects.filter(user_id=user.id)
+            .annotate(
+                workouts_this_week=_window_workouts(7, today),
+                workouts_this_month=_window_workouts(30, today),
+            )
+            .first()
+        )
+
+        if stats is None or stats.total_workouts == 0:
+            return dict(EMPTY_STATS)
+
+        total_seconds = stats.total_duration.total_seconds()
+
+        return {
+            "total_workouts": stats.total_workouts,
+            "total_exercises_performed": stats.total_exercises,
+            "total_sets_performed": stats.total_sets,
+            "total_time_minutes": int(total_seconds / 60),
+            "average_workout_duration": int(
+                total_seconds / stats.total_workouts / 60
+            ),
+            "workouts_this_week": stats.workouts_this_week,
+            "workouts_this_month": stats.workouts_this_month,
+        }
+
+    @staticmethod
+    def rebuild_for_user(user_id):
+        """
+        Recompute a user's counters and daily buckets from their full history.
+
+        Returns:
+            tuple: (total workouts, daily buckets written)
+        """
+        history = TemplateHistory.objects.filter(user_id=user_id).order_by()
+
+        totals = history.aggregate(
+            workouts=Count("id"),
+            exercises=Sum("total_exercises"),
+            sets=Sum("total_sets"),
+            duration=Sum("total_duration"),
+        )
+        buckets = [
+            WorkoutDailyStats(
+                user_id=user_id,
+                date=row["date"],
+                workouts=row["workouts"],
+                exercises=row["exercises"] or 0,
+                sets=row["sets"] or 0,
+                duration=row["duration"] or timedelta(),
+            )
+            for row in history.annotate(date=TruncDate("completed_at"))
+            .values("date")
+            .annotate(
+                workouts=Count("id"),
+                exercises=Sum("total_exercises"),
+                sets=Sum("total_sets"),
+                duration=Sum("total_duration"),
+            )
+        ]
+
+        with transaction.atomic():
+            WorkoutDailyStats.objects.filter(user_id=user_id).delete()
+            WorkoutDailyStats.objects.bulk_create(buckets)
+            WorkoutStats.objects.update_or_create(
+                user_id=user_id,
+                defaults={
+                    "total_workouts": totals["workouts"],
+                    "total_exercises": totals["exercises"] or 0,
+                    "total_sets": totals["sets"] or 0,
+                    "total_duration": totals["duration"] or timedelta(),
+                },
+            )
+
+        logger.info(
+            f"Rebuilt workout stats for user {user_id}: "
+            f"{totals['workouts']} workouts, {len(buckets)} days"
+        )
+        return totals["workouts"], len(buckets)
@@ -0,0 +1,38 @@
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name="workouts.tasks.fetch_exercise_catalog_term_task",
+    bind=True,
+    ignore_result=True,
+    max_retries=2,
+)
+def fetch_exercise_catalog_term_task(self, query="", muscle="", difficulty=""):
+    """
+    Celery task to fetch a search term from the remote exercise catalog.
+
+    Queued by ExerciseCatalogService.search when the lookup for a new term
+    times out or fails inside the request; the results reach every process's
+    search index through the catalog version.
+
+    Args:
+        query: Name or partial name
+        muscle: Optional muscle filter
+        difficulty: Optional difficulty filter
+    """
+    from .services import ExerciseCatalogService
+
+    try:
+        written = ExerciseCatalogService.fetch_remote(
+            query=query, muscle=muscle, difficulty=difficulty
+        )
+        logger.info(
+            f"[TASK] Exercise catalog fetch for '{query}' wrote {written} exercise(s)"
+        )
+
+    except Exception as e:
+        logger.warning(f"[TASK] Exercise catalog fetch for '{query}' failed: {str(e)}")
+        raise self.retry(exc=e, countdown=60)
@@ -4,6 +4,7 @@ from .views import (
     ExerciseViewSet,
     TemplateExerciseViewSet,
     TemplateHistoryViewSet,
+    ProgressionViewSet,
 )
 
 router = DefaultRouter()
@@ -13,5 +14,6 @@ router.register(
     r"template-exercises", TemplateExerciseViewSet, basename="template-exercise"
 )
 router.register(r"history", TemplateHistoryViewSet, basename="template-history")
+router.register(r"progression", ProgressionViewSet, basename="progression")
 
 urlpatterns = router.urls
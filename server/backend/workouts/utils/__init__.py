@@ -0,0 +1,10 @@
+from .set_stats import calculate_set_stats, convert_sets, to_kg
+from .cursor import encode_cursor, decode_cursor
+
+__all__ = [
+    "calculate_set_stats",
+    "convert_sets",
+    "to_kg",
+    "encode_cursor",
+    "decode_cursor",
+]
@@ -0,0 +1,32 @@
+import base64
+from django.utils.dateparse import parse_datetime
+
+
+def encode_cursor(completed_at, pk):
+    """Encode a (completed_at, id) keyset position as an opaque cursor"""
+    raw = f"{completed_at.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        tuple: (completed_at datetime, id int)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        completed_at_raw, pk_raw = raw.rsplit("|", 1)
+        completed_at = parse_datetime(completed_at_raw)
+        pk = int(pk_raw)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if completed_at is None:
+        raise ValueError("Invalid cursor")
+
+    return completed_at, pk
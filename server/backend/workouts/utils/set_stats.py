@@ -0,0 +1,70 @@
+def calculate_set_stats(sets_data):
+    """
+    Compute summary statistics for a list of performed sets.
+
+    Args:
+        sets_data: List of {"reps": int|None, "weight": float|None} dicts
+
+    Returns:
+        dict: total_volume, total_reps, max_weight and estimated_1rm.
+        max_weight and estimated_1rm are None when no set carries weight.
+    """
+    total_volume = 0
+    total_reps = 0
+    max_weight = None
+    estimated_1rm = None
+
+    for set_data in sets_data or []:
+        reps = set_data.get("reps", 0) or 0
+        weight = set_data.get("weight", 0) or 0
+
+        total_volume += reps * weight
+        total_reps += reps
+
+        if weight > 0:
+            if max_weight is None or weight > max_weight:
+                max_weight = weight
+
+            # Epley formula; a single rep is the lift itself
+            if reps > 0:
+                set_1rm = weight if reps == 1 else weight * (1 + reps / 30)
+                if estimated_1rm is None or set_1rm > estimated_1rm:
+                    estimated_1rm = set_1rm
+
+    return {
+        "total_volume": round(total_volume, 2),
+        "total_reps": total_reps,
+        "max_weight": max_weight,
+        "estimated_1rm": (
+            round(estimated_1rm, 2) if estimated_1rm is not None else None
+        ),
+    }
+
+
+# Exact by definition of the international pound
+KG_PER_LB = 0.45359237
+
+
+def to_kg(weight, unit):
+    """
+    Convert a weight in the given unit ("kg" or "lbs") to kilograms.
+
+    None stays None, so missing weights compare as before.
+    """
+    if weight is None or unit != "lbs":
+        return weight
+    return weight * KG_PER_LB
+
+
+def convert_sets(sets_data, from_unit, to_unit):
+    """Return sets_data with each set's weight converted between units"""
+    if from_unit == to_unit:
+        return list(sets_data or [])
+
+    factor = KG_PER_LB if from_unit == "lbs" else 1 / KG_PER_LB
+    return [
+        {**set_data, "weight": set_data["weight"] * factor}
+        if set_data.get("weight")
+        else set_data
+        for set_data in sets_data or []
+    ]
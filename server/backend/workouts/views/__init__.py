@@ -8,6 +8,10 @@ from .exercise import (
     ExerciseViewSet,
 )
 
+from .progression import (
+    ProgressionViewSet,
+)
+
 
 __all__ = [
     # Template
@@ -16,4 +20,6 @@ __all__ = [
     "TemplateHistoryViewSet",
     # Exercise
     "ExerciseViewSet",
+    # Progression
+    "ProgressionViewSet",
 ]
@@ -1,9 +1,11 @@
-from rest_framework import viewsets
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control, patch_vary_headers
 from ..models import Exercise
+from ..services import ExerciseCatalogService
 from ..serializers import (
     ExerciseSerializer,
 )
@@ -24,22 +26,36 @@ class ExerciseViewSet(viewsets.ModelViewSet):
     def search(self, request):
         """
         Search exercises by name or muscle
-        URL: /workouts/exercises/search/?q=push&muscle=chest
-        if ninja api is down use this as the fall back
+        URL: /workouts/exercises/search/?q=push&muscle=chest&difficulty=beginner
+
+        New terms are fetched from API Ninjas once and stored in the Exercise
+        table; results are always served from the local catalog index. If
+        that fetch is still running in the background, the response carries
+        X-Catalog-Pending: true and must not be cached.
         """
         query = request.query_params.get("q", "")
         muscle = request.query_params.get("muscle", "")
         difficulty = request.query_params.get("difficulty", "")
 
-        exercises = self.get_queryset()
-
-        if query:
-            exercises = exercises.filter(name__icontains=query)
-        if muscle:
-            exercises = exercises.filter(muscle__icontains=muscle)
-        if difficulty:
-            exercises = exercises.filter(difficulty=difficulty)
-
-        exercises = exercises[:50]  # Limit results
-        serializer = self.get_serializer(exercises, many=True)
-        return Response(serializer.data)
+        try:
+            limit = min(max(int(request.query_params.get("limit", 50)), 1), 50)
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        exercises, pending = ExerciseCatalogService.search(
+            query=query, muscle=muscle, difficulty=difficulty, limit=limit
+        )
+
+        response = Response(exercises)
+        if pending:
+            # Incomplete until the remote lookup lands; the client polls
+            response["X-Catalog-Pending"] = "true"
+            patch_cache_control(response, no_store=True)
+        else:
+            # Catalog entries are shared and rarely change
+            patch_cache_control(response, private=True, max_age=300)
+        patch_vary_headers(response, ["Authorization"])
+        return response
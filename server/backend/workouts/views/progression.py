@@ -0,0 +1,56 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.utils.dateparse import parse_date
+from ..models import ExerciseProgressionPoint, ExercisePersonalRecord
+from ..serializers import (
+    ExercisePersonalRecordSerializer,
+    ExerciseProgressionPointSerializer,
+)
+
+
+class ProgressionViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for personal records and per-exercise progression charts
+    Read-only because records are maintained when workouts are saved
+    """
+
+    serializer_class = ExercisePersonalRecordSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "exercise_id"
+    lookup_value_regex = r"\d+"
+
+    def get_queryset(self):
+        return ExercisePersonalRecord.objects.filter(
+            user=self.request.user
+        ).select_related("exercise")
+
+    @action(detail=True, methods=["get"])
+    def chart(self, request, exercise_id=None):
+        """
+        Get the session-by-session progression of one exercise
+        URL: /workouts/progression/{exercise_id}/chart/
+
+        Query params:
+        - since: Only include sessions on or after this date (YYYY-MM-DD)
+        - until: Only include sessions on or before this date (YYYY-MM-DD)
+        """
+        points = ExerciseProgressionPoint.objects.filter(
+            user=request.user, exercise_id=exercise_id
+        ).order_by("completed_at")
+
+        for param, lookup in (("since", "gte"), ("until", "lte")):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            parsed = parse_date(value)
+            if parsed is None:
+                return Response(
+                    {"error": f"Invalid {param} date. Use YYYY-MM-DD format."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            points = points.filter(**{f"completed_at__date__{lookup}": parsed})
+
+        serializer = ExerciseProgressionPointSerializer(points, many=True)
+        return Response({"exercise_id": int(exercise_id), "points": serializer.data})
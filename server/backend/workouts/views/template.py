@@ -5,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Q, prefetch_related_objects
 from ..models import (
     Template,
     TemplateExercise,
@@ -20,9 +21,16 @@ from ..serializers import (
     UpdateTemplateWithExercisesSerializer,
     SetManagementSerializer,
     TemplateHistorySerializer,
+    TemplateHistoryListSerializer,
     TemplateHistoryExerciseSerializer,
     SaveCompletedWorkoutSerializer,
 )
+from ..services import ProgressionService, WorkoutStatsService
+from ..utils import encode_cursor, decode_cursor
+from backend.conditional import resource_etag
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class TemplateViewSet(viewsets.ModelViewSet):
@@ -64,6 +72,16 @@ class TemplateViewSet(viewsets.ModelViewSet):
             return UpdateTemplateWithExercisesSerializer
         return self.serializer_class
 
+    @resource_etag("workouts")
+    def list(self, request, *args, **kwargs):
+        """List the user's templates (304 when unchanged)"""
+        return super().list(request, *args, **kwargs)
+
+    @resource_etag("workouts")
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve a template with its exercises (304 when unchanged)"""
+        return super().retrieve(request, *args, **kwargs)
+
     # Create template and assign user id as foreign key
     def perform_create(self, serializer):
         serializer.save(user_id=self.request.user)
@@ -118,7 +136,7 @@ class TemplateViewSet(viewsets.ModelViewSet):
                             "updated_exercises": update_info["updated_exercises"],
                             "added_exercises": update_info["added_exercises"],
                             "removed_exercises": update_info["removed_exercises"],
-                            "total_exercises": updated_template.template_exercises.count(),
+                            "total_exercises": template_with_exercises.template_exercises.count(),
                         },
                     },
                     status=status.HTTP_200_OK,
@@ -353,12 +371,37 @@ class TemplateViewSet(viewsets.ModelViewSet):
             try:
                 workout_history = serializer.save()
 
+                # Load related rows once for both the PR update and the response
+                prefetch_related_objects(
+                    [workout_history],
+                    "performed_exercises__exercise",
+                    "original_template__template_exercises__exercise",
+                )
+
+                # Update personal records and progression charts incrementally.
+                # The workout is already saved, so a failure here must not turn
+                # into an error response (a retry would save it twice); the
+                # index can be rebuilt with the backfill_progression command.
+                try:
+                    improvements = ProgressionService.record_workout(
+                        workout_history, workout_history.performed_exercises.all()
+                    )
+                except Exception:
+                    logger.exception(
+                        f"Progression update failed for workout {workout_history.id}"
+                    )
+                    improvements = {}
+
                 # Return the created workout history with all related data
                 response_serializer = TemplateHistorySerializer(workout_history)
 
                 return Response(
                     {
                         "workout_history": response_serializer.data,
+                        "new_personal_records": [
+                            {"exercise_id": exercise_id, "records": records}
+                            for exercise_id, records in improvements.items()
+                        ],
                         "message": f"Workout '{workout_history.template_title}' saved to history successfully",
                     },
                     status=status.HTTP_201_CREATED,
@@ -374,46 +417,69 @@ class TemplateViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def workout_history(self, request):
         """
-        Get user's workout history
+        Get user's workout history, newest first, with keyset pagination
         URL: /workouts/templates/workout_history/
 
         Query params:
-        - limit: Number of workouts to return (default: 20)
-        - offset: Pagination offset (default: 0)
+        - limit: Number of workouts to return (default: 20, max: 100)
+        - cursor: next_cursor from the previous page (optional)
         - template_id: Filter by specific template (optional)
+
+        Each page costs the same regardless of depth. Per-set data is not
+        included; fetch it per workout from /workouts/history/{id}/exercises/
         """
-        # Get query parameters
-        limit = int(request.query_params.get("limit", 20))
-        offset = int(request.query_params.get("offset", 0))
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        cursor = request.query_params.get("cursor")
         template_id = request.query_params.get("template_id")
 
-        # Build queryset
-        queryset = (
-            TemplateHistory.objects.filter(user_id=request.user)
-            .prefetch_related("performed_exercises__exercise", "original_template")
-            .order_by("-completed_at")
+        # Build queryset; ordering matches the (user_id, completed_at, id) index
+        queryset = TemplateHistory.objects.filter(user_id=request.user).order_by(
+            "-completed_at", "-id"
         )
 
         # Filter by template if specified
         if template_id:
             queryset = queryset.filter(original_template_id=template_id)
 
-        # Apply pagination
-        total_count = queryset.count()
-        workouts = queryset[offset : offset + limit]
+        # Seek past the last row of the previous page
+        if cursor:
+            try:
+                completed_at, last_id = decode_cursor(cursor)
+            except ValueError:
+                return Response(
+                    {"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST
+                )
+            queryset = queryset.filter(
+                Q(completed_at__lt=completed_at)
+                | Q(completed_at=completed_at, id__lt=last_id)
+            )
+
+        # Fetch one extra row to know whether there is a next page
+        workouts = list(queryset[: limit + 1])
+        has_next = len(workouts) > limit
+        workouts = workouts[:limit]
+
+        next_cursor = None
+        if has_next:
+            last = workouts[-1]
+            next_cursor = encode_cursor(last.completed_at, last.id)
 
         # Serialize the data
-        serializer = TemplateHistorySerializer(workouts, many=True)
+        serializer = TemplateHistoryListSerializer(workouts, many=True)
 
         return Response(
             {
                 "workouts": serializer.data,
                 "pagination": {
-                    "total_count": total_count,
                     "limit": limit,
-                    "offset": offset,
-                    "has_next": offset + limit < total_count,
-                    "has_previous": offset > 0,
+                    "next_cursor": next_cursor,
+                    "has_next": has_next,
                 },
             }
         )
@@ -425,69 +491,10 @@ class TemplateViewSet(viewsets.ModelViewSet):
         URL: /workouts/templates/workout_stats/
 
         Returns overall workout statistics like total workouts,
-        total time worked out, etc.
+        total time worked out, etc. Read from the per-user counters
+        maintained as workouts are saved and deleted.
         """
-        from django.db.models import Sum, Count, Avg
-        from django.utils import timezone
-        from datetime import timedelta
-
-        user_workouts = TemplateHistory.objects.filter(user_id=request.user)
-
-        # Basic stats
-        total_workouts = user_workouts.count()
-
-        if total_workouts == 0:
-            return Response(
-                {
-                    "total_workouts": 0,
-                    "total_exercises_performed": 0,
-                    "total_sets_performed": 0,
-                    "total_time_minutes": 0,
-                    "average_workout_duration": 0,
-                    "workouts_this_week": 0,
-                    "workouts_this_month": 0,
-                }
-            )
-
-        # Aggregate stats
-        stats = user_workouts.aggregate(
-            total_exercises=Sum("total_exercises"),
-            total_sets=Sum("total_sets"),
-            avg_duration=Avg("total_duration"),
-        )
-
-        # Calculate total workout time in minutes
-        total_duration = user_workouts.aggregate(total=Sum("total_duration"))["total"]
-        total_minutes = (
-            int(total_duration.total_seconds() / 60) if total_duration else 0
-        )
-
-        # Time-based filters
-        now = timezone.now()
-        week_start = now - timedelta(days=7)
-        month_start = now - timedelta(days=30)
-
-        workouts_this_week = user_workouts.filter(completed_at__gte=week_start).count()
-        workouts_this_month = user_workouts.filter(
-            completed_at__gte=month_start
-        ).count()
-
-        # Average workout duration in minutes
-        avg_duration_minutes = 0
-        if stats["avg_duration"]:
-            avg_duration_minutes = int(stats["avg_duration"].total_seconds() / 60)
-
-        return Response(
-            {
-                "total_workouts": total_workouts,
-                "total_exercises_performed": stats["total_exercises"] or 0,
-                "total_sets_performed": stats["total_sets"] or 0,
-                "total_time_minutes": total_minutes,
-                "average_workout_duration": avg_duration_minutes,
-                "workouts_this_week": workouts_this_week,
-                "workouts_this_month": workouts_this_month,
-            }
-        )
+        return Response(WorkoutStatsService.get_stats(request.user))
 
 
 class TemplateExerciseViewSet(viewsets.ModelViewSet):